@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 테스터 통합 CLI
+- health: 서버 상태 확인 (배포 파이프라인 readiness probe용)
+- smoke: 비인증 CRUD 엔드포인트 점검 (test_crud_apis)
+- auth-crud: 로그인 후 CRUD 플로우 1회 (test_authenticated_crud 단일 실행)
+- load: 가상 사용자 부하 테스트 (test_authenticated_crud --users)
+- soak: 장시간 부하 + 구간별 p95 / 데이터셋 크기 / 메모리 추적 (test_authenticated_crud --users --soak)
+
+하위 명령에 필요한 모듈은 그 명령을 실행할 때만 불러옴
+health는 requests / asyncio / http.client를 불러오지 않고 소켓으로 GET 1회만 보내 인터프리터 시작 직후 바로 끝남
+
+사용법:
+    python api_tester.py health --url http://localhost:3001
+    python api_tester.py smoke --mock
+    python api_tester.py auth-crud --min-pass-rate 1.0
+    python api_tester.py load --users 50 --duration 60
+    python api_tester.py soak --users 20 --duration 14400 --server-pid 12345
+    python api_tester.py load --help   # 하위 명령 옵션
+"""
+
+import sys
+import time
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+# test_crud_apis / test_authenticated_crud의 BASE_URL과 같은 기본값
+DEFAULT_URL = "http://localhost:3001"
+DEFAULT_HEALTH_TIMEOUT = 2.0
+DEFAULT_LOAD_USERS = 10
+
+COMMANDS = {
+    "health": "서버 상태 확인 (GET 1회, 2xx / 3xx면 정상)",
+    "smoke": "비인증 CRUD 엔드포인트 점검 (401 응답 확인)",
+    "auth-crud": "로그인 후 CRUD 플로우 1회 실행",
+    "load": "가상 사용자 부하 테스트",
+    "soak": "장시간 부하 테스트 (구간별 p95 / 메모리 / 데이터셋 크기, p95 상승 추세 판정)",
+}
+
+
+def log(message: str, level: str = "INFO"):
+    """로그 출력"""
+    timestamp = time.strftime("%H:%M:%S")
+    print(f"[{timestamp}] {level}: {message}")
+
+
+def probe(url: str, timeout: float = DEFAULT_HEALTH_TIMEOUT) -> Tuple[Optional[int], float, Optional[str]]:
+    """
+    GET 1회 후 (상태코드, 소요 시간(초), 에러 메시지) 반환, 응답 본문은 읽지 않음
+    http.client / requests 대신 소켓으로 상태 줄만 읽음 (https일 때만 ssl을 불러옴)
+    """
+    import socket
+
+    parts = urlsplit(url)
+    secure = parts.scheme == "https"
+    host = parts.hostname or "localhost"
+    port = parts.port or (443 if secure else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+    started = time.perf_counter()
+    try:
+        sock = socket.create_connection((host, port), timeout=timeout)
+        if secure:
+            import ssl
+
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=host)
+        with sock:
+            request = (f"GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+                       f"User-Agent: EduCanvas-API-Tester/1.0\r\nConnection: close\r\n\r\n")
+            sock.sendall(request.encode("ascii"))
+            status_line = sock.makefile("rb").readline(1024).decode("latin-1")
+    except OSError as e:
+        return None, time.perf_counter() - started, str(e) or e.__class__.__name__
+    fields = status_line.split()
+    if len(fields) < 2 or not fields[0].startswith("HTTP/") or not fields[1].isdigit():
+        return None, time.perf_counter() - started, f"HTTP 응답이 아닙니다: {status_line.strip()[:80]!r}"
+    return int(fields[1]), time.perf_counter() - started, None
+
+
+def run_health(argv) -> bool:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="api_tester.py health", description=COMMANDS["health"])
+    parser.add_argument("--url", default=DEFAULT_URL, help="서버 주소 (경로 포함 가능)")
+    parser.add_argument("--path", default=None, help="확인할 경로 (--url의 경로 대신 사용)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_HEALTH_TIMEOUT, help="연결 / 응답 타임아웃(초)")
+    args = parser.parse_args(argv)
+
+    url = args.url.rstrip("/") + args.path if args.path else args.url
+    status, elapsed, error = probe(url, args.timeout)
+    if status is None:
+        log(f"서버 응답 없음: {url} ({error}, {elapsed * 1000:.1f}ms)", "ERROR")
+        return False
+    if status >= 400:
+        log(f"서버 비정상: GET {url} -> {status} ({elapsed * 1000:.1f}ms)", "ERROR")
+        return False
+    log(f"서버 정상: GET {url} -> {status} ({elapsed * 1000:.1f}ms)")
+    return True
+
+
+def run_smoke(argv) -> bool:
+    import test_crud_apis
+
+    return test_crud_apis.main(test_crud_apis.parse_args(argv, prog="api_tester.py smoke"))
+
+
+def run_auth_crud(argv) -> bool:
+    import test_authenticated_crud
+
+    args = test_authenticated_crud.parse_args(argv, prog="api_tester.py auth-crud")
+    if args.users > 0:
+        print("ERROR: auth-crud는 단일 실행입니다 (부하 테스트는 api_tester.py load)")
+        exit(2)
+    return test_authenticated_crud.main(args)
+
+
+def run_load(argv) -> bool:
+    import test_authenticated_crud
+
+    args = test_authenticated_crud.parse_args(argv, prog="api_tester.py load")
+    if args.users <= 0:
+        args.users = DEFAULT_LOAD_USERS
+    return test_authenticated_crud.main(args)
+
+
+def run_soak(argv) -> bool:
+    import test_authenticated_crud
+
+    args = test_authenticated_crud.parse_args(argv, prog="api_tester.py soak")
+    args.soak = True
+    if args.users <= 0:
+        args.users = DEFAULT_LOAD_USERS
+    return test_authenticated_crud.main(args)
+
+
+RUNNERS = {
+    "health": run_health,
+    "smoke": run_smoke,
+    "auth-crud": run_auth_crud,
+    "load": run_load,
+    "soak": run_soak,
+}
+
+
+def usage() -> str:
+    lines = ["사용법: api_tester.py <명령> [옵션...]", "", "명령:"]
+    lines += [f"  {name:<10} {description}" for name, description in COMMANDS.items()]
+    lines += ["", "명령별 옵션은 api_tester.py <명령> --help"]
+    return "\n".join(lines)
+
+
+def main(argv=None) -> bool:
+    # argparse 서브파서는 하위 명령 옵션을 정의하려고 모든 모듈을 불러와야 하므로 명령 이름만 직접 확인
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        exit(0 if argv else 2)
+    command, rest = argv[0], argv[1:]
+    if command not in RUNNERS:
+        print(f"ERROR: 알 수 없는 명령: {command}\n")
+        print(usage())
+        exit(2)
+    return RUNNERS[command](rest)
+
+
+if __name__ == "__main__":
+    exit(0 if main() else 1)
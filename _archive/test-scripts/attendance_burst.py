@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+EduCanvas 출결 체크인 버스트 벤치마크
+정시 수업 시작처럼 여러 클래스의 출석 체크를 몇 초 안에 몰아서 보내고 다음을 측정
+- 학생별 개별 체크인(POST /api/student-attendance)과 클래스별 벌크(POST /api/student-attendance/bulk)의 처리량 / 꼬리 지연
+- 버스트 중 출결 현황 조회(GET /api/student-attendance/classes-today) 응답 시간
+- 강사 출근 체크인(POST /api/attendance/check-in, --accounts 지정 시 계정별 1회)
+- 버스트 후 출석 기록을 다시 조회해 중복 / 누락 행 검출 (일부 학생은 두 번 연속 전송해 중복 체크 경합 재현)
+
+응답 시간은 open_loop.py와 같이 예정 발사 시각부터 측정 (coordinated omission 보정)
+
+사용법:
+    python seed_data.py --profile medium --manifest seed_manifest.json
+    python attendance_burst.py --manifest seed_manifest.json --spread 5 --concurrency 200
+"""
+
+import datetime
+import json
+import queue
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from buffered_log import LOGGER
+from load_metrics import LatencyHistogram, LoadMetrics, route_key
+
+CHECK_IN_ENDPOINT = "/api/student-attendance"
+BULK_ENDPOINT = "/api/student-attendance/bulk"
+CLASSES_TODAY_ENDPOINT = "/api/student-attendance/classes-today"
+STAFF_CHECK_IN_ENDPOINT = "/api/attendance/check-in"
+
+PHASES = ["individual", "bulk", "staff"]
+DEFAULT_CONCURRENCY = 200
+DEFAULT_SPREAD_SECONDS = 5.0
+DEFAULT_READERS = 4
+# 같은 체크인을 연달아 두 번 보내는 학생(클래스) 비율 (중복 탭 재현)
+DEFAULT_DOUBLE_SUBMIT_RATIO = 0.05
+# 출석 기록 조회 API의 페이지 크기 상한
+VERIFY_PAGE_SIZE = 100
+
+
+def load_roster(path: str, max_classes: Optional[int] = None,
+                max_students: Optional[int] = None) -> Dict[str, List[str]]:
+    """seed_data.py manifest에서 클래스별 학생 명단 구성"""
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    assignments = manifest.get("assignments")
+    if not assignments:
+        raise ValueError("manifest에 학생-클래스 배정(assignments)이 없습니다. seed_data.py로 다시 생성하세요")
+    roster: Dict[str, List[str]] = {}
+    for student_id, class_id in sorted(assignments.items()):
+        roster.setdefault(class_id, []).append(student_id)
+    class_ids = sorted(roster)[:max_classes] if max_classes else sorted(roster)
+    return {class_id: roster[class_id][:max_students] if max_students else roster[class_id]
+            for class_id in class_ids}
+
+
+def extract_rows(response: Dict) -> List[Dict]:
+    """출석 기록 조회 응답에서 행 목록 추출 (data.items / data.items.data / data 형태 모두 지원)"""
+    data = response.get("data")
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        items = data.get("items")
+        if isinstance(items, dict):
+            items = items.get("data")
+        if isinstance(items, list):
+            return items
+        if isinstance(data.get("data"), list):
+            return data["data"]
+    return []
+
+
+class BurstRequest:
+    """버스트 요청 1건 (covers: 이 요청으로 출석 처리되는 학생 ID 목록)"""
+
+    def __init__(self, method: str, endpoint: str, body: Dict = None, covers: List[str] = None,
+                 class_id: str = None, headers: Dict = None):
+        self.method = method
+        self.endpoint = endpoint
+        self.body = body
+        self.covers = covers or []
+        self.class_id = class_id
+        self.headers = headers
+
+
+class AttendanceBurst:
+    def __init__(self, tester, tester_factory: Callable, concurrency: int = DEFAULT_CONCURRENCY,
+                 spread: float = DEFAULT_SPREAD_SECONDS, readers: int = DEFAULT_READERS,
+                 double_submit_ratio: float = DEFAULT_DOUBLE_SUBMIT_RATIO, seed: int = 42):
+        """
+        tester: 로그인된 테스터 (워커 / 조회 테스터들이 토큰을 공유)
+        spread: 전체 요청을 고르게 흩뿌리는 시간(초), concurrency: 동시 요청 워커 수
+        readers: 버스트 동안 출결 현황을 반복 조회하는 스레드 수
+        """
+        self.tester = tester
+        self.tester_factory = tester_factory
+        self.concurrency = concurrency
+        self.spread = spread
+        self.readers = readers
+        self.double_submit_ratio = double_submit_ratio
+        self.random = random.Random(seed)
+        self.results: List[Dict] = []
+        self.checked_in: Dict[str, Set[str]] = {}  # 단계별 성공 응답을 받은 학생 ID (verify에서 사용)
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def _clone(self, metrics: LoadMetrics):
+        worker = self.tester_factory()
+        worker.verbose = False
+        worker.metrics = metrics
+        worker.set_access_token(self.tester.access_token)
+        worker.tenant_id = self.tester.tenant_id
+        return worker
+
+    def individual_requests(self, roster: Dict[str, List[str]], date: str) -> List[BurstRequest]:
+        """학생마다 개별 체크인 1건 (일부 학생은 연달아 2건)"""
+        requests = []
+        for class_id, student_ids in roster.items():
+            for student_id in student_ids:
+                body = {"student_id": student_id, "class_id": class_id, "attendance_date": date,
+                        "status": "present", "check_in_time": datetime.datetime.now().isoformat()}
+                request = BurstRequest("POST", CHECK_IN_ENDPOINT, body, [student_id], class_id)
+                requests.append(request)
+                if self.random.random() < self.double_submit_ratio:
+                    requests.append(request)
+        return requests
+
+    def bulk_requests(self, roster: Dict[str, List[str]], date: str) -> List[BurstRequest]:
+        """클래스마다 벌크 체크인 1건 (일부 클래스는 연달아 2건)"""
+        requests = []
+        for class_id, student_ids in roster.items():
+            body = {"class_id": class_id, "attendance_date": date,
+                    "updates": [{"student_id": student_id, "status": "present"} for student_id in student_ids]}
+            request = BurstRequest("POST", BULK_ENDPOINT, body, list(student_ids), class_id)
+            requests.append(request)
+            if self.random.random() < self.double_submit_ratio:
+                requests.append(request)
+        return requests
+
+    def staff_requests(self, credentials: List) -> List[BurstRequest]:
+        """강사 계정마다 출근 체크인 1건 (계정별 토큰을 호출별 헤더로 전달)"""
+        return [
+            BurstRequest("POST", STAFF_CHECK_IN_ENDPOINT,
+                         {"location": {"latitude": 37.5665, "longitude": 126.9780}, "notes": "버스트 벤치마크"},
+                         headers={"Authorization": f"Bearer {credential.access_token}"})
+            for credential in credentials
+        ]
+
+    def _worker(self, tester, pending: "queue.Queue", outcomes: List, latency: LatencyHistogram,
+                lock: threading.Lock):
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            index, intended, request = item
+            response = tester.test_api_endpoint(request.method, request.endpoint, request.body,
+                                                headers=request.headers)
+            status = tester.last_call["status"]
+            finished = time.perf_counter()
+            with lock:
+                latency.record_seconds(finished - intended)
+                outcomes[index] = (status, response, finished)
+
+    def _reader(self, tester, date: str, stop: threading.Event):
+        endpoint = f"{CLASSES_TODAY_ENDPOINT}?date={date}"
+        while not stop.is_set():
+            tester.test_api_endpoint("GET", endpoint)
+
+    def burst(self, phase: str, requests: List[BurstRequest], date: str) -> Dict:
+        """requests를 spread초에 고르게 흩뿌려 발사하고, 동시에 출결 현황 조회 부하를 건다"""
+        service = LoadMetrics()
+        latency = LatencyHistogram()
+        lock = threading.Lock()
+        outcomes: List = [None] * len(requests)
+        pending: "queue.Queue" = queue.Queue()
+        stop_readers = threading.Event()
+
+        workers = [
+            threading.Thread(target=self._worker, name=f"burst-{i}", daemon=True,
+                             args=(self._clone(service), pending, outcomes, latency, lock))
+            for i in range(min(self.concurrency, len(requests)) or 1)
+        ]
+        readers = [
+            threading.Thread(target=self._reader, name=f"reader-{i}", daemon=True,
+                             args=(self._clone(service), date, stop_readers))
+            for i in range(self.readers)
+        ]
+        for thread in workers + readers:
+            thread.start()
+
+        self.log(f"=== {phase}: 요청 {len(requests)}건을 {self.spread:g}초 동안 발사 (워커 {len(workers)}, 조회 {self.readers}) ===")
+        service.start()
+        started = time.perf_counter()
+        interval = self.spread / len(requests) if requests else 0.0
+        for index, request in enumerate(requests):
+            intended = started + index * interval
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pending.put((index, intended, request))
+        for _ in workers:
+            pending.put(None)
+        for thread in workers:
+            thread.join()
+        stop_readers.set()
+        for thread in readers:
+            thread.join()
+        service.stop()
+
+        finished = max((outcome[2] for outcome in outcomes if outcome), default=started)
+        elapsed = max(finished - started, 1e-9)
+        ok = [request for request, outcome in zip(requests, outcomes) if outcome and 200 <= (outcome[0] or 0) < 300]
+        reader_stats = service.endpoints.get(route_key("GET", CLASSES_TODAY_ENDPOINT))
+        endpoint_stats = service.endpoints.get(route_key(requests[0].method, requests[0].endpoint)) if requests else None
+        result = {
+            "phase": phase,
+            "date": date,
+            "requests": len(requests),
+            "ok": len(ok),
+            "errors": len(requests) - len(ok),
+            "elapsed_s": elapsed,
+            "requests_per_s": len(ok) / elapsed,
+            "rows_sent_per_s": sum(len(request.covers) for request in ok) / elapsed,
+            "p50_ms": latency.percentile(50) / 1000,
+            "p95_ms": latency.percentile(95) / 1000,
+            "p99_ms": latency.percentile(99) / 1000,
+            "max_ms": (latency.max or 0) / 1000,
+            "service_p99_ms": endpoint_stats.latency.percentile(99) / 1000 if endpoint_stats else 0.0,
+            "reader_requests": reader_stats.requests if reader_stats else 0,
+            "reader_p50_ms": reader_stats.latency.percentile(50) / 1000 if reader_stats else 0.0,
+            "reader_p99_ms": reader_stats.latency.percentile(99) / 1000 if reader_stats else 0.0,
+        }
+        self.checked_in[phase] = self._checked_in(requests, outcomes)
+        self.results.append(result)
+        return result
+
+    def _checked_in(self, requests: List[BurstRequest], outcomes: List) -> Set[str]:
+        """2xx로 응답받은 (학생 ID) 집합, 벌크 응답의 학생별 실패(data.errors)는 제외"""
+        students = set()
+        for request, outcome in zip(requests, outcomes):
+            if not outcome or not 200 <= (outcome[0] or 0) < 300:
+                continue
+            data = outcome[1].get("data") if isinstance(outcome[1].get("data"), dict) else {}
+            failed = {error.get("student_id") for error in data.get("errors") or [] if isinstance(error, dict)}
+            students.update(student_id for student_id in request.covers if student_id not in failed)
+        return students
+
+    def verify(self, result: Dict, roster: Dict[str, List[str]]):
+        """버스트 후 클래스별 출석 기록을 조회해 중복 행 / 누락(성공 응답을 받았는데 행이 없음) 학생 집계"""
+        rows_per_student: Dict[str, int] = {}
+        unreadable = 0
+        for class_id in roster:
+            page = 1
+            while True:
+                response = self.tester.test_api_endpoint(
+                    "GET", f"{CHECK_IN_ENDPOINT}?class_id={class_id}&attendance_date={result['date']}"
+                           f"&limit={VERIFY_PAGE_SIZE}&page={page}")
+                if "error" in response:
+                    unreadable += 1
+                    break
+                rows = extract_rows(response)
+                for row in rows:
+                    student_id = row.get("student_id")
+                    rows_per_student[student_id] = rows_per_student.get(student_id, 0) + 1
+                if len(rows) < VERIFY_PAGE_SIZE:
+                    break
+                page += 1
+
+        checked_in = self.checked_in.get(result["phase"], set())
+        duplicates = {student_id: count for student_id, count in rows_per_student.items() if count > 1}
+        lost = sorted(checked_in - set(rows_per_student))
+        result["rows"] = sum(rows_per_student.values())
+        result["duplicate_rows"] = sum(count - 1 for count in duplicates.values())
+        result["duplicate_students"] = sorted(duplicates)[:20]
+        result["lost"] = len(lost)
+        result["lost_students"] = lost[:20]
+        result["unverified_classes"] = unreadable
+        if duplicates or lost:
+            self.log(f"   {result['phase']}: 중복 행 {result['duplicate_rows']}건 / 누락 {len(lost)}명", "WARN")
+        if unreadable:
+            self.log(f"   {result['phase']}: {unreadable}개 클래스의 출석 기록을 조회하지 못했습니다", "WARN")
+
+    def format_report(self) -> str:
+        """단계별 결과 표 (P50~MAX: 예정 발사 시각 기준, READ_P99: 버스트 중 출결 현황 조회)"""
+        lines = [
+            f"{'PHASE':<11} {'REQS':>6} {'OK':>6} {'ERR':>5} {'SECONDS':>8} {'REQ/S':>8} {'ROWS/S':>8} "
+            f"{'P50':>8} {'P95':>8} {'P99':>8} {'MAX':>8} {'READ_P99':>8} {'ROWS':>6} {'DUP':>5} {'LOST':>5}",
+            "-" * 121,
+        ]
+        for r in self.results:
+            rows = f"{r['rows']:>6} {r['duplicate_rows']:>5} {r['lost']:>5}" if "rows" in r else f"{'-':>6} {'-':>5} {'-':>5}"
+            lines.append(
+                f"{r['phase']:<11} {r['requests']:>6} {r['ok']:>6} {r['errors']:>5} {r['elapsed_s']:>8.2f} "
+                f"{r['requests_per_s']:>8.1f} {r['rows_sent_per_s']:>8.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+                f"{r['p99_ms']:>8.1f} {r['max_ms']:>8.1f} {r['reader_p99_ms']:>8.1f} {rows}"
+            )
+        return "\n".join(lines)
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EduCanvas 출결 체크인 버스트 벤치마크")
+    parser.add_argument("--manifest", default="seed_manifest.json", help="seed_data.py가 만든 manifest 경로")
+    parser.add_argument("--phases", default="individual,bulk", help=f"실행할 단계 (쉼표 구분: {', '.join(PHASES)})")
+    parser.add_argument("--classes", type=int, default=None, help="사용할 클래스 수 (기본: 전체)")
+    parser.add_argument("--students-per-class", type=int, default=None, help="클래스당 학생 수 상한")
+    parser.add_argument("--spread", type=float, default=DEFAULT_SPREAD_SECONDS, help="요청을 흩뿌리는 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 요청 워커 수")
+    parser.add_argument("--readers", type=int, default=DEFAULT_READERS, help="버스트 중 출결 현황 조회 스레드 수")
+    parser.add_argument("--double-submit-ratio", type=float, default=DEFAULT_DOUBLE_SUBMIT_RATIO,
+                        help="같은 체크인을 두 번 보내는 비율 (0~1)")
+    parser.add_argument("--date", default=None, help="개별 체크인 출석일 YYYY-MM-DD (기본: 오늘)")
+    parser.add_argument("--bulk-date", default=None,
+                        help="벌크 체크인 출석일 (기본: --date 다음 날, 개별 단계 기록과 겹치지 않도록)")
+    parser.add_argument("--accounts", default=None, help="강사 출근 체크인(staff 단계)에 사용할 계정 파일")
+    parser.add_argument("--seed", type=int, default=42, help="중복 전송 대상 선택 난수 시드")
+    parser.add_argument("--results", default=None, help="단계별 결과 저장 경로 (.json)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    import functools
+
+    from test_authenticated_crud import AuthenticatedCRUDTester
+
+    args = parse_args()
+    phases = [phase.strip() for phase in args.phases.split(",") if phase.strip()]
+    unknown = [phase for phase in phases if phase not in PHASES]
+    if unknown:
+        print(f"ERROR: 알 수 없는 단계: {', '.join(unknown)}")
+        exit(2)
+    try:
+        roster = load_roster(args.manifest, args.classes, args.students_per_class)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: 명단을 읽을 수 없습니다: {e}")
+        exit(2)
+    date = args.date or datetime.date.today().isoformat()
+    bulk_date = args.bulk_date or (datetime.date.fromisoformat(date) + datetime.timedelta(days=1)).isoformat()
+
+    tester = AuthenticatedCRUDTester(verbose=False)
+    if not tester.login():
+        exit(1)
+    benchmark = AttendanceBurst(tester, functools.partial(AuthenticatedCRUDTester, verbose=False),
+                                concurrency=args.concurrency, spread=args.spread, readers=args.readers,
+                                double_submit_ratio=args.double_submit_ratio, seed=args.seed)
+    benchmark.log(f"명단: 클래스 {len(roster)}개, 학생 {sum(len(ids) for ids in roster.values())}명")
+
+    if "individual" in phases:
+        result = benchmark.burst("individual", benchmark.individual_requests(roster, date), date)
+        benchmark.verify(result, roster)
+    if "bulk" in phases:
+        result = benchmark.burst("bulk", benchmark.bulk_requests(roster, bulk_date), bulk_date)
+        benchmark.verify(result, roster)
+    if "staff" in phases:
+        if not args.accounts:
+            benchmark.log("staff 단계에는 --accounts가 필요해 건너뜁니다", "WARN")
+        else:
+            from credential_pool import CredentialPool, load_accounts
+
+            pool = CredentialPool(load_accounts(args.accounts), functools.partial(AuthenticatedCRUDTester, verbose=False))
+            if pool.login_all():
+                benchmark.burst("staff", benchmark.staff_requests(pool.active), date)
+
+    LOGGER.write(benchmark.format_report())
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(benchmark.results, f, ensure_ascii=False, indent=2)
+    clean = all(result.get("duplicate_rows", 0) == 0 and result.get("lost", 0) == 0 for result in benchmark.results)
+    exit(0 if clean else 1)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 벤치마크 결과 저장 / 기준선 비교
+- ResultsWriter: 요청별 결과(엔드포인트, 상태코드, 응답 시간, 페이로드 크기)와 라우트별 요약을 JSON / JSONL로 기록
+- compare: 저장된 기준선과 현재 실행 결과의 라우트별 p95를 비교해 임계치 이상 느려지면 실패 (배포 전 성능 게이트)
+  기준선에 있던 라우트가 현재 실행에 없으면(엔드포인트 제거 / 전부 실패) 역시 실패
+  --metric rps면 라우트별 / 전체 처리량이 임계치 이상 줄어들면 실패 (대역 서버로 테스터 자체 처리량 회귀 확인)
+
+사용법:
+    python bench_results.py compare baseline.jsonl current.jsonl --threshold 10
+    python bench_results.py compare baseline.jsonl current.jsonl --metric rps --threshold 15
+"""
+
+import json
+import math
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+SUMMARY_VERSION = 1
+DEFAULT_THRESHOLD_PERCENT = 10.0
+# 값이 클수록 좋은 지표 (감소가 회귀)
+HIGHER_IS_BETTER = {"rps"}
+TOTAL_ROUTE = "TOTAL"
+
+
+def summarize_metrics(metrics) -> Dict[str, Dict]:
+    """LoadMetrics를 라우트별 요약 dict로 변환 (키: "METHOD /route")"""
+    routes = {}
+    elapsed = metrics.elapsed
+    for (method, route), stats in sorted(metrics.endpoints.items()):
+        histogram = stats.latency
+        routes[f"{method} {route}"] = {
+            "count": stats.requests,
+            "rps": round(stats.requests / elapsed, 2) if elapsed else 0.0,
+            "errors": stats.errors,
+            "error_rate": round(stats.error_rate, 4),
+            "bytes": stats.bytes_total,
+            "wire_bytes": stats.wire_bytes_total,
+            "min_ms": (histogram.min or 0) / 1000,
+            "p50_ms": histogram.percentile(50) / 1000,
+            "p95_ms": histogram.percentile(95) / 1000,
+            "p99_ms": histogram.percentile(99) / 1000,
+            "max_ms": (histogram.max or 0) / 1000,
+        }
+    return routes
+
+
+class ResultsWriter:
+    """
+    벤치마크 실행 결과 기록기
+    경로가 .jsonl이면 요청마다 한 줄씩 바로 기록하고, 그 외(.json)에는 종료 시 한 문서로 기록
+    """
+
+    def __init__(self, path: str, meta: Dict = None):
+        self.path = path
+        self.jsonl = path.endswith(".jsonl")
+        self.meta = {
+            "version": SUMMARY_VERSION,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "argv": sys.argv[1:],
+        }
+        if meta:
+            self.meta.update(meta)
+        self._lock = threading.Lock()
+        self._requests: List[Dict] = []
+        self._file = None
+        if self.jsonl:
+            self._file = open(path, "w", encoding="utf-8")
+            self._write_line({"type": "meta", **self.meta})
+
+    def _write_line(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def write_request(self, method: str, route: str, endpoint: str, status_code: Optional[int],
+                      latency: Optional[float], payload_bytes: Optional[int],
+                      wire_bytes: Optional[int] = None, ttfb: Optional[float] = None):
+        """요청 1건 기록 (latency / ttfb: 초, payload_bytes: 압축 해제 후 크기, wire_bytes: 전송 크기)"""
+        record = {
+            "type": "request",
+            "ts": round(time.time(), 3),
+            "method": method.upper(),
+            "route": route,
+            "endpoint": endpoint,
+            "status": status_code,
+            "latency_ms": round(latency * 1000, 3) if latency is not None else None,
+            "bytes": payload_bytes,
+            "wire_bytes": wire_bytes,
+            "ttfb_ms": round(ttfb * 1000, 3) if ttfb is not None else None,
+        }
+        with self._lock:
+            if self.jsonl:
+                self._write_line(record)
+            else:
+                self._requests.append(record)
+
+    def close(self, metrics, extra: Dict = None):
+        """라우트별 요약을 기록하고 파일을 닫음"""
+        summary = {"type": "summary", "elapsed_s": round(metrics.elapsed, 3), "routes": summarize_metrics(metrics)}
+        if extra:
+            summary.update(extra)
+        with self._lock:
+            if self.jsonl:
+                self._write_line(summary)
+                self._file.close()
+            else:
+                document = {"meta": self.meta, "summary": summary, "requests": self._requests}
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(document, f, ensure_ascii=False, indent=2)
+
+
+def load_summary(path: str) -> Dict[str, Dict]:
+    """결과 파일(.json / .jsonl)에서 라우트별 요약을 읽음"""
+    if path.endswith(".jsonl"):
+        summary = None
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if record.get("type") == "summary":
+                    summary = record
+        if summary is None:
+            raise ValueError(f"요약(summary) 레코드가 없습니다: {path}")
+        return summary["routes"]
+
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    return document["summary"]["routes"]
+
+
+def compare_summaries(baseline: Dict[str, Dict], current: Dict[str, Dict],
+                      threshold_percent: float = DEFAULT_THRESHOLD_PERCENT,
+                      metric: str = "p95_ms", min_count: int = 1) -> Tuple[List[Dict], List[str]]:
+    """
+    라우트별 지표 비교 (rps는 전체 합계 행도 비교)
+    반환: (비교 행 목록, 임계치를 넘어 나빠졌거나 현재 실행에서 사라진 라우트 목록)
+    기준선 값이 0이면 비율 대신 현재 값이 나빠졌는지(지연 > 0, rps < 0)로만 판정 (변화율 ±inf)
+    """
+    rows = []
+    regressions = []
+    higher_is_better = metric in HIGHER_IS_BETTER
+    if higher_is_better:
+        baseline = with_total(baseline, metric)
+        current = with_total(current, metric)
+    for route in sorted(set(baseline) | set(current)):
+        base = baseline.get(route)
+        cur = current.get(route)
+        row = {"route": route, "baseline": None, "current": None, "change_percent": None, "status": "ok"}
+        if base is None:
+            row["current"] = cur.get(metric)
+            row["status"] = "new"
+        elif cur is None:
+            row["baseline"] = base.get(metric)
+            if base.get("count", 0) < min_count:
+                row["status"] = "skipped"
+            else:
+                row["status"] = "MISSING"
+                regressions.append(route)
+        elif base.get(metric) is None or cur.get(metric) is None:
+            row["status"] = "skipped"  # 지표 추가 전에 저장된 결과
+        else:
+            row["baseline"] = base[metric]
+            row["current"] = cur[metric]
+            if base[metric] > 0:
+                row["change_percent"] = (cur[metric] - base[metric]) / base[metric] * 100
+            elif cur[metric] == base[metric]:
+                row["change_percent"] = 0.0
+            else:
+                row["change_percent"] = math.copysign(math.inf, cur[metric] - base[metric])
+            worse = -row["change_percent"] if higher_is_better else row["change_percent"]
+            if cur.get("count", 0) < min_count:
+                row["status"] = "skipped"
+            elif worse > threshold_percent:
+                row["status"] = "REGRESSED"
+                regressions.append(route)
+        rows.append(row)
+    return rows, regressions
+
+
+def with_total(routes: Dict[str, Dict], metric: str) -> Dict[str, Dict]:
+    """라우트별 요약에 전체 합계 행 추가 (합산 가능한 지표만)"""
+    if not routes or any(route.get(metric) is None for route in routes.values()):
+        return routes
+    total = {
+        "count": sum(route["count"] for route in routes.values()),
+        metric: round(sum(route[metric] for route in routes.values()), 2),
+    }
+    return {**routes, TOTAL_ROUTE: total}
+
+
+def format_comparison(rows: List[Dict], metric: str) -> str:
+    """비교 결과 표"""
+    lines = [
+        f"{'ROUTE':<48} {'BASE ' + metric:>14} {'CURR ' + metric:>14} {'CHANGE':>9}  STATUS",
+        "-" * 97,
+    ]
+    for row in rows:
+        base = f"{row['baseline']:.1f}" if row["baseline"] is not None else "-"
+        cur = f"{row['current']:.1f}" if row["current"] is not None else "-"
+        change = f"{row['change_percent']:+.1f}%" if row["change_percent"] is not None else "-"
+        lines.append(f"{row['route']:<48} {base:>14} {cur:>14} {change:>9}  {row['status']}")
+    return "\n".join(lines)
+
+
+def compare_command(args) -> int:
+    """기준선 비교 실행: 0 = 통과, 1 = 성능 저하 또는 라우트 누락"""
+    baseline = load_summary(args.baseline)
+    current = load_summary(args.current)
+    rows, regressions = compare_summaries(baseline, current, args.threshold, args.metric, args.min_count)
+    print(format_comparison(rows, args.metric))
+    print()
+    statuses = {row["route"]: row["status"] for row in rows}
+    missing = [route for route in regressions if statuses[route] == "MISSING"]
+    regressed = [route for route in regressions if statuses[route] == "REGRESSED"]
+    if missing:
+        print(f"❌ 기준선에 있던 {len(missing)}개 라우트가 현재 실행에 없습니다: {', '.join(missing)}")
+    if regressed:
+        change = "줄었습니다" if args.metric in HIGHER_IS_BETTER else "느려졌습니다"
+        print(f"❌ {len(regressed)}개 라우트의 {args.metric}가 기준선 대비 {args.threshold:g}% 이상 {change}")
+    if regressions:
+        return 1
+    print(f"✅ 모든 라우트가 기준선 대비 {args.threshold:g}% 이내입니다")
+    return 0
+
+
+def add_compare_arguments(parser):
+    parser.add_argument("baseline", help="기준선 결과 파일 (.json / .jsonl)")
+    parser.add_argument("current", help="현재 실행 결과 파일 (.json / .jsonl)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PERCENT,
+                        help="허용 변화율(%%), 초과해 나빠지면 실패")
+    parser.add_argument("--metric", default="p95_ms", choices=["p50_ms", "p95_ms", "p99_ms", "max_ms", "rps"],
+                        help="비교할 지표 (rps는 감소를 회귀로 판정)")
+    parser.add_argument("--min-count", type=int, default=1,
+                        help="이보다 적게 호출된 라우트는 판정에서 제외")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EduCanvas API 벤치마크 결과 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    add_compare_arguments(subparsers.add_parser("compare", help="기준선 대비 라우트별 성능 비교"))
+    args = parser.parse_args()
+
+    try:
+        exit(compare_command(args))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"ERROR: 결과 파일을 읽을 수 없습니다: {e}")
+        exit(2)
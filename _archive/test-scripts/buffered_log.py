@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 테스터용 버퍼 로거
+요청마다 print + strftime을 하면 초당 수천 요청에서 로그 출력이 병목이 되므로
+- 호출 스레드는 (시각, 레벨, 메시지)를 큐에 넣기만 하고, 백그라운드 스레드가 모아서 한 번에 출력
+- 타임스탬프 문자열은 초 단위로 캐시
+- 요청 단위 INFO 줄(sampled=True)은 초당 줄 수를 제한하고 생략한 줄 수를 주기적으로 출력 (WARN / ERROR는 생략하지 않음)
+- 터미널이면 현재 RPS / 에러 수 / p95 등 상태 줄을 초당 몇 번씩 같은 줄에 갱신
+
+사용:
+    from buffered_log import LOGGER
+    LOGGER.log("메시지", "WARN")
+    LOGGER.write(table)   # 표 등 여러 줄 텍스트를 로그 순서대로 출력
+    LOGGER.flush()        # 큐에 쌓인 로그를 모두 출력할 때까지 대기
+"""
+
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+# 요청 단위 INFO 줄의 초당 최대 출력 수 (0이면 제한 없음)
+DEFAULT_INFO_RATE = 50
+# 출력 주기(초) / 상태 줄 갱신 주기(초)
+FLUSH_INTERVAL = 0.05
+STATUS_INTERVAL = 0.25
+# 한 번에 모아 쓰는 최대 항목 수
+MAX_BATCH = 2000
+FLUSH_TIMEOUT = 5.0
+_CLEAR_LINE = "\r\033[K"
+
+
+class BufferedLogger:
+    def __init__(self, level: str = "INFO", info_rate: float = DEFAULT_INFO_RATE, stream=None):
+        """stream: 출력 대상 (None이면 출력 시점의 sys.stdout)"""
+        self.min_level = LEVELS[level]
+        self.info_rate = info_rate
+        self.stream = stream
+        self.suppressed = 0
+        self._tokens = float(info_rate)
+        self._refilled = time.monotonic()
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._status: Optional[Callable[[], str]] = None
+        self._status_shown = False
+        self._status_text = ""
+        self._status_at = 0.0
+        self._suppressed_at = time.monotonic()
+        self._cached_second = -1
+        self._cached_timestamp = ""
+
+    def configure(self, level: str = None, info_rate: float = None):
+        """CLI 옵션으로 레벨 / 초당 INFO 줄 수 변경"""
+        if level is not None:
+            self.min_level = LEVELS[level]
+        if info_rate is not None:
+            self.info_rate = info_rate
+            self._tokens = float(info_rate)
+
+    def enabled(self, level: str) -> bool:
+        return LEVELS.get(level, LEVELS["INFO"]) >= self.min_level
+
+    def _take_token(self) -> bool:
+        """초당 info_rate줄 토큰 버킷 (최대 1초분까지 누적)"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.info_rate, self._tokens + (now - self._refilled) * self.info_rate)
+            self._refilled = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.suppressed += 1
+            return False
+
+    def _ensure_thread(self):
+        # fork된 워커 프로세스에는 출력 스레드가 없으므로 프로세스마다 새로 시작
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.SimpleQueue()
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._pid = os.getpid()
+            self._thread.start()
+
+    def log(self, message: str, level: str = "INFO", sampled: bool = False):
+        """
+        로그 1줄을 큐에 넣음 (출력은 백그라운드 스레드)
+        sampled: 요청 단위 INFO 줄 - 초당 info_rate줄을 넘으면 생략
+        """
+        if not self.enabled(level):
+            return
+        if sampled and level == "INFO" and self.info_rate and not self._take_token():
+            return
+        self._ensure_thread()
+        self._queue.put((time.time(), level, message))
+
+    def write(self, text: str):
+        """여러 줄 텍스트(표 등)를 로그와 같은 순서로 출력"""
+        self._ensure_thread()
+        self._queue.put((None, None, text))
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT):
+        """지금까지 넣은 로그가 모두 출력될 때까지 대기"""
+        if self._pid != os.getpid():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def set_status(self, provider: Optional[Callable[[], str]]):
+        """
+        상태 줄 제공 함수 설정 (None이면 해제), 터미널 출력일 때만 STATUS_INTERVAL마다 같은 줄에 갱신
+        해제 시 마지막 상태 줄은 지우고 큐를 비움
+        """
+        self._status = provider
+        self._status_text = ""
+        self._status_at = 0.0
+        if provider is not None:
+            self._ensure_thread()
+        else:
+            self.flush()
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_timestamp = time.strftime("%H:%M:%S", time.localtime(created))
+        return self._cached_timestamp
+
+    def _run(self):
+        while True:
+            wait = STATUS_INTERVAL if self._status is not None else FLUSH_INTERVAL
+            try:
+                items = [self._queue.get(timeout=wait)]
+            except queue.Empty:
+                items = []
+            while items and len(items) < MAX_BATCH:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(items)
+
+    def _write_batch(self, items):
+        stream = self.stream or sys.stdout
+        lines = []
+        markers = []
+        for item in items:
+            if isinstance(item, threading.Event):
+                markers.append(item)
+            elif item[0] is None:
+                lines.append(item[2])
+            else:
+                lines.append(f"[{self._timestamp(item[0])}] {item[1]}: {item[2]}")
+        now = time.monotonic()
+        if self.suppressed and now - self._suppressed_at >= 1.0:
+            with self._lock:
+                count, self.suppressed = self.suppressed, 0
+            self._suppressed_at = now
+            lines.append(f"[{self._timestamp(time.time())}] INFO: 요청 로그 {count}줄 생략 (초당 {self.info_rate:g}줄 제한)")
+
+        status = self._status
+        live = status is not None and getattr(stream, "isatty", lambda: False)()
+        out = []
+        if lines:
+            if self._status_shown:
+                out.append(_CLEAR_LINE)
+                self._status_shown = False
+            out.append("\n".join(lines) + "\n")
+        if live and now - self._status_at >= STATUS_INTERVAL:
+            try:
+                self._status_text = status()
+            except Exception as e:
+                self._status_text = f"(상태 줄 오류: {e})"
+            self._status_at = now
+        if live and self._status_text and (lines or not self._status_shown or self._status_at == now):
+            # 로그 줄을 쓰느라 지운 상태 줄은 마지막 값으로 다시 그림 (갱신은 STATUS_INTERVAL마다)
+            out.append(f"{_CLEAR_LINE}{self._status_text}")
+            self._status_shown = True
+        elif status is None and self._status_shown:
+            out.append(_CLEAR_LINE)
+            self._status_shown = False
+        if out:
+            try:
+                stream.write("".join(out))
+                stream.flush()
+            except (OSError, ValueError):
+                pass  # 종료 중 닫힌 stdout
+        for marker in markers:
+            marker.set()
+
+
+# 프로세스 공용 로거 (테스터 / 실행기가 함께 사용)
+LOGGER = BufferedLogger()
+atexit.register(LOGGER.flush)
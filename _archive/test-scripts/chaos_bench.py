@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 장애 주입(chaos) 벤치마크
+서버가 429 / 5xx를 돌려줄 때 클라이언트 재시도가 서버로 가는 트래픽을 얼마나 키우는지(재시도 증폭) 측정
+프런트엔드 클라이언트에 재시도 정책을 넣기 전에 장애를 키우는 정책인지 확인하는 용도
+
+대역 서버(mock_server)에 에러 비율 / 상태코드를 주입하고, 같은 부하(가상 사용자 CRUD 플로우)를 재시도 정책별로 실행
+- 증폭률: 서버가 실제로 받은 요청 수 / 호출자가 보낸 원 요청 수 (1.0이면 재시도 트래픽 없음)
+- 호출자 체감 에러율 / 성공 처리량 / p95(재시도 대기 포함)
+
+재시도 정책:
+- none: 재시도 없음
+- transport: 기존 세션 자동 재시도 (urllib3, 502/503/504 멱등 메서드, 고정 배수 백오프)
+- backoff: 지터 지수 백오프 + 재시도 예산
+- unbudgeted: 지터 지수 백오프, 예산 없음 (예산의 효과 비교용)
+- breaker: backoff + 엔드포인트별 서킷 브레이커
+
+사용법:
+    python chaos_bench.py --statuses 429,503 --error-rates 0,0.1,0.3 --users 20 --duration 5
+    python chaos_bench.py --policies backoff,unbudgeted --error-rates 0.5 --retries 5
+"""
+
+from typing import Dict, List
+
+from buffered_log import LOGGER
+from load_runner import LoadRunner
+from mock_server import MockApiServer
+from resilience import DEFAULT_BREAKER_COOLDOWN, DEFAULT_RETRY_BUDGET, Resilience
+
+CHAOS_POLICIES = ["none", "transport", "backoff", "unbudgeted", "breaker"]
+DEFAULT_POLICIES = "none,transport,backoff,breaker"
+DEFAULT_STATUSES = "429,503"
+DEFAULT_ERROR_RATES = "0,0.1,0.3"
+DEFAULT_RETRIES = 3
+DEFAULT_BREAKER_FAILURES = 5
+# 이 증폭률을 넘는 정책은 장애를 키우는 것으로 판정
+DEFAULT_MAX_AMPLIFICATION = 1.5
+
+
+class ChaosBenchmark:
+    def __init__(self, users: int = 20, duration: float = 5.0, retries: int = DEFAULT_RETRIES,
+                 retry_budget: float = DEFAULT_RETRY_BUDGET, breaker_failures: int = DEFAULT_BREAKER_FAILURES,
+                 latency_ms: float = 0.0, retry_after: float = None, seed: int = 42):
+        self.users = users
+        self.duration = duration
+        self.retries = retries
+        self.retry_budget = retry_budget
+        self.breaker_failures = breaker_failures
+        self.latency_ms = latency_ms
+        self.retry_after = retry_after
+        self.seed = seed
+        self.results: List[Dict] = []
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def _resilience(self, policy: str):
+        if policy in ("none", "transport"):
+            return None
+        return Resilience(max_retries=self.retries,
+                          retry_budget=None if policy == "unbudgeted" else self.retry_budget,
+                          breaker_failures=self.breaker_failures if policy == "breaker" else 0,
+                          breaker_cooldown=DEFAULT_BREAKER_COOLDOWN, seed=self.seed)
+
+    def run(self, status: int, error_rate: float, policy: str) -> Dict:
+        """장애 조건 1개 x 정책 1개 실행"""
+        import test_authenticated_crud
+        from test_authenticated_crud import AuthenticatedCRUDTester
+
+        mock = MockApiServer(latency_ms=self.latency_ms, error_rate=error_rate, error_status=status,
+                             retry_after=self.retry_after, seed=self.seed)
+        # 테스터는 요청마다 모듈 전역 BASE_URL을 읽으므로 대역 서버 주소로 바꿈
+        test_authenticated_crud.BASE_URL = mock.start()
+        resilience = self._resilience(policy)
+        session_retries = self.retries if policy == "transport" else 0
+
+        def tester_factory():
+            return AuthenticatedCRUDTester(verbose=False, max_retries=session_retries, resilience=resilience)
+
+        runner = LoadRunner(tester_factory, users=self.users, duration=self.duration, live=False)
+        # 실행 중에는 주입한 에러마다 찍히는 테스터 경고를 숨기고, 벤치마크 자체 로그는 실행 사이에 출력
+        min_level = LOGGER.min_level
+        LOGGER.configure(level="ERROR")
+        try:
+            runner.run(report=False)
+        finally:
+            LOGGER.min_level = min_level
+            mock.stop()
+
+        requests, errors, latency = runner.metrics.totals()
+        elapsed = runner.metrics.elapsed
+        result = {
+            "status": status,
+            "error_rate": error_rate,
+            "policy": policy,
+            "requests": requests,
+            "sent": mock.requests,
+            "injected": mock.injected_errors,
+            "amplification": mock.requests / requests if requests else 0.0,
+            "caller_error_rate": errors / requests if requests else 0.0,
+            "goodput": (requests - errors) / elapsed if elapsed else 0.0,
+            "p95_ms": latency.percentile(95) / 1000,
+            "retries": 0,
+            "budget_exhausted": 0,
+            "short_circuited": 0,
+        }
+        if resilience is not None:
+            summary = resilience.to_dict()
+            result.update(retries=summary["retries"], budget_exhausted=summary["budget_exhausted"],
+                          short_circuited=summary["short_circuited"])
+        else:
+            # 세션 자동 재시도는 횟수를 알 수 없으므로 서버 수신 수와의 차이로 계산
+            result["retries"] = max(mock.requests - requests, 0)
+        self.results.append(result)
+        self.log(f"{status} x {error_rate * 100:g}% / {policy}: 증폭 {result['amplification']:.2f}x, "
+                 f"체감 에러율 {result['caller_error_rate'] * 100:.1f}%, p95 {result['p95_ms']:.1f}ms")
+        return result
+
+    def format_report(self, max_amplification: float = DEFAULT_MAX_AMPLIFICATION) -> str:
+        """장애 조건 / 정책별 증폭률, 체감 에러율, 성공 처리량, p95 표"""
+        lines = [
+            f"{'STATUS':>6} {'ERR%':>5} {'POLICY':<11} {'REQS':>7} {'SENT':>7} {'AMP':>6} {'CALLER_ERR%':>11} "
+            f"{'GOODPUT':>8} {'P95':>8} {'RETRIES':>8} {'NO_BUDGET':>9} {'BLOCKED':>8}",
+            "-" * 106,
+        ]
+        for result in self.results:
+            flag = "  ⚠️" if result["amplification"] > max_amplification else ""
+            lines.append(
+                f"{result['status']:>6} {result['error_rate'] * 100:>4g}% {result['policy']:<11} "
+                f"{result['requests']:>7} {result['sent']:>7} {result['amplification']:>5.2f}x "
+                f"{result['caller_error_rate'] * 100:>10.1f}% {result['goodput']:>8.1f} {result['p95_ms']:>8.1f} "
+                f"{result['retries']:>8} {result['budget_exhausted']:>9} {result['short_circuited']:>8}{flag}"
+            )
+        lines.append("")
+        lines.append(f"AMP = 서버 수신 요청 / 원 요청, GOODPUT = 성공 요청/s, P95 = 재시도 대기 포함(ms), "
+                     f"⚠️ = 증폭 {max_amplification:g}x 초과")
+        return "\n".join(lines)
+
+    def amplifying(self, max_amplification: float = DEFAULT_MAX_AMPLIFICATION) -> List[Dict]:
+        return [result for result in self.results if result["amplification"] > max_amplification]
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EduCanvas API 장애 주입 재시도 증폭 벤치마크")
+    parser.add_argument("--statuses", default=DEFAULT_STATUSES, help="주입할 에러 상태코드 (쉼표 구분)")
+    parser.add_argument("--error-rates", default=DEFAULT_ERROR_RATES, help="에러 주입 비율 0 ~ 1 (쉼표 구분)")
+    parser.add_argument("--policies", default=DEFAULT_POLICIES,
+                        help=f"비교할 재시도 정책 ({', '.join(CHAOS_POLICIES)})")
+    parser.add_argument("--users", type=int, default=20, help="가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="조건 / 정책 조합당 실행 시간(초)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="원 요청당 최대 재시도 횟수")
+    parser.add_argument("--retry-budget", type=float, default=DEFAULT_RETRY_BUDGET,
+                        help="원 요청 대비 재시도 비율 상한 (backoff / breaker)")
+    parser.add_argument("--breaker", type=int, default=DEFAULT_BREAKER_FAILURES,
+                        help="breaker 정책의 서킷을 여는 연속 실패 횟수")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="대역 서버 응답 지연(ms)")
+    parser.add_argument("--retry-after", type=float, default=None, help="에러 응답에 붙일 Retry-After(초)")
+    parser.add_argument("--max-amplification", type=float, default=DEFAULT_MAX_AMPLIFICATION,
+                        help="이 증폭률을 넘는 정책이 있으면 실패")
+    parser.add_argument("--seed", type=int, default=42, help="에러 주입 / 지터 난수 시드")
+    parser.add_argument("--results", default=None, help="결과 저장 경로 (.json)")
+    return parser.parse_args()
+
+
+def main() -> bool:
+    import json
+
+    args = parse_args()
+    try:
+        statuses = [int(status) for status in args.statuses.split(",") if status.strip()]
+        error_rates = [float(rate) for rate in args.error_rates.split(",") if rate.strip()]
+    except ValueError:
+        statuses, error_rates = [], []
+    policies = [policy.strip() for policy in args.policies.split(",") if policy.strip()]
+    if (not statuses or not error_rates or not policies or [p for p in policies if p not in CHAOS_POLICIES]
+            or [rate for rate in error_rates if not 0 <= rate <= 1]):
+        print(f"ERROR: --statuses / --error-rates(0 ~ 1) / --policies({', '.join(CHAOS_POLICIES)})를 확인하세요")
+        exit(2)
+
+    benchmark = ChaosBenchmark(users=args.users, duration=args.duration, retries=args.retries,
+                               retry_budget=args.retry_budget, breaker_failures=args.breaker,
+                               latency_ms=args.latency_ms, retry_after=args.retry_after, seed=args.seed)
+    total = len(statuses) * len(error_rates) * len(policies)
+    benchmark.log(f"장애 조건 {len(statuses) * len(error_rates)}개 x 정책 {len(policies)}개 = {total}회, "
+                  f"회당 {args.duration:g}초 (가상 사용자 {args.users}명)")
+    try:
+        for status in statuses:
+            for error_rate in error_rates:
+                for policy in policies:
+                    benchmark.run(status, error_rate, policy)
+    except KeyboardInterrupt:
+        benchmark.log("중단 요청 - 지금까지의 결과를 출력합니다", "WARN")
+    LOGGER.write("")
+    LOGGER.write(benchmark.format_report(args.max_amplification))
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(benchmark.results, f, ensure_ascii=False, indent=2)
+    amplifying = benchmark.amplifying(args.max_amplification)
+    for result in amplifying:
+        benchmark.log(f"{result['status']} x {result['error_rate'] * 100:g}%에서 {result['policy']} 정책이 "
+                      f"트래픽을 {result['amplification']:.2f}배로 키웁니다", "WARN")
+    return not amplifying
+
+
+if __name__ == "__main__":
+    exit(0 if main() else 1)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 테스터 클라이언트 측 프로파일링
+처리량이 정체될 때 병목이 서버인지 Python 테스터 자신인지 구분하기 위한 계측
+- 요청 1건당 테스터가 쓴 CPU 시간 (스레드 CPU 시간: 소켓 대기는 포함되지 않으므로 순수 클라이언트 작업량)
+- 프로세스 CPU 사용률 (1.0 코어에 가까우면 GIL 포화) / 모니터 스레드 스케줄링 지연 / async 엔진 이벤트 루프 지연
+- GC 일시 정지 (gc.callbacks)
+- 선택: cProfile(모든 스레드) 또는 샘플링 프로파일러(sys._current_frames) 캡처
+클라이언트 오버헤드가 측정 지연의 일정 비율을 넘으면 경고를 결과에 포함
+"""
+
+import cProfile
+import gc
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+from buffered_log import LOGGER
+from load_metrics import LatencyHistogram
+
+CAPTURE_MODES = ["cprofile", "sample"]
+# 요청 CPU 시간 합이 측정 지연 합의 이 비율을 넘으면 경고
+DEFAULT_OVERHEAD_THRESHOLD = 0.1
+# 모니터 스레드 주기(초), 샘플링 캡처 시에는 더 촘촘하게
+DEFAULT_MONITOR_INTERVAL = 0.05
+SAMPLE_INTERVAL = 0.01
+# 경고 기준: 프로세스 CPU 사용률(코어), 스케줄링 지연 p99(ms), GC 일시 정지 합 / 실행 시간
+SATURATION_CORES = 0.9
+LAG_WARN_MS = 20.0
+GC_WARN_SHARE = 0.02
+# 샘플링 캡처에서 스택을 기록할 최대 깊이 / 리포트에 출력할 상위 항목 수
+SAMPLE_STACK_DEPTH = 40
+TOP_ENTRIES = 15
+
+
+class ClientProfiler:
+    def __init__(self, overhead_threshold: float = DEFAULT_OVERHEAD_THRESHOLD, capture: Optional[str] = None,
+                 capture_path: Optional[str] = None, loop=None):
+        """
+        capture: None / "cprofile" / "sample", capture_path: 캡처 저장 경로 (cprofile은 .prof, sample은 접힌 스택 텍스트)
+        loop: 지연을 측정할 asyncio 이벤트 루프 (http_engine.AsyncHttpEngine.loop)
+        """
+        if capture is not None and capture not in CAPTURE_MODES:
+            raise ValueError(f"지원하지 않는 캡처 방식: {capture}")
+        self.overhead_threshold = overhead_threshold
+        self.capture = capture
+        self.capture_path = capture_path or ("client_profile.prof" if capture == "cprofile" else "client_profile.txt")
+        self.loop = loop
+        self.interval = SAMPLE_INTERVAL if capture == "sample" else DEFAULT_MONITOR_INTERVAL
+
+        self.request_cpu = LatencyHistogram()
+        self.requests = 0
+        self.cpu_total = 0.0
+        self.latency_total = 0.0
+        self.scheduler_lag = LatencyHistogram()
+        self.loop_lag = LatencyHistogram()
+        self.gc_pauses = LatencyHistogram()
+        self.gc_pause_total = 0.0
+        self.gc_collections: Dict[int, int] = {}
+        self.samples: Counter = Counter()
+        self._profiles: List[cProfile.Profile] = []
+        self._gc_started: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor_thread: Optional[threading.Thread] = None
+        self._wall_started = self._cpu_started = 0.0
+        self.wall = self.process_cpu = 0.0
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def record_call(self, cpu_seconds: float, elapsed: float):
+        """요청 1건의 클라이언트 CPU 시간과 측정 지연 기록 (테스터가 요청마다 호출)"""
+        with self._lock:
+            self.requests += 1
+            self.cpu_total += cpu_seconds
+            self.latency_total += elapsed
+            self.request_cpu.record_seconds(cpu_seconds)
+
+    def _on_gc(self, phase: str, info: Dict):
+        # 수집 중에는 GIL을 잡고 있으므로 start / stop이 섞이지 않음
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+        elif self._gc_started is not None:
+            pause = time.perf_counter() - self._gc_started
+            self.gc_pauses.record_seconds(pause)
+            self.gc_pause_total += pause
+            generation = info.get("generation", -1)
+            self.gc_collections[generation] = self.gc_collections.get(generation, 0) + 1
+            self._gc_started = None
+
+    def _start_thread_profile(self, frame, event, arg):
+        # threading.setprofile 훅: 새 스레드의 첫 이벤트에서 스레드 전용 cProfile을 켬 (이후 이 훅은 대체됨)
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def _sample_stacks(self):
+        own = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            stack = []
+            while frame is not None and len(stack) < SAMPLE_STACK_DEPTH:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+
+    def _monitor(self):
+        """주기적으로 깨어나 늦게 깨어난 만큼을 스케줄링 지연으로 기록 (GIL 경합 / 스레드 포화 지표)"""
+        while not self._stop.is_set():
+            expected = time.perf_counter() + self.interval
+            time.sleep(self.interval)
+            self.scheduler_lag.record_seconds(max(time.perf_counter() - expected, 0.0))
+            if self.loop is not None and not self.loop.is_closed():
+                scheduled = time.perf_counter()
+                self.loop.call_soon_threadsafe(lambda: self.loop_lag.record_seconds(time.perf_counter() - scheduled))
+            if self.capture == "sample":
+                self._sample_stacks()
+
+    def start(self):
+        gc.callbacks.append(self._on_gc)
+        if self.capture == "cprofile":
+            threading.setprofile(self._start_thread_profile)
+            main_profile = cProfile.Profile()
+            self._profiles.append(main_profile)
+            main_profile.enable()
+        self._wall_started = time.perf_counter()
+        self._cpu_started = time.process_time()
+        self._stop.clear()
+        self._monitor_thread = threading.Thread(target=self._monitor, name="client-profiler", daemon=True)
+        self._monitor_thread.start()
+
+    def stop(self):
+        self.wall = time.perf_counter() - self._wall_started
+        self.process_cpu = time.process_time() - self._cpu_started
+        self._stop.set()
+        if self._monitor_thread is not None:
+            self._monitor_thread.join()
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self.capture == "cprofile":
+            threading.setprofile(None)
+            self._profiles[0].disable()
+        if self.capture is not None:
+            self.write_capture()
+
+    def write_capture(self):
+        """캡처 저장: cprofile은 pstats 파일(snakeviz 등으로 열람), sample은 flamegraph용 접힌 스택"""
+        if self.capture == "cprofile" and self._profiles:
+            pstats.Stats(*self._profiles).dump_stats(self.capture_path)
+        elif self.capture == "sample":
+            with open(self.capture_path, "w", encoding="utf-8") as f:
+                for stack, count in self.samples.most_common():
+                    f.write(f"{stack} {count}\n")
+        self.log(f"프로파일 캡처 저장: {self.capture_path}")
+
+    def overhead_share(self) -> float:
+        """요청 처리에 쓴 클라이언트 CPU 시간 / 측정 지연 합"""
+        return self.cpu_total / self.latency_total if self.latency_total > 0 else 0.0
+
+    def warnings(self) -> List[str]:
+        """결과를 신뢰하기 어려운 클라이언트 측 조건 목록"""
+        warnings = []
+        share = self.overhead_share()
+        if share > self.overhead_threshold:
+            warnings.append(f"클라이언트 CPU가 측정 지연의 {share * 100:.1f}% (기준 {self.overhead_threshold * 100:.0f}%) "
+                            f"- 측정값에 테스터 오버헤드가 섞여 있습니다")
+        cores = self.process_cpu / self.wall if self.wall > 0 else 0.0
+        if cores >= SATURATION_CORES:
+            warnings.append(f"테스터 프로세스 CPU {cores:.2f}코어 - GIL 포화 가능성 (--processes로 분산 권장)")
+        lag_p99 = self.scheduler_lag.percentile(99) / 1000
+        if lag_p99 > LAG_WARN_MS:
+            warnings.append(f"스레드 스케줄링 지연 p99 {lag_p99:.1f}ms - 요청 발사 / 응답 처리가 밀리고 있습니다")
+        loop_p99 = self.loop_lag.percentile(99) / 1000
+        if loop_p99 > LAG_WARN_MS:
+            warnings.append(f"이벤트 루프 지연 p99 {loop_p99:.1f}ms")
+        if self.wall > 0 and self.gc_pause_total / self.wall > GC_WARN_SHARE:
+            warnings.append(f"GC 일시 정지 합 {self.gc_pause_total * 1000:.0f}ms "
+                            f"(실행 시간의 {self.gc_pause_total / self.wall * 100:.1f}%)")
+        return warnings
+
+    def to_dict(self) -> Dict:
+        """결과 파일에 넣을 요약 (경고 포함)"""
+        return {
+            "requests": self.requests,
+            "cpu_per_request_ms": {
+                "mean": self.cpu_total / self.requests * 1000 if self.requests else 0.0,
+                "p50": self.request_cpu.percentile(50) / 1000,
+                "p99": self.request_cpu.percentile(99) / 1000,
+            },
+            "overhead_share": self.overhead_share(),
+            "wall_s": self.wall,
+            "process_cpu_s": self.process_cpu,
+            "cpu_cores": self.process_cpu / self.wall if self.wall > 0 else 0.0,
+            "scheduler_lag_ms": {"p50": self.scheduler_lag.percentile(50) / 1000,
+                                 "p99": self.scheduler_lag.percentile(99) / 1000,
+                                 "max": (self.scheduler_lag.max or 0) / 1000},
+            "loop_lag_ms": {"p99": self.loop_lag.percentile(99) / 1000,
+                            "max": (self.loop_lag.max or 0) / 1000} if self.loop is not None else None,
+            "gc": {"collections": {str(gen): count for gen, count in sorted(self.gc_collections.items())},
+                   "total_pause_ms": self.gc_pause_total * 1000,
+                   "max_pause_ms": (self.gc_pauses.max or 0) / 1000},
+            "capture": {"mode": self.capture, "path": self.capture_path} if self.capture else None,
+            "warnings": self.warnings(),
+        }
+
+    def format_report(self) -> str:
+        """클라이언트 오버헤드 요약과 (캡처한 경우) 상위 함수 / 스택"""
+        summary = self.to_dict()
+        cpu = summary["cpu_per_request_ms"]
+        lag = summary["scheduler_lag_ms"]
+        gc_summary = summary["gc"]
+        lines = [
+            f"요청 {summary['requests']}건, 요청당 클라이언트 CPU 평균 {cpu['mean']:.2f}ms (p50 {cpu['p50']:.2f}, "
+            f"p99 {cpu['p99']:.2f}), 측정 지연 대비 {summary['overhead_share'] * 100:.1f}%",
+            f"프로세스 CPU {summary['process_cpu_s']:.1f}초 / 실행 {summary['wall_s']:.1f}초 = {summary['cpu_cores']:.2f}코어, "
+            f"스케줄링 지연 p50 {lag['p50']:.1f}ms / p99 {lag['p99']:.1f}ms / max {lag['max']:.1f}ms",
+            f"GC {sum(self.gc_collections.values())}회 (세대별 {gc_summary['collections']}), "
+            f"일시 정지 합 {gc_summary['total_pause_ms']:.1f}ms, 최대 {gc_summary['max_pause_ms']:.1f}ms",
+        ]
+        if summary["loop_lag_ms"] is not None:
+            lines.append(f"이벤트 루프 지연 p99 {summary['loop_lag_ms']['p99']:.1f}ms, "
+                         f"max {summary['loop_lag_ms']['max']:.1f}ms")
+        if self.capture == "cprofile" and self._profiles:
+            out = io.StringIO()
+            pstats.Stats(*self._profiles, stream=out).sort_stats("cumulative").print_stats(TOP_ENTRIES)
+            lines.append(out.getvalue().strip())
+        elif self.capture == "sample" and self.samples:
+            total = sum(self.samples.values())
+            leaf = Counter()
+            for stack, count in self.samples.items():
+                leaf[stack.rsplit(";", 1)[-1]] += count
+            lines.append(f"샘플 {total}개 중 상위 함수 (스택 최상단 기준, 소켓 대기 포함)")
+            for name, count in leaf.most_common(TOP_ENTRIES):
+                lines.append(f"  {count / total * 100:>5.1f}%  {name}")
+        return "\n".join(lines)
+
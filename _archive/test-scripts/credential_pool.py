@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 테스터용 다중 계정 자격 증명 풀
+- 여러 테넌트 / 역할의 계정 목록(JSON 또는 CSV)을 읽어 시작 시 병렬 로그인
+- 발급된 토큰은 만료 시각과 함께 디스크에 캐시해 다음 실행에서는 로그인 없이 재사용
+- 가상 사용자에게 테넌트가 번갈아 나오도록 계정을 배정하고, 만료 전에 다시 로그인해 갱신
+
+계정 파일 예:
+    [{"email": "owner@a.com", "password": "...", "tenant_id": "...", "role": "admin"}, ...]
+    또는 CSV (헤더: email,password,tenant_id,role)
+"""
+
+import base64
+import binascii
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from buffered_log import LOGGER
+
+# 토큰이 들어 있으므로 저장소 밖 사용자별 캐시 디렉터리에 저장 ($XDG_CACHE_HOME 또는 ~/.cache)
+DEFAULT_TOKEN_CACHE = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                                   "educanvas", "tokens.json")
+DEFAULT_LOGIN_WORKERS = 16
+# 만료까지 남은 시간이 이보다 짧으면 미리 다시 로그인 (초)
+DEFAULT_REFRESH_MARGIN = 120.0
+# 토큰에서 만료 시각을 알 수 없을 때 가정하는 유효 기간 (Supabase 기본 JWT 만료와 동일, 초)
+DEFAULT_TOKEN_TTL = 3600.0
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    """JWT payload의 exp(epoch 초), JWT가 아니거나 exp가 없으면 None (서명은 검증하지 않음)"""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (ValueError, binascii.Error):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def token_expiry(access_token: str, response: Dict = None) -> float:
+    """토큰 만료 시각(epoch 초): JWT exp > 응답의 expires_at / expires_in > 기본 유효 기간 순"""
+    expiry = jwt_expiry(access_token)
+    if expiry is not None:
+        return expiry
+    response = response or {}
+    if isinstance(response.get("expires_at"), (int, float)):
+        return float(response["expires_at"])
+    if isinstance(response.get("expires_in"), (int, float)):
+        return time.time() + response["expires_in"]
+    return time.time() + DEFAULT_TOKEN_TTL
+
+
+class Credential:
+    """계정 1개와 현재 발급된 토큰"""
+
+    def __init__(self, email: str, password: str, tenant_id: str = None, role: str = None):
+        self.email = email
+        self.password = password
+        self.tenant_id = tenant_id
+        self.role = role
+        self.access_token: Optional[str] = None
+        self.expires_at: Optional[float] = None
+        self.user_profile: Optional[Dict] = None
+        self._lock = threading.Lock()  # 같은 계정을 여러 가상 사용자가 동시에 갱신하지 않도록
+
+    def valid_for(self, seconds: float) -> bool:
+        """토큰이 앞으로 seconds초 이상 유효한지"""
+        return self.access_token is not None and self.expires_at is not None and self.expires_at - time.time() > seconds
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def load_accounts(path: str) -> List[Credential]:
+    """계정 파일(.json / .csv) 읽기"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = json.load(f)
+            if isinstance(rows, dict):
+                rows = rows.get("accounts", [])
+    credentials = []
+    for row in rows:
+        if not row.get("email") or not row.get("password"):
+            raise ValueError(f"email / password가 없는 계정 항목: {row}")
+        credentials.append(Credential(row["email"], row["password"], row.get("tenant_id") or None,
+                                      row.get("role") or None))
+    if not credentials:
+        raise ValueError(f"계정이 없습니다: {path}")
+    return credentials
+
+
+def interleave_by_tenant(credentials: List[Credential]) -> List[Credential]:
+    """테넌트별로 한 계정씩 번갈아 배치 (라운드로빈 배정 시 부하가 테넌트에 고르게 분산)"""
+    groups: Dict[str, List[Credential]] = {}
+    for credential in credentials:
+        groups.setdefault(credential.tenant_id or "", []).append(credential)
+    ordered = []
+    while any(groups.values()):
+        for group in groups.values():
+            if group:
+                ordered.append(group.pop(0))
+    return ordered
+
+
+class CredentialPool:
+    def __init__(self, credentials: List[Credential], tester_factory: Callable,
+                 cache_path: Optional[str] = DEFAULT_TOKEN_CACHE, namespace: str = "",
+                 refresh_margin: float = DEFAULT_REFRESH_MARGIN, login_workers: int = DEFAULT_LOGIN_WORKERS):
+        """
+        tester_factory: 로그인에 사용할 테스터를 만드는 함수 (멀티프로세스 사용 시 pickle 가능해야 함)
+        cache_path: 토큰 캐시 파일 (None이면 캐시하지 않음), namespace: 캐시 키 구분자 (예: BASE_URL)
+        """
+        self.credentials = credentials
+        self.tester_factory = tester_factory
+        self.cache_path = cache_path
+        self.namespace = namespace
+        self.refresh_margin = refresh_margin
+        self.login_workers = login_workers
+        self.active: List[Credential] = []
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def _cache_key(self, credential: Credential) -> str:
+        return f"{self.namespace}|{credential.email}"
+
+    def _read_cache(self) -> Dict[str, Dict]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.log(f"토큰 캐시를 읽을 수 없어 무시합니다: {e}", "WARN")
+            return {}
+
+    def _write_cache(self):
+        """토큰 캐시 저장 (다른 프로세스가 쓴 항목과 합쳐 만료가 늦은 쪽을 유지, 원자적 교체)"""
+        if not self.cache_path:
+            return
+        with self._lock:
+            cache = self._read_cache()
+            now = time.time()
+            cache = {key: entry for key, entry in cache.items() if entry.get("expires_at", 0) > now}
+            for credential in self.credentials:
+                if not credential.valid_for(0):
+                    continue
+                key = self._cache_key(credential)
+                if cache.get(key, {}).get("expires_at", 0) >= credential.expires_at:
+                    continue
+                cache[key] = {
+                    "access_token": credential.access_token,
+                    "expires_at": credential.expires_at,
+                    "user": credential.user_profile,
+                    "tenant_id": credential.tenant_id,
+                }
+            directory = os.path.dirname(self.cache_path)
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)  # 이전 실행이 남긴 임시 파일
+            # 토큰이 들어 있으므로 만들 때부터 소유자만 읽기 (umask 권한으로 잠깐이라도 열려 있지 않도록)
+            fd = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(cache, f, ensure_ascii=False)
+                os.replace(temp_path, self.cache_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+
+    def _login(self, credential: Credential) -> bool:
+        tester = self.tester_factory()
+        tester.verbose = False
+        if not tester.login(credential.email, credential.password):
+            return False
+        credential.access_token = tester.access_token
+        credential.expires_at = tester.token_expires_at
+        credential.user_profile = tester.user_profile
+        credential.tenant_id = tester.tenant_id or credential.tenant_id
+        return True
+
+    def login_all(self) -> int:
+        """캐시에 유효한 토큰이 없는 계정만 병렬 로그인, 사용 가능한 계정 수 반환"""
+        cache = self._read_cache()
+        pending = []
+        for credential in self.credentials:
+            entry = cache.get(self._cache_key(credential))
+            if entry and entry.get("expires_at", 0) - time.time() > self.refresh_margin:
+                credential.access_token = entry["access_token"]
+                credential.expires_at = entry["expires_at"]
+                credential.user_profile = entry.get("user")
+                credential.tenant_id = entry.get("tenant_id") or credential.tenant_id
+            else:
+                pending.append(credential)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(min(self.login_workers, len(pending)), 1)) as executor:
+            results = list(executor.map(self._login, pending))
+        for credential, ok in zip(pending, results):
+            if not ok:
+                self.log(f"계정 로그인 실패: {credential.email}", "WARN")
+        self._write_cache()
+
+        self.active = interleave_by_tenant([credential for credential in self.credentials if credential.valid_for(0)])
+        tenants = {credential.tenant_id for credential in self.active}
+        self.log(f"자격 증명 풀: 계정 {len(self.active)}/{len(self.credentials)}개 사용 가능 "
+                 f"(캐시 {len(self.credentials) - len(pending)}, 로그인 {sum(results)}, "
+                 f"{time.perf_counter() - started:.1f}초), 테넌트 {len(tenants)}개")
+        return len(self.active)
+
+    def _apply(self, tester, credential: Credential):
+        tester.credential = credential
+        tester.set_access_token(credential.access_token)
+        tester.token_expires_at = credential.expires_at
+        tester.user_profile = credential.user_profile or {}
+        tester.tenant_id = credential.tenant_id
+
+    def assign(self, tester) -> bool:
+        """다음 계정을 라운드로빈으로 테스터에 배정 (테넌트가 번갈아 배정됨)"""
+        with self._lock:
+            if not self.active:
+                return False
+            credential = self.active[self._next % len(self.active)]
+            self._next += 1
+        self._apply(tester, credential)
+        return self.refresh(tester)
+
+    def refresh(self, tester) -> bool:
+        """배정된 계정의 토큰이 곧 만료되면 다시 로그인해 갱신 (다른 가상 사용자가 이미 갱신했으면 그 토큰 사용)"""
+        credential = tester.credential
+        if not credential.valid_for(self.refresh_margin):
+            with credential._lock:
+                if not credential.valid_for(self.refresh_margin):
+                    if not self._login(credential):
+                        self.log(f"토큰 갱신 실패: {credential.email}", "ERROR")
+                        return credential.valid_for(0)
+                    self._write_cache()
+        if tester.access_token != credential.access_token:
+            self._apply(tester, credential)
+        return True
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+EduCanvas 대시보드 집계 API 벤치마크
+관리자 홈 화면마다 호출되는 dashboard-stats / 출결 통계 API를 테넌트 규모를 키워 가며 cold / warm으로 반복 호출하고
+응답 시간이 데이터 양에 따라 어떻게 늘어나는지, 응답이 캐시에서 나오는지(헤더 / 지연 / 응답 시각 고정 여부)를 판정
+
+측정 단계 (규모마다, 엔드포인트마다):
+- first: 데이터 변경(시드) 직후 첫 호출
+- busted: 매번 다른 쿼리 파라미터(_cb)를 붙인 호출 - URL 기준 HTTP / CDN 캐시를 우회
+- warm: 같은 URL을 연속 호출
+- 응답 안의 시각 값(lastUpdated 등)이 gap초 간격의 두 호출에서 같으면 캐시된 본문으로 판단
+
+사용법:
+    python dashboard_bench.py --profiles small,medium,large
+    python dashboard_bench.py --profiles none --warm-samples 50   # 현재 테넌트만 측정
+"""
+
+import re
+import time
+import uuid
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from buffered_log import LOGGER
+from load_metrics import LatencyHistogram
+
+# 이름 -> 경로 템플릿 ({tenant}, {start}, {end} 치환)
+DASHBOARD_ENDPOINTS = {
+    "students-stats": "/api/students/dashboard-stats?tenantId={tenant}",
+    "classes-stats": "/api/classes/dashboard-stats",
+    "staff-stats": "/api/staff/dashboard-stats",
+    "attendance-realtime": "/api/dashboard/attendance/realtime?tenantId={tenant}",
+    "attendance-trends": "/api/dashboard/attendance/trends?tenantId={tenant}&period=30d",
+    "attendance-stats": "/api/student-attendance/stats?start_date={start}&end_date={end}",
+}
+
+DEFAULT_COLD_SAMPLES = 5
+DEFAULT_WARM_SAMPLES = 30
+DEFAULT_GAP = 1.1
+# warm p50이 busted p50의 이 비율보다 작으면 캐시된 것으로 추정
+CACHED_LATENCY_RATIO = 0.5
+# 캐시 관련 응답 헤더 (소문자)
+CACHE_HEADERS = ["x-cache", "x-cache-status", "cf-cache-status", "x-vercel-cache", "x-nextjs-cache",
+                 "age", "cache-control", "etag", "last-modified"]
+_HIT_HEADERS = ["x-cache", "x-cache-status", "cf-cache-status", "x-vercel-cache", "x-nextjs-cache"]
+_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+# 규모별 지연 막대 그래프 폭
+CHART_WIDTH = 40
+
+
+def cache_headers(headers) -> Dict[str, str]:
+    """응답 헤더 중 캐시 관련 항목만 (키는 소문자)"""
+    lowered = {key.lower(): value for key, value in (headers or {}).items()}
+    return {name: lowered[name] for name in CACHE_HEADERS if name in lowered}
+
+
+def header_cache_hit(signals: Dict[str, str]) -> bool:
+    """캐시 헤더가 적중(HIT / STALE / PRERENDER)을 나타내거나 Age가 0보다 크면 True"""
+    for name in _HIT_HEADERS:
+        value = signals.get(name, "").upper()
+        if any(marker in value for marker in ("HIT", "STALE", "PRERENDER")):
+            return True
+    age = signals.get("age", "")
+    return age.isdigit() and int(age) > 0
+
+
+def response_timestamps(data, found: Optional[List[str]] = None) -> List[str]:
+    """응답 안의 ISO 시각 문자열 목록 (lastUpdated, updateTime 등)"""
+    found = [] if found is None else found
+    if isinstance(data, dict):
+        for value in data.values():
+            response_timestamps(value, found)
+    elif isinstance(data, list):
+        for value in data[:50]:
+            response_timestamps(value, found)
+    elif isinstance(data, str) and _TIMESTAMP.match(data):
+        found.append(data)
+    return found
+
+
+class DashboardBenchmark:
+    def __init__(self, tester, endpoints: List[str] = None, cold_samples: int = DEFAULT_COLD_SAMPLES,
+                 warm_samples: int = DEFAULT_WARM_SAMPLES, gap: float = DEFAULT_GAP):
+        """tester: 로그인된 테스터, gap: 응답 시각 고정 여부를 확인할 두 호출 사이 간격(초)"""
+        self.tester = tester
+        self.endpoints = endpoints or list(DASHBOARD_ENDPOINTS)
+        self.cold_samples = cold_samples
+        self.warm_samples = warm_samples
+        self.gap = gap
+        self.results: List[Dict] = []
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def _endpoint(self, name: str) -> str:
+        today = date.today()
+        return DASHBOARD_ENDPOINTS[name].format(tenant=self.tester.tenant_id or "", end=today.isoformat(),
+                                                start=(today - timedelta(days=30)).isoformat())
+
+    def _call(self, endpoint: str):
+        """(응답, 지연 초 또는 None, 캐시 헤더)"""
+        response = self.tester.test_api_endpoint("GET", endpoint)
+        call = self.tester.last_call
+        latency = call["elapsed"] if call["status"] == 200 else None
+        return response, latency, cache_headers(call.get("headers"))
+
+    def measure(self, name: str, size_label: str, students: Optional[int]) -> Dict:
+        """엔드포인트 1개를 first / busted / warm으로 측정하고 캐시 여부 판정"""
+        endpoint = self._endpoint(name)
+        separator = "&" if "?" in endpoint else "?"
+        errors = 0
+        hit_headers: Dict[str, str] = {}
+
+        def timed(url: str, histogram: Optional[LatencyHistogram]):
+            nonlocal errors
+            response, latency, signals = self._call(url)
+            if latency is None:
+                errors += 1
+                return response
+            if histogram is not None:
+                histogram.record_seconds(latency)
+            if header_cache_hit(signals):
+                hit_headers.update(signals)
+            return response
+
+        first = LatencyHistogram()
+        timed(endpoint, first)
+        busted = LatencyHistogram()
+        for _ in range(self.cold_samples):
+            timed(f"{endpoint}{separator}_cb={uuid.uuid4().hex[:12]}", busted)
+        warm = LatencyHistogram()
+        for _ in range(self.warm_samples):
+            timed(endpoint, warm)
+
+        # 같은 URL을 gap초 간격으로 두 번 호출해 응답 안의 시각 값 비교
+        before = response_timestamps(timed(endpoint, None))
+        time.sleep(self.gap)
+        after = response_timestamps(timed(endpoint, None))
+        frozen_body = bool(before) and before == after
+
+        busted_p50 = busted.percentile(50) / 1000
+        warm_p50 = warm.percentile(50) / 1000
+        if hit_headers:
+            verdict = "cache-hit(header)"
+        elif frozen_body:
+            verdict = "cached(frozen-body)"
+        elif busted.count and warm.count and warm_p50 < busted_p50 * CACHED_LATENCY_RATIO:
+            verdict = "cached?(latency)"
+        else:
+            verdict = "recomputed"
+
+        result = {
+            "endpoint": name,
+            "size": size_label,
+            "students": students,
+            "first_ms": first.percentile(50) / 1000,
+            "busted_p50_ms": busted_p50,
+            "warm_p50_ms": warm_p50,
+            "warm_p95_ms": warm.percentile(95) / 1000,
+            "warm_max_ms": (warm.max or 0) / 1000,
+            "errors": errors,
+            "cache_headers": hit_headers,
+            "frozen_body": frozen_body,
+            "verdict": verdict,
+        }
+        self.results.append(result)
+        return result
+
+    def measure_all(self, size_label: str, students: Optional[int] = None) -> List[Dict]:
+        """현재 테넌트 상태에서 모든 엔드포인트 측정"""
+        self.log(f"=== 규모 {size_label} (시드 학생 {students if students is not None else '-'}명) ===")
+        measured = []
+        for name in self.endpoints:
+            result = self.measure(name, size_label, students)
+            self.log(f"{name}: first {result['first_ms']:.1f}ms, busted p50 {result['busted_p50_ms']:.1f}ms, "
+                     f"warm p50 {result['warm_p50_ms']:.1f}ms -> {result['verdict']}")
+            measured.append(result)
+        return measured
+
+    def format_report(self) -> str:
+        """규모 / 엔드포인트별 결과 표"""
+        lines = [
+            f"{'ENDPOINT':<20} {'SIZE':<8} {'STUDENTS':>8} {'FIRST':>8} {'BUSTED50':>9} {'WARM50':>8} "
+            f"{'WARM95':>8} {'WARMMAX':>8} {'ERR':>4}  VERDICT",
+            "-" * 110,
+        ]
+        for r in self.results:
+            students = r["students"] if r["students"] is not None else "-"
+            lines.append(
+                f"{r['endpoint']:<20} {r['size']:<8} {students:>8} {r['first_ms']:>8.1f} {r['busted_p50_ms']:>9.1f} "
+                f"{r['warm_p50_ms']:>8.1f} {r['warm_p95_ms']:>8.1f} {r['warm_max_ms']:>8.1f} {r['errors']:>4}  "
+                f"{r['verdict']}"
+            )
+        return "\n".join(lines)
+
+    def format_scaling(self) -> str:
+        """엔드포인트별 규모 대비 warm p50 막대 그래프와 학생 1,000명당 증가량"""
+        lines = []
+        peak = max((r["warm_p50_ms"] for r in self.results), default=0) or 1
+        for name in self.endpoints:
+            rows = [r for r in self.results if r["endpoint"] == name]
+            if not rows:
+                continue
+            lines.append(f"{name}")
+            for r in rows:
+                bar = "#" * max(round(r["warm_p50_ms"] / peak * CHART_WIDTH), 1)
+                students = r["students"] if r["students"] is not None else "-"
+                lines.append(f"  {r['size']:<8} {students:>7}명 {bar:<{CHART_WIDTH}} {r['warm_p50_ms']:.1f}ms")
+            sized = [r for r in rows if r["students"]]
+            if len(sized) >= 2 and sized[-1]["students"] != sized[0]["students"]:
+                slope = (sized[-1]["warm_p50_ms"] - sized[0]["warm_p50_ms"]) / (
+                    (sized[-1]["students"] - sized[0]["students"]) / 1000)
+                lines.append(f"  -> 학생 1,000명당 {slope:+.2f}ms")
+        return "\n".join(lines)
+
+
+def parse_args():
+    import argparse
+
+    from seed_data import SEED_PROFILES
+
+    parser = argparse.ArgumentParser(description="EduCanvas 대시보드 집계 API 벤치마크")
+    parser.add_argument("--profiles", default="small,medium,large",
+                        help=f"차례로 누적 시드할 규모 (쉼표 구분: {', '.join(SEED_PROFILES)}, none이면 시드 없이 현재 테넌트만)")
+    parser.add_argument("--endpoints", default=",".join(DASHBOARD_ENDPOINTS),
+                        help=f"측정할 엔드포인트 (쉼표 구분: {', '.join(DASHBOARD_ENDPOINTS)})")
+    parser.add_argument("--cold-samples", type=int, default=DEFAULT_COLD_SAMPLES, help="캐시 우회 호출 횟수")
+    parser.add_argument("--warm-samples", type=int, default=DEFAULT_WARM_SAMPLES, help="같은 URL 연속 호출 횟수")
+    parser.add_argument("--gap", type=float, default=DEFAULT_GAP, help="응답 시각 고정 여부를 확인할 호출 간격(초)")
+    parser.add_argument("--seed", type=int, default=42, help="시드 데이터 난수 시드")
+    parser.add_argument("--tag", default="DASH", help="시드 데이터 식별 접두사 (규모마다 번호가 붙음)")
+    parser.add_argument("--workers", type=int, default=16, help="시드 병렬 요청 수")
+    parser.add_argument("--keep", default=None,
+                        help="시드 데이터를 삭제하지 않고 이 경로에 manifest 저장 (seed_data.py --teardown으로 정리)")
+    parser.add_argument("--results", default=None, help="결과 저장 경로 (.json)")
+    return parser.parse_args()
+
+
+def main() -> bool:
+    import json
+
+    from seed_data import SEED_PROFILES, SyntheticDataGenerator, TenantSeeder
+    from test_authenticated_crud import AuthenticatedCRUDTester
+
+    args = parse_args()
+    profiles = [] if args.profiles == "none" else [p.strip() for p in args.profiles.split(",") if p.strip()]
+    endpoints = [e.strip() for e in args.endpoints.split(",") if e.strip()]
+    unknown = [p for p in profiles if p not in SEED_PROFILES] + [e for e in endpoints if e not in DASHBOARD_ENDPOINTS]
+    if unknown:
+        print(f"ERROR: 알 수 없는 규모 / 엔드포인트: {', '.join(unknown)}")
+        exit(2)
+
+    tester = AuthenticatedCRUDTester(verbose=False, pool_size=args.workers)
+    if not tester.login():
+        return False
+    benchmark = DashboardBenchmark(tester, endpoints, args.cold_samples, args.warm_samples, args.gap)
+    seeder = TenantSeeder(tester, workers=args.workers)
+    created: Dict[str, List[str]] = {}
+    steps: List[Dict] = []  # 규모별 시드 기록 (manifest용)
+    assignments: Dict[str, str] = {}
+
+    try:
+        if not profiles:
+            benchmark.measure_all("current")
+        students = 0
+        for index, name in enumerate(profiles):
+            profile = SEED_PROFILES[name]
+            seed, tag = args.seed + index, f"{args.tag}{index}"
+            generator = SyntheticDataGenerator(tester.tenant_id, seed=seed, tag=tag)
+            benchmark.log(f"시드 데이터 추가: {name} {profile}")
+            step = seeder.seed(generator, profile)
+            for kind, ids in step.items():
+                created.setdefault(kind, []).extend(ids)
+            assignments.update(seeder.assignments)
+            steps.append({"name": name, "seed": seed, "tag": tag, "profile": profile,
+                          "counts": {kind: len(ids) for kind, ids in step.items()}})
+            students += len(step["students"])
+            benchmark.measure_all(name, students)
+    except KeyboardInterrupt:
+        benchmark.log("중단 요청 - 지금까지의 결과를 출력합니다", "WARN")
+    finally:
+        if created and args.keep:
+            manifest = {"tenant_id": tester.tenant_id, "steps": steps,
+                        "counts": {kind: len(ids) for kind, ids in created.items()},
+                        "created": created, "assignments": assignments}
+            if len(steps) == 1:
+                # 규모 1개면 seed_data.py manifest와 같은 seed / tag / profile (search_bench 등에서 재현 가능)
+                manifest.update(seed=steps[0]["seed"], tag=steps[0]["tag"], profile=steps[0]["profile"])
+            with open(args.keep, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            benchmark.log(f"시드 데이터 유지, manifest 저장: {args.keep}")
+        elif created:
+            benchmark.log("시드 데이터 정리 중...")
+            seeder.teardown(created)
+
+    LOGGER.write(benchmark.format_report())
+    LOGGER.write("")
+    LOGGER.write(benchmark.format_scaling())
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(benchmark.results, f, ensure_ascii=False, indent=2)
+    return all(result["errors"] == 0 for result in benchmark.results)
+
+
+if __name__ == "__main__":
+    exit(0 if main() else 1)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 테스터용 HTTP 엔진
+- create_session: 커넥션 풀 / keep-alive / 재시도 정책이 설정된 requests.Session (동기 경로)
+- AsyncHttpEngine: keep-alive 커넥션 풀(aiohttp)과 세마포어 동시성 제한으로 한 프로세스에서 수백 개의 요청을 동시에 처리
+aiohttp가 설치되어 있지 않으면 테스터는 동기(requests) 경로를 사용
+asyncio는 AsyncHttpEngine을 쓸 때만 불러옴 (동기 경로 / health 점검의 시작 시간 단축)
+"""
+
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_MAX_CONCURRENCY = 200
+DEFAULT_KEEPALIVE_TIMEOUT = 30
+
+# 동기 세션 기본값
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF_FACTOR = 0.2
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE, max_retries: int = DEFAULT_MAX_RETRIES,
+                   backoff_factor: float = DEFAULT_BACKOFF_FACTOR, headers: Dict = None):
+    """
+    커넥션 풀 크기와 재시도 정책이 적용된 requests.Session 생성
+    재시도는 연결 실패와 게이트웨이 오류(502/503/504)에 한해 멱등 메서드(GET/PUT/DELETE)만 수행
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=0,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'User-Agent': 'EduCanvas-API-Tester/1.0',
+        'Connection': 'keep-alive'
+    })
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def transfer_stats(response) -> Tuple[Optional[int], Optional[float]]:
+    """
+    응답의 (전송 바이트, TTFB 초) - requests 응답에서만 측정 가능, 그 외에는 (None, None)
+    전송 바이트는 압축 해제 전 크기, TTFB는 요청 전송부터 응답 헤더 수신까지의 시간
+    """
+    raw = getattr(response, "raw", None)
+    wire_bytes = raw.tell() if raw is not None and hasattr(raw, "tell") else None
+    elapsed = getattr(response, "elapsed", None)
+    ttfb = elapsed.total_seconds() if elapsed is not None else None
+    return wire_bytes, ttfb
+
+
+class RequestTimeout(Exception):
+    """요청 타임아웃"""
+
+
+class RequestConnectionError(Exception):
+    """서버 연결 실패"""
+
+
+class EngineResponse:
+    """requests.Response와 같은 방식으로 쓸 수 있는 최소 응답 객체"""
+
+    def __init__(self, status_code: int, content: bytes, headers: Dict[str, str], encoding: Optional[str] = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncHttpEngine:
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, pool_size: Optional[int] = None,
+                 keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT):
+        """
+        max_concurrency: 동시에 진행 중일 수 있는 요청 수 상한 (세마포어)
+        pool_size: keep-alive 커넥션 풀 크기 (기본값은 max_concurrency)
+        """
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size or max_concurrency
+        self.keepalive_timeout = keepalive_timeout
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session = None
+        self._semaphore: Optional["asyncio.Semaphore"] = None
+        self._aiohttp = None
+
+    @property
+    def loop(self) -> "asyncio.AbstractEventLoop":
+        if self._loop is None:
+            raise RuntimeError("엔진이 시작되지 않았습니다 (start() 호출 필요)")
+        return self._loop
+
+    def start(self) -> "AsyncHttpEngine":
+        """백그라운드 스레드에 이벤트 루프와 커넥션 풀을 생성 (aiohttp 없으면 ImportError)"""
+        if self._loop is not None:
+            return self
+        import asyncio
+        import aiohttp
+
+        self._aiohttp = aiohttp
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="http-engine", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._open(), self._loop).result()
+        return self
+
+    async def _open(self):
+        import asyncio
+
+        connector = self._aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=self.keepalive_timeout)
+        self._session = self._aiohttp.ClientSession(connector=connector)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def request_async(self, method: str, url: str, json: Any = None, headers: Dict = None,
+                            timeout: float = 10) -> EngineResponse:
+        """비동기 요청 (다른 이벤트 루프에서 호출하면 엔진 루프로 넘겨 실행)"""
+        import asyncio
+
+        coro = self._request(method, url, json, headers, timeout)
+        if asyncio.get_running_loop() is self.loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    async def _request(self, method: str, url: str, json: Any, headers: Optional[Dict],
+                       timeout: float) -> EngineResponse:
+        import asyncio
+
+        aiohttp = self._aiohttp
+        async with self._semaphore:
+            try:
+                async with self._session.request(
+                    method.upper(), url, json=json, headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    content = await response.read()
+                    return EngineResponse(response.status, content, dict(response.headers), response.charset)
+            except asyncio.TimeoutError as e:
+                raise RequestTimeout(str(e) or "timeout") from e
+            except aiohttp.ClientConnectionError as e:
+                raise RequestConnectionError(str(e)) from e
+
+    def request(self, method: str, url: str, json: Any = None, headers: Dict = None,
+                timeout: float = 10) -> EngineResponse:
+        """동기 호출자용: 엔진 루프에서 요청을 실행하고 결과를 기다림 (여러 스레드에서 호출 가능)"""
+        import asyncio
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._request(method, url, json, headers, timeout), self.loop
+        )
+        return future.result()
+
+    def close(self):
+        """커넥션 풀과 이벤트 루프 정리"""
+        if self._loop is None:
+            return
+        import asyncio
+
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._session = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def create_engine(kind: str = "sync", max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> Optional[AsyncHttpEngine]:
+    """
+    kind="async"이면 시작된 AsyncHttpEngine, "sync"이면 None (테스터의 기존 requests 경로)
+    aiohttp가 없으면 경고 후 None을 반환해 동기 경로로 폴백
+    """
+    if kind == "sync":
+        return None
+    if kind != "async":
+        raise ValueError(f"지원하지 않는 HTTP 엔진: {kind}")
+    try:
+        return AsyncHttpEngine(max_concurrency=max_concurrency).start()
+    except ImportError:
+        print("WARN: aiohttp가 설치되어 있지 않아 동기(requests) 엔진으로 실행합니다")
+        return None
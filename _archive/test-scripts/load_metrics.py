@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 부하 테스트 지표 수집
+엔드포인트(메서드 + 라우트)별 요청 수, 에러 수, 응답 시간 히스토그램을 스레드 안전하게 집계
+"""
+
+import math
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# UUID / 숫자 경로 세그먼트는 하나의 라우트로 묶는다 (/api/students/{id})
+_UUID_SEGMENT = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+_NUMERIC_SEGMENT = re.compile(r"^\d+$")
+
+
+def route_template(endpoint: str) -> str:
+    """쿼리스트링을 제거하고 ID 세그먼트를 {id}로 치환한 라우트 템플릿"""
+    path = endpoint.split("?", 1)[0]
+    segments = []
+    for segment in path.split("/"):
+        if _UUID_SEGMENT.match(segment) or _NUMERIC_SEGMENT.match(segment):
+            segments.append("{id}")
+        else:
+            segments.append(segment)
+    return "/".join(segments) or "/"
+
+
+def route_key(method: str, endpoint: str) -> Tuple[str, str]:
+    """지표 집계 키 (METHOD, 라우트 템플릿)"""
+    return (method.upper(), route_template(endpoint))
+
+
+class LatencyHistogram:
+    """
+    HDR 스타일 로그-선형 버킷 히스토그램 (마이크로초 정수 단위)
+    2의 거듭제곱 구간마다 2^(sub_bucket_bits-1)개의 선형 버킷을 두어 값 크기와 무관하게
+    상대 오차를 약 1/2^(sub_bucket_bits-1) 이내로 유지하고, 기록된 버킷만 저장
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self.sub_bucket_bits
+        if shift <= 0:
+            return value
+        return (shift << self.sub_bucket_bits) + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        shift = index >> self.sub_bucket_bits
+        if shift == 0:
+            return index
+        sub_bucket = index & ((1 << self.sub_bucket_bits) - 1)
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value_us: int, count: int = 1):
+        """값(마이크로초) 기록"""
+        value_us = max(int(value_us), 0)
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        if self.min is None or value_us < self.min:
+            self.min = value_us
+        if self.max is None or value_us > self.max:
+            self.max = value_us
+
+    def record_seconds(self, seconds: float):
+        self.record(round(seconds * 1_000_000))
+
+    def percentile(self, percent: float) -> int:
+        """백분위 값(마이크로초), 기록이 없으면 0"""
+        if self.count == 0:
+            return 0
+        if percent <= 0:
+            return self.min
+        target = max(math.ceil(self.count * percent / 100.0), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram"):
+        """다른 히스토그램의 기록을 합침 (같은 sub_bucket_bits 필요)"""
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("sub_bucket_bits가 다른 히스토그램은 합칠 수 없습니다")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def to_dict(self) -> Dict:
+        """프로세스 간 전달용 dict (JSON / pickle 가능)"""
+        return {
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "counts": {str(index): count for index, count in self.counts.items()},
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        histogram = cls(data["sub_bucket_bits"])
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+
+class EndpointStats:
+    """단일 엔드포인트 집계값"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.status_counts: Dict[str, int] = {}
+        self.latency = LatencyHistogram()
+        self.ttfb = LatencyHistogram()
+        self.bytes_total = 0
+        self.wire_bytes_total = 0
+        self.wire_bytes_count = 0
+
+    def record(self, status_code: Optional[int], is_error: bool, latency: Optional[float] = None,
+               payload_bytes: Optional[int] = None, wire_bytes: Optional[int] = None,
+               ttfb: Optional[float] = None):
+        self.requests += 1
+        if payload_bytes:
+            self.bytes_total += payload_bytes
+        if wire_bytes is not None:
+            self.wire_bytes_total += wire_bytes
+            self.wire_bytes_count += 1
+        if ttfb is not None:
+            self.ttfb.record_seconds(ttfb)
+        if is_error:
+            self.errors += 1
+        status = str(status_code) if status_code is not None else "transport"
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        if latency is not None:
+            self.latency.record_seconds(latency)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def merge(self, other: "EndpointStats"):
+        """다른 집계값을 합침"""
+        self.requests += other.requests
+        self.errors += other.errors
+        for status, count in other.status_counts.items():
+            self.status_counts[status] = self.status_counts.get(status, 0) + count
+        self.latency.merge(other.latency)
+        self.ttfb.merge(other.ttfb)
+        self.bytes_total += other.bytes_total
+        self.wire_bytes_total += other.wire_bytes_total
+        self.wire_bytes_count += other.wire_bytes_count
+
+    def to_dict(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "status_counts": dict(self.status_counts),
+            "latency": self.latency.to_dict(),
+            "ttfb": self.ttfb.to_dict(),
+            "bytes_total": self.bytes_total,
+            "wire_bytes_total": self.wire_bytes_total,
+            "wire_bytes_count": self.wire_bytes_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "EndpointStats":
+        stats = cls()
+        stats.requests = data["requests"]
+        stats.errors = data["errors"]
+        stats.status_counts = dict(data["status_counts"])
+        stats.latency = LatencyHistogram.from_dict(data["latency"])
+        stats.ttfb = LatencyHistogram.from_dict(data["ttfb"])
+        stats.bytes_total = data["bytes_total"]
+        stats.wire_bytes_total = data["wire_bytes_total"]
+        stats.wire_bytes_count = data["wire_bytes_count"]
+        return stats
+
+
+class LoadMetrics:
+    """여러 가상 사용자가 공유하는 지표 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints: Dict[Tuple[str, str], EndpointStats] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.results_writer = None  # bench_results.ResultsWriter (요청별 결과 기록)
+        self._window: Optional[Dict[Tuple[str, str], EndpointStats]] = None  # 구간 집계 (soak 모드, take_window)
+
+    def start(self):
+        self.started_at = time.monotonic()
+
+    def stop(self):
+        self.finished_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return max(end - self.started_at, 1e-9)
+
+    def record(self, method: str, endpoint: str, status_code: Optional[int], latency: Optional[float] = None,
+               payload_bytes: Optional[int] = None, wire_bytes: Optional[int] = None,
+               ttfb: Optional[float] = None):
+        """
+        요청 1건 기록 (전송 실패 또는 4xx/5xx 응답은 에러로 집계)
+        latency: 응답까지 걸린 시간(초), 응답을 받지 못한 요청은 None
+        payload_bytes: 압축 해제 후 응답 본문 크기, wire_bytes: 전송(압축) 크기, ttfb: 첫 바이트까지 시간(초)
+        """
+        is_error = status_code is None or status_code >= 400
+        key = route_key(method, endpoint)
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointStats()
+            stats.record(status_code, is_error, latency, payload_bytes, wire_bytes, ttfb)
+            if self._window is not None:
+                window = self._window.get(key)
+                if window is None:
+                    window = self._window[key] = EndpointStats()
+                window.record(status_code, is_error, latency, payload_bytes, wire_bytes, ttfb)
+        if self.results_writer is not None:
+            self.results_writer.write_request(key[0], key[1], endpoint, status_code, latency, payload_bytes,
+                                              wire_bytes, ttfb)
+
+    def take_window(self) -> Dict[Tuple[str, str], EndpointStats]:
+        """
+        직전 호출 이후 구간의 라우트별 집계를 반환하고 새 구간 시작 (첫 호출은 구간 집계를 켜고 빈 dict 반환)
+        요청을 따로 저장하지 않고 구간마다 히스토그램만 새로 만들므로 장시간 실행에도 메모리가 일정
+        """
+        with self._lock:
+            window, self._window = self._window, {}
+        return window or {}
+
+    def totals(self) -> Tuple[int, int, LatencyHistogram]:
+        """전체 요청 수 / 에러 수 / 모든 라우트를 합친 지연 히스토그램 (실행 중 상태 줄용)"""
+        latency = LatencyHistogram()
+        requests = errors = 0
+        with self._lock:
+            for stats in self.endpoints.values():
+                requests += stats.requests
+                errors += stats.errors
+                latency.merge(stats.latency)
+        return requests, errors, latency
+
+    def to_dict(self) -> Dict:
+        """프로세스 간 전달용 dict (라우트별 집계값 + 실행 시간)"""
+        with self._lock:
+            endpoints = [
+                {"method": method, "route": route, "stats": stats.to_dict()}
+                for (method, route), stats in sorted(self.endpoints.items())
+            ]
+        return {"elapsed": self.elapsed, "endpoints": endpoints}
+
+    def merge_dict(self, data: Dict):
+        """
+        다른 프로세스의 to_dict() 결과를 합침
+        동시에 실행된 워커들을 합치는 용도이므로 실행 시간은 가장 긴 워커 기준
+        """
+        with self._lock:
+            for entry in data["endpoints"]:
+                key = (entry["method"], entry["route"])
+                stats = EndpointStats.from_dict(entry["stats"])
+                if key in self.endpoints:
+                    self.endpoints[key].merge(stats)
+                else:
+                    self.endpoints[key] = stats
+            if self.started_at is None:
+                self.started_at = 0.0
+            finished_at = self.finished_at if self.finished_at is not None else self.started_at
+            self.finished_at = max(finished_at, self.started_at + data["elapsed"])
+
+    def format_report(self) -> str:
+        """엔드포인트별 RPS / 에러율 표"""
+        elapsed = self.elapsed
+        lines = [
+            f"{'METHOD':<7} {'ROUTE':<40} {'REQS':>7} {'RPS':>8} {'ERRORS':>7} {'ERR%':>7}",
+            "-" * 81,
+        ]
+        total_requests = 0
+        total_errors = 0
+        with self._lock:
+            items = sorted(self.endpoints.items())
+        for (method, route), stats in items:
+            total_requests += stats.requests
+            total_errors += stats.errors
+            lines.append(
+                f"{method:<7} {route:<40} {stats.requests:>7} "
+                f"{stats.requests / elapsed:>8.1f} {stats.errors:>7} {stats.error_rate * 100:>6.1f}%"
+            )
+        lines.append("-" * 81)
+        total_rate = total_errors / total_requests * 100 if total_requests else 0.0
+        lines.append(
+            f"{'TOTAL':<48} {total_requests:>7} {total_requests / elapsed:>8.1f} "
+            f"{total_errors:>7} {total_rate:>6.1f}%"
+        )
+        return "\n".join(lines)
+
+    def format_latency_report(self) -> str:
+        """엔드포인트별 응답 시간 표 (ms)"""
+        lines = [
+            f"{'METHOD':<7} {'ROUTE':<40} {'COUNT':>7} {'MIN':>8} {'P50':>8} {'P95':>8} {'P99':>8} {'MAX':>8}",
+            "-" * 101,
+        ]
+        with self._lock:
+            items = sorted(self.endpoints.items())
+        for (method, route), stats in items:
+            histogram = stats.latency
+            if histogram.count == 0:
+                continue
+            values = [histogram.min, histogram.percentile(50), histogram.percentile(95),
+                      histogram.percentile(99), histogram.max]
+            columns = " ".join(f"{value / 1000:>8.1f}" for value in values)
+            lines.append(f"{method:<7} {route:<40} {histogram.count:>7} {columns}")
+        return "\n".join(lines)
+
+    def format_payload_report(self) -> str:
+        """엔드포인트별 응답 크기 / 압축률 / TTFB 표 (과다 조회 엔드포인트 확인용)"""
+        lines = [
+            f"{'METHOD':<7} {'ROUTE':<40} {'COUNT':>7} {'BODY_KB':>9} {'WIRE_KB':>9} {'RATIO':>6} {'TTFB50':>8} {'TTFB95':>8}",
+            "-" * 100,
+        ]
+        with self._lock:
+            items = sorted(self.endpoints.items(), key=lambda item: item[1].bytes_total, reverse=True)
+        for (method, route), stats in items:
+            if stats.requests == 0:
+                continue
+            body_kb = stats.bytes_total / stats.requests / 1024
+            if stats.wire_bytes_count:
+                wire_kb = stats.wire_bytes_total / stats.wire_bytes_count / 1024
+                ratio = f"{wire_kb / body_kb:>6.2f}" if body_kb else f"{'-':>6}"
+                wire = f"{wire_kb:>9.1f}"
+            else:
+                wire, ratio = f"{'-':>9}", f"{'-':>6}"
+            if stats.ttfb.count:
+                ttfb = f"{stats.ttfb.percentile(50) / 1000:>8.1f} {stats.ttfb.percentile(95) / 1000:>8.1f}"
+            else:
+                ttfb = f"{'-':>8} {'-':>8}"
+            lines.append(f"{method:<7} {route:<40} {stats.requests:>7} {body_kb:>9.1f} {wire} {ratio} {ttfb}")
+        return "\n".join(lines)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 부하 테스트 실행기
+N명의 가상 사용자가 각자 한 번 로그인한 뒤 기존 test_*_crud 플로우를 반복 실행
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from buffered_log import LOGGER
+from load_metrics import LoadMetrics
+
+
+class LoadRunner:
+    def __init__(self, tester_factory: Callable, users: int = 10,
+                 duration: Optional[float] = None, iterations: Optional[int] = None, credential_pool=None,
+                 profiler=None, live: bool = True):
+        """
+        tester_factory: 가상 사용자마다 새 테스터 인스턴스를 만드는 함수
+        duration: 전체 실행 시간(초), iterations: 가상 사용자당 플로우 반복 횟수
+        둘 다 지정하면 먼저 도달하는 조건에서 종료
+        credential_pool: credential_pool.CredentialPool (지정하면 개별 로그인 대신 풀에서 계정 / 토큰 배정)
+        profiler: client_profiler.ClientProfiler (지정하면 테스터 자체 오버헤드를 계측해 리포트에 포함)
+        live: 터미널에 RPS / 에러 수 / p95 상태 줄을 실시간 갱신
+        """
+        if duration is None and iterations is None:
+            raise ValueError("duration 또는 iterations 중 하나는 지정해야 합니다")
+        self.tester_factory = tester_factory
+        self.users = users
+        self.duration = duration
+        self.iterations = iterations
+        self.credential_pool = credential_pool
+        self.profiler = profiler
+        self.live = live
+        self.metrics = LoadMetrics()
+        self.stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self.login_failures = 0
+        self.flow_runs = 0
+        self.flow_failures = 0
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def _status_line(self) -> str:
+        """상태 줄: 직전 갱신 이후 RPS, 누적 요청 / 에러 수, 누적 p95"""
+        requests, errors, latency = self.metrics.totals()
+        now = time.monotonic()
+        last_at, last_requests = self._status_last
+        self._status_last = (now, requests)
+        rps = (requests - last_requests) / max(now - last_at, 1e-9)
+        return (f"[{self.metrics.elapsed:6.1f}s] RPS {rps:8.1f} | 요청 {requests} | 에러 {errors} | "
+                f"p95 {latency.percentile(95) / 1000:.1f}ms | 플로우 {self.flow_runs}")
+
+    def _should_continue(self, iteration: int, deadline: Optional[float]) -> bool:
+        if self.stop_event.is_set():
+            return False
+        if self.iterations is not None and iteration >= self.iterations:
+            return False
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        return True
+
+    def _virtual_user(self, user_index: int, deadline: Optional[float]):
+        """가상 사용자 1명: 로그인 1회 후 CRUD 플로우 반복"""
+        tester = self.tester_factory()
+        tester.metrics = self.metrics
+        tester.profiler = self.profiler
+        tester.verbose = False
+
+        if self.credential_pool is not None:
+            logged_in = self.credential_pool.assign(tester)
+        else:
+            logged_in = tester.login()
+        if not logged_in:
+            with self._lock:
+                self.login_failures += 1
+            tester.log(f"가상 사용자 #{user_index} 로그인 실패", "ERROR")
+            return
+
+        iteration = 0
+        while self._should_continue(iteration, deadline):
+            if self.credential_pool is not None and not self.credential_pool.refresh(tester):
+                tester.log(f"가상 사용자 #{user_index} 토큰 만료로 중단", "ERROR")
+                break
+            for test_name, test_func in tester.crud_tests():
+                if self.stop_event.is_set():
+                    break
+                try:
+                    result = test_func()
+                except Exception as e:
+                    tester.log(f"가상 사용자 #{user_index} {test_name} 예외 발생: {str(e)}", "ERROR")
+                    result = False
+                with self._lock:
+                    self.flow_runs += 1
+                    if not result:
+                        self.flow_failures += 1
+            iteration += 1
+
+    def run(self, report: bool = True) -> bool:
+        """부하 테스트 실행 후 리포트 출력, 에러가 없으면 True (report=False면 집계만 하고 표는 출력하지 않음)"""
+        limits = []
+        if self.duration is not None:
+            limits.append(f"{self.duration:g}초")
+        if self.iterations is not None:
+            limits.append(f"사용자당 {self.iterations}회")
+        self.log(f"부하 테스트 시작: 가상 사용자 {self.users}명, {' / '.join(limits)}")
+        self.log("=" * 60)
+
+        self.metrics.start()
+        if self.profiler is not None:
+            self.profiler.start()
+        if self.live:
+            self._status_last = (time.monotonic(), 0)
+            LOGGER.set_status(self._status_line)
+        deadline = time.monotonic() + self.duration if self.duration is not None else None
+        threads = [
+            threading.Thread(target=self._virtual_user, args=(i, deadline), name=f"vu-{i}", daemon=True)
+            for i in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            self.log("중단 요청 - 진행 중인 요청이 끝나면 종료합니다", "WARN")
+            self.stop_event.set()
+            for thread in threads:
+                thread.join()
+        self.metrics.stop()
+        if self.live:
+            LOGGER.set_status(None)
+        if self.profiler is not None:
+            self.profiler.stop()
+
+        if report:
+            self.print_report()
+        total_errors = sum(stats.errors for stats in self.metrics.endpoints.values())
+        return self.login_failures == 0 and total_errors == 0
+
+    def print_report(self):
+        """실행 요약과 RPS / 응답 시간 / 응답 크기 표 출력"""
+        self.log("=" * 60)
+        self.log(f"부하 테스트 완료: {self.metrics.elapsed:.1f}초, "
+                 f"플로우 {self.flow_runs}회 (실패 {self.flow_failures}), 로그인 실패 {self.login_failures}")
+        LOGGER.write(self.metrics.format_report())
+        self.log("엔드포인트별 응답 시간 (ms)")
+        LOGGER.write(self.metrics.format_latency_report())
+        self.log("엔드포인트별 응답 크기")
+        LOGGER.write(self.metrics.format_payload_report())
+        if self.profiler is not None:
+            self.log("클라이언트 오버헤드")
+            LOGGER.write(self.profiler.format_report())
+            for warning in self.profiler.warnings():
+                self.log(warning, "WARN")
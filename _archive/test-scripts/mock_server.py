@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 대역(mock) 서버
+Next.js + Supabase 없이 테스터가 사용하는 라우트를 같은 응답 형태로 흉내 내는 로컬 서버
+- /api/auth/login, students / classes / instructors / course-packages / enrollments / salary-policies 목록 / 생성 / 조회 / 수정 / 삭제
+- 응답 지연(고정 + 지터), 에러 주입 비율 / 상태코드(429 / 5xx, Retry-After), 목록 항목 수 / 레코드 패딩 크기 조절
+- 네트워크 / DB가 없는 CI에서 테스터 자체의 최대 처리량을 측정하고 기준선과 비교하는 용도
+
+사용법:
+    python mock_server.py --port 3001 --mock-latency-ms 5 --mock-error-rate 0.01
+    python test_authenticated_crud.py --mock --users 20 --duration 30   # 테스터 프로세스 안에서 실행
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# 라우트 경로: (목록 응답 키, 단건 응답 키)
+MOCK_RESOURCES = {
+    "students": ("students", "student"),
+    "classes": ("classes", "class"),
+    "instructors": ("instructors", "instructor"),
+    "course-packages": ("course_packages", "course_package"),
+    "enrollments": ("enrollments", "enrollment"),
+    "salary-policies": ("salary_policies", "salary_policy"),
+}
+MOCK_TENANT_ID = "00000000-0000-4000-8000-000000000001"
+MOCK_TOKEN_PREFIX = "mock-"
+MOCK_TOKEN_TTL = 3600
+DEFAULT_LIST_LIMIT = 5
+DEFAULT_ERROR_STATUS = 500
+# 생성된 레코드 보관 상한 (장시간 부하에서 메모리가 계속 늘지 않도록 오래된 것부터 제거)
+MAX_RECORDS = 100000
+
+
+def serves(path: str) -> bool:
+    """
+    대역 서버가 처리하는 경로인지 (/api/auth/login, /api/<MOCK_RESOURCES>[/<id>]), 나머지는 404
+    /api/students/search처럼 ID 자리가 영문 소문자 단어인 하위 라우트는 처리하지 않음
+    """
+    parts = [part for part in urlsplit(path).path.split("/") if part]
+    if parts == ["api", "auth", "login"]:
+        return True
+    if len(parts) == 3 and re.fullmatch(r"[a-z-]+", parts[2]):
+        return False
+    return len(parts) in (2, 3) and parts[0] == "api" and parts[1] in MOCK_RESOURCES
+
+
+class MockApiServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, list_items: Optional[int] = None, pad_bytes: int = 0, seed: int = 42,
+                 error_status: int = DEFAULT_ERROR_STATUS, retry_after: Optional[float] = None):
+        """
+        port: 0이면 빈 포트 자동 선택
+        latency_ms / jitter_ms: 응답마다 latency_ms + [0, jitter_ms) 만큼 대기
+        error_rate: API 요청 중 이 비율만큼 error_status로 응답 (로그인 제외)
+        retry_after: 주입한 에러 응답에 붙일 Retry-After 헤더(초, None이면 붙이지 않음)
+        list_items: 목록 응답 항목 수 (None이면 요청의 limit), pad_bytes: 레코드마다 붙이는 메모 필드 크기
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate는 0 ~ 1 사이여야 합니다")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.list_items = list_items
+        self.pad_bytes = pad_bytes
+        self.random = random.Random(seed)
+        self.records: Dict[str, Dict[str, Dict]] = {resource: {} for resource in MOCK_RESOURCES}
+        self.requests = 0
+        self.injected_errors = 0
+        self._lock = threading.Lock()
+        self._list_cache: Dict[Tuple[str, int], bytes] = {}
+        self._server = ThreadingHTTPServer((host, port), MockRequestHandler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_args(cls, args, host: str = "127.0.0.1", port: int = 0) -> "MockApiServer":
+        """add_mock_arguments로 추가한 CLI 옵션으로 생성"""
+        return cls(host=host, port=port, latency_ms=args.mock_latency_ms, jitter_ms=args.mock_jitter_ms,
+                   error_rate=args.mock_error_rate, list_items=args.mock_list_items, pad_bytes=args.mock_pad_bytes,
+                   seed=args.mock_seed, error_status=args.mock_error_status, retry_after=args.mock_retry_after)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """백그라운드 스레드에서 서버 시작, base_url 반환"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-server", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self):
+        """현재 스레드에서 실행 (단독 실행용)"""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def delay(self):
+        """설정된 응답 지연만큼 대기"""
+        delay_ms = self.latency_ms
+        if self.jitter_ms:
+            delay_ms += self.random.random() * self.jitter_ms
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def should_fail(self) -> bool:
+        if not self.error_rate or self.random.random() >= self.error_rate:
+            return False
+        with self._lock:
+            self.injected_errors += 1
+        return True
+
+    def new_record(self, resource: str, data: Dict) -> Dict:
+        """생성 요청 본문 + id / tenant_id / 타임스탬프 (+ 패딩)"""
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        record = {key: value for key, value in data.items() if key != "tenantId"}
+        record.update({"id": str(uuid.uuid4()), "tenant_id": MOCK_TENANT_ID, "created_at": now, "updated_at": now})
+        if self.pad_bytes:
+            record["notes"] = "x" * self.pad_bytes
+        records = self.records[resource]
+        with self._lock:
+            if len(records) >= MAX_RECORDS:
+                records.pop(next(iter(records)))
+            records[record["id"]] = record
+        return record
+
+    def list_body(self, resource: str, limit: int) -> bytes:
+        """목록 응답 본문 (같은 항목 수면 직렬화 결과를 재사용해 서버가 병목이 되지 않도록 함)"""
+        count = self.list_items if self.list_items is not None else limit
+        key = (resource, count)
+        body = self._list_cache.get(key)
+        if body is None:
+            list_key, _ = MOCK_RESOURCES[resource]
+            items = []
+            for index in range(count):
+                item = {"id": str(uuid.UUID(int=index + 1)), "tenant_id": MOCK_TENANT_ID,
+                        "name": f"MOCK_{resource}_{index + 1:04d}", "status": "active"}
+                if self.pad_bytes:
+                    item["notes"] = "x" * self.pad_bytes
+                items.append(item)
+            body = json.dumps({
+                list_key: items,
+                "pagination": {"page": 1, "limit": limit, "total": count, "has_more": False},
+            }, ensure_ascii=False).encode("utf-8")
+            self._list_cache[key] = body
+        return body
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive (테스터 커넥션 풀 재사용)
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 stderr 출력하지 않음
+
+    @property
+    def mock(self) -> MockApiServer:
+        return self.server.mock
+
+    def _send_body(self, status: int, body: bytes, headers: Dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send(self, status: int, payload: Dict, headers: Dict = None):
+        self._send_body(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"), headers)
+
+    def _read_json(self) -> Optional[Dict]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not raw:
+            return {}
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _authorized(self) -> bool:
+        header = self.headers.get("Authorization") or ""
+        return header.startswith(f"Bearer {MOCK_TOKEN_PREFIX}")
+
+    def _handle(self, method: str):
+        mock = self.mock
+        mock.count_request()
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        body = self._read_json() if method in ("POST", "PUT") else {}
+        mock.delay()
+
+        if not parts:
+            return self._send(200, {"status": "ok", "mock": True})
+        if parts[0] != "api":
+            return self._send(404, {"error": "Not found"})
+        if body is None:
+            return self._send(400, {"error": "Invalid JSON body"})
+        if parts[1:] == ["auth", "login"] and method == "POST":
+            return self._login(body)
+        if len(parts) not in (2, 3) or parts[1] not in MOCK_RESOURCES:
+            return self._send(404, {"error": "Not found"})
+        if not self._authorized():
+            return self._send(401, {"error": "Unauthorized"})
+        if mock.should_fail():
+            headers = {"Retry-After": f"{mock.retry_after:g}"} if mock.retry_after is not None else None
+            return self._send(mock.error_status, {"error": "Injected error (mock)"}, headers)
+
+        resource = parts[1]
+        record_id = parts[2] if len(parts) == 3 else None
+        if record_id is None:
+            if method == "GET":
+                try:
+                    limit = int(parse_qs(url.query).get("limit", [DEFAULT_LIST_LIMIT])[0])
+                except ValueError:
+                    return self._send(400, {"error": "limit은 정수여야 합니다"})
+                return self._send_body(200, mock.list_body(resource, limit))
+            if method == "POST":
+                _, item_key = MOCK_RESOURCES[resource]
+                return self._send(200, {item_key: mock.new_record(resource, body)})
+            return self._send(405, {"error": "Method not allowed"})
+        return self._item(method, resource, record_id, body)
+
+    def _login(self, body: Dict):
+        if not body.get("email") or not body.get("password"):
+            return self._send(400, {"error": "이메일과 비밀번호를 입력해주세요"})
+        return self._send(200, {
+            "access_token": f"{MOCK_TOKEN_PREFIX}{uuid.uuid4().hex}",
+            "expires_in": MOCK_TOKEN_TTL,
+            "user": {"id": str(uuid.uuid4()), "email": body["email"], "tenant_id": MOCK_TENANT_ID, "role": "admin"},
+        })
+
+    def _item(self, method: str, resource: str, record_id: str, body: Dict):
+        records = self.mock.records[resource]
+        _, item_key = MOCK_RESOURCES[resource]
+        record = records.get(record_id)
+        if record is None:
+            return self._send(404, {"error": f"{item_key} not found"})
+        if method == "GET":
+            return self._send(200, {item_key: record})
+        if method == "PUT":
+            record.update({key: value for key, value in body.items() if key not in ("id", "tenantId")})
+            record["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            return self._send(200, {item_key: record})
+        if method == "DELETE":
+            records.pop(record_id, None)
+            return self._send(200, {"success": True, "message": f"{item_key} deleted"})
+        return self._send(405, {"error": "Method not allowed"})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+def add_mock_arguments(parser):
+    """대역 서버 조절 옵션 (단독 실행 / 테스터 --mock 공용)"""
+    parser.add_argument("--mock-latency-ms", type=float, default=0.0, help="대역 서버 응답 지연(ms)")
+    parser.add_argument("--mock-jitter-ms", type=float, default=0.0, help="응답 지연에 더할 무작위 지연 최대값(ms)")
+    parser.add_argument("--mock-error-rate", type=float, default=0.0,
+                        help="API 요청 중 에러로 응답할 비율 (0 ~ 1, 로그인 제외)")
+    parser.add_argument("--mock-error-status", type=int, default=DEFAULT_ERROR_STATUS,
+                        help="주입할 에러 상태코드 (예: 429, 503)")
+    parser.add_argument("--mock-retry-after", type=float, default=None,
+                        help="주입한 에러 응답의 Retry-After 헤더(초)")
+    parser.add_argument("--mock-list-items", type=int, default=None,
+                        help="목록 응답 항목 수 (기본: 요청의 limit)")
+    parser.add_argument("--mock-pad-bytes", type=int, default=0, help="레코드마다 붙일 메모 필드 크기(바이트)")
+    parser.add_argument("--mock-seed", type=int, default=42, help="지연 / 에러 주입 난수 시드")
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EduCanvas API 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=3001, help="포트 (테스터 기본 BASE_URL과 같은 3001)")
+    add_mock_arguments(parser)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        server = MockApiServer.from_args(args, host=args.host, port=args.port)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: 대역 서버를 시작할 수 없습니다: {e}")
+        exit(2)
+    print(f"[{time.strftime('%H:%M:%S')}] INFO: 대역 서버 실행 중: {server.base_url} (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"[{time.strftime('%H:%M:%S')}] INFO: 종료 - 요청 {server.requests}건, 주입한 에러 {server.injected_errors}건")
+    exit(0)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 개방형(open-loop) 부하 테스트
+응답 완료 여부와 무관하게 목표 도착률(req/s)로 요청을 발사하고, 응답 시간을 실제 발사 시각이 아닌
+예정 발사 시각부터 측정해 coordinated omission(서버가 느려지면 요청이 덜 나가 대기 지연이 가려지는 현상)을 보정
+계단식 램프(--ramp)로 p99가 SLO를 넘기 시작하는 도착률을 찾음
+
+사용법:
+    python open_loop.py --rate 200 --duration 60
+    python open_loop.py --ramp 50:400:50 --step-duration 30 --slo-p99-ms 500
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from buffered_log import LOGGER
+from load_metrics import LatencyHistogram, LoadMetrics, route_key
+
+DEFAULT_ENDPOINT = "/api/students/search?search=김&limit=20"
+DEFAULT_WORKERS = 64
+DEFAULT_SLO_P99_MS = 500.0
+DEFAULT_MAX_ERROR_RATE = 0.01
+
+# 발사 지연(예정 시각 대비 실제 발사 시각) p99가 요청 간격의 이 배수를 넘으면 워커 부족으로 경고
+SEND_LAG_WARN_INTERVALS = 2
+
+
+def parse_ramp(spec: str) -> List[float]:
+    """"start:stop:step" 형식의 램프 지정을 도착률 목록으로 변환 (stop 포함)"""
+    try:
+        start, stop, step = (float(part) for part in spec.split(":"))
+    except ValueError:
+        raise ValueError(f"램프 형식은 start:stop:step 이어야 합니다: {spec}")
+    if start <= 0 or step <= 0 or stop < start:
+        raise ValueError(f"잘못된 램프 범위: {spec}")
+    rates = []
+    rate = start
+    while rate <= stop + 1e-9:
+        rates.append(rate)
+        rate += step
+    return rates
+
+
+class OpenLoopScheduler:
+    def __init__(self, tester, tester_factory: Callable, method: str = "GET", endpoint: str = DEFAULT_ENDPOINT,
+                 data: Dict = None, expected_status: int = 200, workers: int = DEFAULT_WORKERS):
+        """
+        tester: 로그인된 테스터 (워커 테스터들이 토큰 / 테넌트를 공유)
+        tester_factory: 워커마다 새 테스터 인스턴스를 만드는 함수 (워커별 세션)
+        workers: 동시에 처리할 수 있는 요청 수 상한, 부족하면 발사 지연이 보정 응답 시간에 포함됨
+        """
+        self.tester = tester
+        self.tester_factory = tester_factory
+        self.method = method.upper()
+        self.endpoint = endpoint
+        self.data = data
+        self.expected_status = expected_status
+        self.workers = workers
+        self.stop_event = threading.Event()
+        self.results: List[Dict] = []
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def _worker_tester(self, service_metrics: LoadMetrics):
+        worker = self.tester_factory()
+        worker.verbose = False
+        worker.metrics = service_metrics
+        worker.set_access_token(self.tester.access_token)
+        worker.tenant_id = self.tester.tenant_id
+        return worker
+
+    def _worker(self, tester, pending: "queue.Queue", corrected: LoadMetrics,
+                send_lag: LatencyHistogram, lag_lock: threading.Lock):
+        """예정 시각을 받아 요청 1건 실행, 응답 시간은 예정 시각부터 측정해 기록"""
+        while True:
+            intended = pending.get()
+            if intended is None:
+                return
+            if self.stop_event.is_set():
+                continue
+            sent = time.perf_counter()
+            with lag_lock:
+                send_lag.record_seconds(max(sent - intended, 0.0))
+            tester.test_api_endpoint(self.method, self.endpoint, self.data, self.expected_status)
+            call = tester.last_call
+            latency = time.perf_counter() - intended if call["status"] is not None else None
+            corrected.record(self.method, self.endpoint, call["status"], latency, call["bytes"])
+
+    def run_step(self, rate: float, duration: float) -> Dict:
+        """도착률 rate(req/s)로 duration초 동안 발사하고 보정 / 서비스 응답 시간 요약 반환"""
+        corrected = LoadMetrics()
+        service = LoadMetrics()
+        send_lag = LatencyHistogram()
+        lag_lock = threading.Lock()
+        pending: "queue.Queue" = queue.Queue()
+
+        threads = [
+            threading.Thread(target=self._worker, name=f"open-loop-{i}", daemon=True,
+                             args=(self._worker_tester(service), pending, corrected, send_lag, lag_lock))
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        interval = 1.0 / rate
+        corrected.start()
+        service.start()
+        started = time.perf_counter()
+        deadline = started + duration
+        sent = 0
+        # 발사 시각은 완료와 무관하게 고정 (started + i * interval)
+        while not self.stop_event.is_set():
+            intended = started + sent * interval
+            if intended >= deadline:
+                break
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pending.put(intended)
+            sent += 1
+        for _ in threads:
+            pending.put(None)
+        for thread in threads:
+            thread.join()
+        corrected.stop()
+        service.stop()
+
+        result = self._summarize(rate, duration, sent, corrected, service, send_lag)
+        self.results.append(result)
+        return result
+
+    def _summarize(self, rate: float, duration: float, sent: int, corrected: LoadMetrics,
+                   service: LoadMetrics, send_lag: LatencyHistogram) -> Dict:
+        key = route_key(self.method, self.endpoint)
+        corrected_stats = corrected.endpoints.get(key)
+        service_stats = service.endpoints.get(key)
+        latency = corrected_stats.latency if corrected_stats else LatencyHistogram()
+        service_latency = service_stats.latency if service_stats else LatencyHistogram()
+        completed = corrected_stats.requests if corrected_stats else 0
+        errors = corrected_stats.errors if corrected_stats else 0
+        return {
+            "rate": rate,
+            "duration_s": duration,
+            "sent": sent,
+            "completed": completed,
+            "errors": errors,
+            "error_rate": errors / completed if completed else 0.0,
+            "achieved_rps": completed / corrected.elapsed,
+            "p50_ms": latency.percentile(50) / 1000,
+            "p95_ms": latency.percentile(95) / 1000,
+            "p99_ms": latency.percentile(99) / 1000,
+            "max_ms": (latency.max or 0) / 1000,
+            "service_p99_ms": service_latency.percentile(99) / 1000,
+            "send_lag_p99_ms": send_lag.percentile(99) / 1000,
+        }
+
+    def meets_slo(self, result: Dict, slo_p99_ms: float, max_error_rate: float) -> bool:
+        return result["completed"] > 0 and result["p99_ms"] <= slo_p99_ms and result["error_rate"] <= max_error_rate
+
+    def ramp(self, rates: List[float], step_duration: float, slo_p99_ms: float,
+             max_error_rate: float = DEFAULT_MAX_ERROR_RATE) -> Optional[float]:
+        """
+        도착률을 계단식으로 올리며 각 단계를 실행, 처음으로 SLO를 넘는 단계에서 중단
+        반환: SLO를 지킨 최대 도착률 (첫 단계부터 넘으면 None)
+        """
+        sustainable = None
+        for rate in rates:
+            self.log(f"=== {rate:g} req/s x {step_duration:g}초 ===")
+            result = self.run_step(rate, step_duration)
+            result["slo_ok"] = self.meets_slo(result, slo_p99_ms, max_error_rate)
+            self.log(f"   p99 {result['p99_ms']:.1f}ms (서비스 {result['service_p99_ms']:.1f}ms), "
+                     f"처리 {result['achieved_rps']:.1f} req/s, 에러 {result['error_rate'] * 100:.1f}%")
+            self.warn_send_lag(result)
+            if self.stop_event.is_set():
+                break
+            if not result["slo_ok"]:
+                self.log(f"{rate:g} req/s에서 SLO(p99 {slo_p99_ms:g}ms, 에러 {max_error_rate * 100:g}%) 초과", "WARN")
+                break
+            sustainable = rate
+        return sustainable
+
+    def warn_send_lag(self, result: Dict):
+        interval_ms = 1000.0 / result["rate"]
+        if result["send_lag_p99_ms"] > interval_ms * SEND_LAG_WARN_INTERVALS:
+            self.log(f"   발사 지연 p99 {result['send_lag_p99_ms']:.1f}ms - 워커가 부족해 클라이언트 대기열이 생겼을 수 있습니다 "
+                     f"(--workers를 {self.workers}보다 늘려 재측정)", "WARN")
+
+    def format_report(self) -> str:
+        """단계별 결과 표 (P50~MAX: 예정 발사 시각 기준 보정 응답 시간, SVC_P99: 실제 발사 기준)"""
+        lines = [
+            f"{'RATE':>7} {'SENT':>7} {'DONE':>7} {'RPS':>8} {'ERR%':>6} {'P50':>8} {'P95':>8} {'P99':>8} "
+            f"{'MAX':>8} {'SVC_P99':>8} {'LAG_P99':>8}  SLO",
+            "-" * 104,
+        ]
+        for r in self.results:
+            slo = "-" if "slo_ok" not in r else ("ok" if r["slo_ok"] else "BREACH")
+            lines.append(
+                f"{r['rate']:>7g} {r['sent']:>7} {r['completed']:>7} {r['achieved_rps']:>8.1f} "
+                f"{r['error_rate'] * 100:>5.1f}% {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+                f"{r['max_ms']:>8.1f} {r['service_p99_ms']:>8.1f} {r['send_lag_p99_ms']:>8.1f}  {slo}"
+            )
+        return "\n".join(lines)
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EduCanvas API 개방형(고정 도착률) 부하 테스트")
+    parser.add_argument("--endpoint", default=DEFAULT_ENDPOINT,
+                        help="요청 경로 (tenantId는 자동 추가)")
+    parser.add_argument("--method", default="GET", help="HTTP 메서드")
+    rate_group = parser.add_mutually_exclusive_group()
+    rate_group.add_argument("--rate", type=float, default=200.0, help="고정 도착률 (req/s)")
+    rate_group.add_argument("--ramp", default=None,
+                            help="계단식 램프 start:stop:step (req/s), 예: 50:400:50")
+    parser.add_argument("--duration", type=float, default=60.0, help="고정 도착률 실행 시간(초)")
+    parser.add_argument("--step-duration", type=float, default=30.0, help="램프 단계별 실행 시간(초)")
+    parser.add_argument("--slo-p99-ms", type=float, default=DEFAULT_SLO_P99_MS, help="p99 SLO (ms)")
+    parser.add_argument("--max-error-rate", type=float, default=DEFAULT_MAX_ERROR_RATE,
+                        help="SLO 판정 허용 에러율 (0~1)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 요청 워커 수")
+    parser.add_argument("--results", default=None, help="단계별 결과 저장 경로 (.json)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    import json
+
+    from test_authenticated_crud import AuthenticatedCRUDTester
+
+    args = parse_args()
+    try:
+        rates = parse_ramp(args.ramp) if args.ramp else None
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        exit(2)
+
+    tester = AuthenticatedCRUDTester(verbose=False)
+    if not tester.login():
+        exit(1)
+    endpoint = args.endpoint
+    if tester.tenant_id and "tenantId=" not in endpoint:
+        endpoint += ("&" if "?" in endpoint else "?") + f"tenantId={tester.tenant_id}"
+
+    scheduler = OpenLoopScheduler(tester, lambda: AuthenticatedCRUDTester(verbose=False),
+                                  method=args.method, endpoint=endpoint, workers=args.workers)
+    scheduler.log(f"개방형 부하 테스트: {args.method.upper()} {endpoint}, 워커 {args.workers}개")
+    sustainable = None
+    try:
+        if rates:
+            sustainable = scheduler.ramp(rates, args.step_duration, args.slo_p99_ms, args.max_error_rate)
+            success = sustainable is not None
+        else:
+            result = scheduler.run_step(args.rate, args.duration)
+            result["slo_ok"] = scheduler.meets_slo(result, args.slo_p99_ms, args.max_error_rate)
+            scheduler.warn_send_lag(result)
+            success = result["slo_ok"]
+    except KeyboardInterrupt:
+        scheduler.log("중단 요청 - 대기 중인 요청은 건너뛰고 종료합니다", "WARN")
+        scheduler.stop_event.set()
+        success = False
+
+    LOGGER.write(scheduler.format_report())
+    if rates:
+        if sustainable is not None:
+            scheduler.log(f"p99 SLO({args.slo_p99_ms:g}ms)를 지킨 최대 도착률: {sustainable:g} req/s")
+        else:
+            scheduler.log(f"첫 단계({rates[0]:g} req/s)부터 SLO를 넘었습니다", "WARN")
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(scheduler.results, f, ensure_ascii=False, indent=2)
+    exit(0 if success else 1)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+EduCanvas 목록 API 페이지네이션 벤치마크
+목록 엔드포인트의 전체 페이지(커서 체인 또는 limit/offset)를 페이지 크기별로 순회하며
+페이지당 응답 시간, 전체 소요 시간, 전송 바이트를 측정하고 깊이에 따라 느려지는 페이지를 표시
+
+사용법:
+    python pagination_bench.py --page-sizes 10,20,50,100
+    python pagination_bench.py --endpoints students,classes --max-pages 200
+"""
+
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+from buffered_log import LOGGER
+from test_authenticated_crud import AuthenticatedCRUDTester
+
+# 이름 -> (엔드포인트, 응답 목록 키, 페이지 지정 방식)
+# offset: limit/offset (커서를 주면 커서 체인), page: page=n을 보내고 pagination.totalPages에서 멈춤
+LIST_ENDPOINTS = {
+    "students": ("/api/students", "students", "offset"),
+    "classes": ("/api/classes", "classes", "offset"),
+    "enrollments": ("/api/enrollments", "enrollments", "offset"),
+    "salary-policies": ("/api/salary-policies", "salary_policies", "offset"),
+    "staff": ("/api/staff", "instructors", "page"),  # offset을 무시함
+}
+
+DEFAULT_PAGE_SIZES = [10, 20, 50, 100]
+DEFAULT_MAX_PAGES = 500
+
+# 깊이 저하 판정: 앞쪽 페이지 중앙값 대비 이 배수 이상 느린 페이지를 표시
+DEPTH_SLOWDOWN_RATIO = 1.5
+# 앞쪽 기준 페이지 수 / 추세 판정 최소 페이지 수
+BASELINE_PAGES = 3
+MIN_TREND_PAGES = 6
+
+
+def extract_page(response: Dict, list_key: str) -> Tuple[List, Optional[str], Optional[bool]]:
+    """
+    목록 응답에서 (항목, 다음 커서, has_more / hasMore) 추출
+    표준 응답({data: {items, pagination}})과 {list_key: [...], next_cursor} 형태 모두 지원
+    """
+    data = response.get("data") if isinstance(response.get("data"), dict) else {}
+    items = data.get("items")
+    if items is None:
+        items = response.get(list_key, data.get(list_key, []))
+    pagination = data.get("pagination") or response.get("pagination") or {}
+    cursor = pagination.get("cursor") or pagination.get("next_cursor") or response.get("next_cursor")
+    # /api/enrollments, /api/salary-policies는 camelCase(hasMore)
+    has_more = next((source[key] for source in (pagination, response) for key in ("has_more", "hasMore")
+                     if source.get(key) is not None), None)
+    return items or [], cursor, has_more
+
+
+def total_pages(response: Dict) -> Optional[int]:
+    """page 방식 응답의 전체 페이지 수 (pagination.totalPages / total_pages), 없으면 None"""
+    data = response.get("data") if isinstance(response.get("data"), dict) else {}
+    pagination = data.get("pagination") or response.get("pagination") or {}
+    for key in ("totalPages", "total_pages"):
+        if isinstance(pagination.get(key), int):
+            return pagination[key]
+    return None
+
+
+def depth_trend(latencies: List[float]) -> float:
+    """페이지 순번에 대한 응답 시간 최소제곱 기울기 (초/페이지)"""
+    n = len(latencies)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2
+    mean_y = sum(latencies) / n
+    numerator = sum((i - mean_x) * (y - mean_y) for i, y in enumerate(latencies))
+    denominator = sum((i - mean_x) ** 2 for i in range(n))
+    return numerator / denominator
+
+
+class PaginationBenchmark:
+    def __init__(self, tester: AuthenticatedCRUDTester, max_pages: int = DEFAULT_MAX_PAGES):
+        self.tester = tester
+        self.max_pages = max_pages
+        self.results: List[Dict] = []
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def walk(self, name: str, page_size: int) -> Dict:
+        """한 엔드포인트의 전체 페이지를 순회 (커서가 있으면 커서, 없으면 offset 또는 page 번호 사용)"""
+        endpoint, list_key, paging = LIST_ENDPOINTS[name]
+        base_params = f"limit={page_size}"
+        if self.tester.tenant_id:
+            base_params += f"&tenantId={self.tester.tenant_id}"
+
+        pages = []
+        cursor = None
+        offset = 0
+        page = 1
+        mode = paging
+        started = time.perf_counter()
+        while len(pages) < self.max_pages:
+            if cursor:
+                params = f"{base_params}&cursor={cursor}"
+            elif paging == "page":
+                params = f"{base_params}&page={page}"
+            else:
+                params = f"{base_params}&offset={offset}"
+            response = self.tester.test_api_endpoint("GET", f"{endpoint}?{params}")
+            call = self.tester.last_call
+            if "error" in response:
+                self.log(f"{name} 페이지 {len(pages) + 1} 조회 실패: {response['error']}", "ERROR")
+                break
+
+            items, next_cursor, has_more = extract_page(response, list_key)
+            pages.append({"latency": call["elapsed"], "bytes": call["bytes"], "items": len(items)})
+
+            if next_cursor:
+                mode = "cursor"
+                if has_more is False:
+                    break
+                cursor = next_cursor
+            elif cursor or has_more is False or not items:
+                break
+            elif paging == "page":
+                last_page = total_pages(response)
+                if last_page is not None and page >= last_page or last_page is None and len(items) < page_size:
+                    break
+                page += 1
+            elif len(items) < page_size:
+                break
+            else:
+                offset += page_size
+        total_time = time.perf_counter() - started
+
+        result = self._summarize(name, page_size, mode, pages, total_time)
+        self.results.append(result)
+        return result
+
+    def _summarize(self, name: str, page_size: int, mode: str, pages: List[Dict], total_time: float) -> Dict:
+        latencies = [page["latency"] for page in pages]
+        baseline = statistics.median(latencies[:BASELINE_PAGES]) if latencies else 0.0
+        slow_pages = [
+            index + 1 for index, latency in enumerate(latencies)
+            if index >= BASELINE_PAGES and baseline > 0 and latency >= baseline * DEPTH_SLOWDOWN_RATIO
+        ]
+        slope = depth_trend(latencies)
+        tail = latencies[-BASELINE_PAGES:]
+        grows_with_depth = (
+            len(latencies) >= MIN_TREND_PAGES and slope > 0 and baseline > 0
+            and statistics.median(tail) >= baseline * DEPTH_SLOWDOWN_RATIO
+        )
+        total_bytes = sum(page["bytes"] for page in pages)
+        total_items = sum(page["items"] for page in pages)
+        return {
+            "endpoint": name,
+            "page_size": page_size,
+            "mode": mode,
+            "pages": len(pages),
+            "items": total_items,
+            "total_s": total_time,
+            "mean_page_ms": statistics.mean(latencies) * 1000 if latencies else 0.0,
+            "max_page_ms": max(latencies) * 1000 if latencies else 0.0,
+            "bytes": total_bytes,
+            "bytes_per_item": total_bytes / total_items if total_items else 0.0,
+            "slope_ms_per_page": slope * 1000,
+            "slow_pages": slow_pages,
+            "grows_with_depth": grows_with_depth,
+            "page_latencies_ms": [round(latency * 1000, 2) for latency in latencies],
+        }
+
+    def run(self, names: List[str], page_sizes: List[int]) -> bool:
+        """엔드포인트 x 페이지 크기 조합을 모두 순회하고 리포트 출력, 깊이 저하가 없으면 True"""
+        for name in names:
+            for page_size in page_sizes:
+                self.log(f"=== {name} 전체 페이지 순회 (limit={page_size}) ===")
+                result = self.walk(name, page_size)
+                self.log(f"   {result['pages']}페이지 / {result['items']}건, {result['total_s']:.2f}초 ({result['mode']})")
+                if result["grows_with_depth"]:
+                    self.log(f"   깊이에 따라 응답 시간 증가: 느린 페이지 {result['slow_pages'][:10]}", "WARN")
+        LOGGER.write(self.format_report())
+        return not any(result["grows_with_depth"] for result in self.results)
+
+    def format_report(self) -> str:
+        """엔드포인트 / 페이지 크기별 결과 표"""
+        lines = [
+            f"{'ENDPOINT':<16} {'LIMIT':>5} {'MODE':<6} {'PAGES':>6} {'ITEMS':>7} {'TOTAL_S':>8} "
+            f"{'MS/PAGE':>8} {'MAX_MS':>8} {'KB':>9} {'B/ITEM':>7} {'SLOPE':>7}  DEPTH",
+            "-" * 111,
+        ]
+        for r in self.results:
+            depth = f"GROWS ({len(r['slow_pages'])} slow)" if r["grows_with_depth"] else "ok"
+            lines.append(
+                f"{r['endpoint']:<16} {r['page_size']:>5} {r['mode']:<6} {r['pages']:>6} {r['items']:>7} "
+                f"{r['total_s']:>8.2f} {r['mean_page_ms']:>8.1f} {r['max_page_ms']:>8.1f} "
+                f"{r['bytes'] / 1024:>9.1f} {r['bytes_per_item']:>7.0f} {r['slope_ms_per_page']:>7.2f}  {depth}"
+            )
+        return "\n".join(lines)
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EduCanvas 목록 API 페이지네이션 벤치마크")
+    parser.add_argument("--endpoints", default=",".join(LIST_ENDPOINTS),
+                        help=f"순회할 엔드포인트 (쉼표 구분, 기본: 전체 {', '.join(LIST_ENDPOINTS)})")
+    parser.add_argument("--page-sizes", default=",".join(str(size) for size in DEFAULT_PAGE_SIZES),
+                        help="페이지 크기 목록 (쉼표 구분)")
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="엔드포인트당 최대 페이지 수")
+    parser.add_argument("--results", default=None, help="페이지별 결과 저장 경로 (.json)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    import json
+
+    args = parse_args()
+    names = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in names if name not in LIST_ENDPOINTS]
+    if unknown:
+        print(f"ERROR: 알 수 없는 엔드포인트: {', '.join(unknown)}")
+        exit(2)
+
+    tester = AuthenticatedCRUDTester(verbose=False)
+    if not tester.login():
+        exit(1)
+    benchmark = PaginationBenchmark(tester, max_pages=args.max_pages)
+    success = benchmark.run(names, [int(size) for size in args.page_sizes.split(",")])
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(benchmark.results, f, ensure_ascii=False, indent=2)
+    exit(0 if success else 1)
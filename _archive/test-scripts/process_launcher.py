@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 멀티프로세스 부하 테스트 실행기
+단일 프로세스는 JSON 디코딩 / 로그 출력으로 API보다 먼저 CPU 한계에 도달하므로
+가상 사용자를 CPU 코어당 1개의 워커 프로세스로 나눠 실행하고, 워커별 히스토그램과 카운터를 합쳐 하나의 리포트로 출력
+각 워커의 가상 사용자는 LoadRunner와 동일하게 자기 세션으로 각자 로그인
+"""
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from load_runner import LoadRunner
+
+
+def split_users(users: int, processes: int) -> List[int]:
+    """가상 사용자 수를 워커 수만큼 최대한 고르게 분배 (0명인 워커는 제외)"""
+    base, extra = divmod(users, processes)
+    shares = [base + (1 if index < extra else 0) for index in range(processes)]
+    return [share for share in shares if share > 0]
+
+
+def _run_worker(tester_factory: Callable, users: int, duration: Optional[float], iterations: Optional[int],
+                engine_kind: str, max_concurrency: int, credential_pool=None) -> Dict:
+    """워커 프로세스 진입점: LoadRunner를 실행하고 집계값을 dict로 반환 (리포트는 부모가 출력)"""
+    from http_engine import create_engine
+
+    engine = create_engine(engine_kind, max_concurrency=max_concurrency)
+    try:
+        if engine is not None:
+            tester_factory = functools.partial(tester_factory, engine=engine)
+        # 상태 줄은 워커마다 그리면 겹치므로 끔 (집계는 부모가 합쳐서 출력)
+        runner = LoadRunner(tester_factory, users=users, duration=duration, iterations=iterations,
+                            credential_pool=credential_pool, live=False)
+        runner.run(report=False)
+    finally:
+        if engine is not None:
+            engine.close()
+    return {
+        "pid": os.getpid(),
+        "users": users,
+        "metrics": runner.metrics.to_dict(),
+        "login_failures": runner.login_failures,
+        "flow_runs": runner.flow_runs,
+        "flow_failures": runner.flow_failures,
+    }
+
+
+class ProcessLauncher(LoadRunner):
+    def __init__(self, tester_factory: Callable, users: int = 10, duration: Optional[float] = None,
+                 iterations: Optional[int] = None, processes: Optional[int] = None,
+                 engine_kind: str = "sync", max_concurrency: int = 200, credential_pool=None):
+        """
+        tester_factory: 워커 프로세스로 전달되므로 pickle 가능해야 함 (예: functools.partial(AuthenticatedCRUDTester, ...))
+        processes: 워커 프로세스 수 (기본: CPU 코어 수)
+        engine_kind / max_concurrency: 워커마다 새로 만들 HTTP 엔진 설정 (엔진은 프로세스 간 공유 불가)
+        credential_pool: 로그인을 마친 풀을 워커로 복사해 전달 (워커는 로그인 없이 캐시된 토큰 사용)
+        """
+        super().__init__(tester_factory, users=users, duration=duration, iterations=iterations,
+                         credential_pool=credential_pool)
+        self.processes = processes or os.cpu_count() or 1
+        self.engine_kind = engine_kind
+        self.max_concurrency = max_concurrency
+        self.worker_failures = 0
+
+    def _merge(self, result: Dict):
+        self.metrics.merge_dict(result["metrics"])
+        self.login_failures += result["login_failures"]
+        self.flow_runs += result["flow_runs"]
+        self.flow_failures += result["flow_failures"]
+
+    def run(self, report: bool = True) -> bool:
+        """워커 프로세스들을 실행하고 결과를 합쳐 리포트 출력, 에러가 없으면 True"""
+        shares = split_users(self.users, self.processes)
+        self.log(f"멀티프로세스 부하 테스트: 워커 {len(shares)}개, 가상 사용자 {self.users}명 (워커당 {shares})")
+
+        with ProcessPoolExecutor(max_workers=len(shares)) as executor:
+            futures = [
+                executor.submit(_run_worker, self.tester_factory, share, self.duration, self.iterations,
+                                self.engine_kind, self.max_concurrency, self.credential_pool)
+                for share in shares
+            ]
+            while True:
+                try:
+                    wait(futures)
+                    break
+                except KeyboardInterrupt:
+                    # 워커들도 SIGINT를 받아 진행 중인 요청을 마치고 집계값을 반환함
+                    self.log("중단 요청 - 워커들이 진행 중인 요청을 마치면 결과를 합칩니다", "WARN")
+
+        for future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                self.worker_failures += 1
+                self.log(f"워커 프로세스 실패: {str(e)}", "ERROR")
+                continue
+            self._merge(result)
+
+        if report:
+            self.print_report()
+            if self.worker_failures:
+                self.log(f"워커 {self.worker_failures}개가 실패해 결과에서 제외되었습니다", "WARN")
+        total_errors = sum(stats.errors for stats in self.metrics.endpoints.values())
+        return self.worker_failures == 0 and self.login_failures == 0 and total_errors == 0
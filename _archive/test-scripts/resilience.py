@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 테스터용 타임아웃 / 재시도 / 서킷 브레이커
+- RouteTimeouts: 라우트별 타임아웃 ("default=10,POST /api/salary/calculate=30,/api/students=3")
+- 재시도: 지터 지수 백오프(full jitter) + 재시도 예산(원 요청 대비 비율, 토큰 버킷)으로 장애 시 재시도가 트래픽을 키우지 않도록 제한
+- CircuitBreaker: 엔드포인트(METHOD + 라우트 템플릿)별로 연속 실패가 쌓이면 일정 시간 요청을 보내지 않고 즉시 실패
+- ResilienceStats: 원 요청 / 실제 시도 / 재시도 사유 / 예산 소진 / 차단 횟수 (재시도 증폭률)
+
+재시도 대상:
+- 429: 모든 메서드 (서버가 처리 전에 거절), Retry-After 헤더가 있으면 그 시간(최대 backoff_max)만큼 대기
+- 502 / 503 / 504, 타임아웃, 연결 실패: 멱등 메서드(GET / PUT / DELETE)만 (POST는 서버에서 처리됐을 수 있음)
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from http_engine import RequestConnectionError, RequestTimeout
+from load_metrics import route_key
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_BACKOFF_BASE = 0.1
+DEFAULT_BACKOFF_MAX = 2.0
+# 원 요청 1건당 적립되는 재시도 토큰 (0.2면 정상 상태에서 재시도는 원 요청의 20%까지)
+DEFAULT_RETRY_BUDGET = 0.2
+# 재시도 토큰 초기값 / 상한 (요청이 적을 때도 이만큼은 재시도 가능)
+DEFAULT_BUDGET_RESERVE = 10.0
+DEFAULT_BREAKER_COOLDOWN = 5.0
+
+IDEMPOTENT_METHODS = frozenset(["GET", "PUT", "DELETE"])
+GATEWAY_STATUS_CODES = (502, 503, 504)
+RETRY_ERRORS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError, RequestTimeout,
+                RequestConnectionError)
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 요청을 보내지 않음"""
+
+
+class RouteTimeouts:
+    def __init__(self, default: float = DEFAULT_TIMEOUT, rules: List[Tuple[Optional[str], str, float]] = None):
+        """rules: (메서드 또는 None, 경로 접두사, 타임아웃 초) - 가장 긴 접두사, 같으면 메서드 지정 규칙 우선"""
+        self.default = default
+        self.rules = sorted(rules or [], key=lambda rule: (len(rule[1]), rule[0] is not None), reverse=True)
+
+    @classmethod
+    def parse(cls, spec: str, default: float = DEFAULT_TIMEOUT) -> "RouteTimeouts":
+        """ "default=10,POST /api/salary/calculate=30,/api/students=3" 형식 """
+        rules = []
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            target, sep, value = item.rpartition("=")
+            if not sep or not target.strip():
+                raise ValueError(f"타임아웃 형식이 잘못되었습니다: {item}")
+            seconds = float(value)
+            if seconds <= 0:
+                raise ValueError(f"타임아웃은 0보다 커야 합니다: {item}")
+            target = target.strip()
+            if target == "default":
+                default = seconds
+                continue
+            method, _, path = target.rpartition(" ")
+            rules.append((method.upper() or None, path, seconds))
+        return cls(default, rules)
+
+    def for_request(self, method: str, endpoint: str) -> float:
+        path = endpoint.split("?", 1)[0]
+        for rule_method, prefix, seconds in self.rules:
+            if path.startswith(prefix) and rule_method in (None, method.upper()):
+                return seconds
+        return self.default
+
+    def describe(self) -> str:
+        rules = [f"{method + ' ' if method else ''}{prefix}={seconds:g}s" for method, prefix, seconds in self.rules]
+        return ", ".join([f"default={self.default:g}s"] + rules)
+
+
+class RetryBudget:
+    """원 요청마다 ratio만큼 토큰을 적립하고 재시도 1회에 1개를 쓰는 토큰 버킷 (ratio가 None이면 무제한)"""
+
+    def __init__(self, ratio: Optional[float] = DEFAULT_RETRY_BUDGET, reserve: float = DEFAULT_BUDGET_RESERVE):
+        self.ratio = ratio
+        self.reserve = reserve
+        self.tokens = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        if self.ratio is None:
+            return
+        with self._lock:
+            self.tokens = min(self.reserve, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.ratio is None:
+            return True
+        with self._lock:
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class CircuitBreaker:
+    """연속 failure_threshold회 실패하면 cooldown초 동안 차단, 이후 요청 1건으로 회복 여부 확인 (half-open)"""
+
+    def __init__(self, failure_threshold: int, cooldown: float = DEFAULT_BREAKER_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = "half-open"
+                return True  # 확인용 요청 1건만 통과
+            return False
+
+    def record(self, success: bool):
+        with self._lock:
+            if success:
+                self.state = "closed"
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == "half-open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    self.opens += 1
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+class ResilienceStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self.retry_reasons: Dict[str, int] = {}
+        self.budget_exhausted = 0
+
+    def _route(self, key: Tuple[str, str]) -> Dict[str, int]:
+        stats = self.routes.get(key)
+        if stats is None:
+            stats = self.routes[key] = {"requests": 0, "attempts": 0, "retries": 0, "short_circuited": 0, "failed": 0}
+        return stats
+
+    def count(self, key: Tuple[str, str], field: str, reason: str = None):
+        with self._lock:
+            self._route(key)[field] += 1
+            if reason is not None:
+                self.retry_reasons[reason] = self.retry_reasons.get(reason, 0) + 1
+
+    def count_budget_exhausted(self):
+        with self._lock:
+            self.budget_exhausted += 1
+
+    def totals(self) -> Dict[str, int]:
+        with self._lock:
+            totals = {"requests": 0, "attempts": 0, "retries": 0, "short_circuited": 0, "failed": 0}
+            for stats in self.routes.values():
+                for field, value in stats.items():
+                    totals[field] += value
+        return totals
+
+    @staticmethod
+    def amplification(stats: Dict[str, int]) -> float:
+        """서버로 실제 보낸 시도 수 / 원 요청 수"""
+        return stats["attempts"] / stats["requests"] if stats["requests"] else 0.0
+
+
+class Resilience:
+    def __init__(self, timeouts: RouteTimeouts = None, max_retries: int = 0,
+                 backoff_base: float = DEFAULT_BACKOFF_BASE, backoff_max: float = DEFAULT_BACKOFF_MAX,
+                 retry_budget: Optional[float] = DEFAULT_RETRY_BUDGET, breaker_failures: int = 0,
+                 breaker_cooldown: float = DEFAULT_BREAKER_COOLDOWN, seed: Optional[int] = None):
+        """
+        timeouts: 라우트별 타임아웃 (None이면 모든 라우트 DEFAULT_TIMEOUT)
+        max_retries: 원 요청당 최대 재시도 횟수 (0이면 재시도 안 함)
+        retry_budget: 원 요청 대비 재시도 비율 상한 (None이면 무제한)
+        breaker_failures: 서킷을 여는 연속 실패 횟수 (0이면 서킷 브레이커 사용 안 함)
+        """
+        self.timeouts = timeouts or RouteTimeouts()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget = RetryBudget(retry_budget)
+        self.breaker_failures = breaker_failures
+        self.breaker_cooldown = breaker_cooldown
+        self.breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self.stats = ResilienceStats()
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _breaker(self, key: Tuple[str, str]) -> Optional[CircuitBreaker]:
+        if not self.breaker_failures:
+            return None
+        breaker = self.breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(key, CircuitBreaker(self.breaker_failures, self.breaker_cooldown))
+        return breaker
+
+    def _begin(self, method: str, endpoint: str) -> Tuple[str, str]:
+        key = route_key(method, endpoint)
+        self.stats.count(key, "requests")
+        breaker = self._breaker(key)
+        if breaker is not None and not breaker.allow():
+            self.stats.count(key, "short_circuited")
+            raise CircuitOpenError(f"서킷 열림: {key[0]} {key[1]}")
+        self.budget.deposit()
+        return key
+
+    def retry_reason(self, method: str, response=None, error: Exception = None) -> Optional[str]:
+        """재시도할 실패면 사유 문자열, 아니면 None"""
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if error is not None:
+            if isinstance(error, RETRY_ERRORS) and idempotent:
+                timed_out = isinstance(error, (requests.exceptions.Timeout, RequestTimeout))
+                return "timeout" if timed_out else "connection"
+            return None
+        if response.status_code == 429 or (response.status_code in GATEWAY_STATUS_CODES and idempotent):
+            return str(response.status_code)
+        return None
+
+    @staticmethod
+    def _is_failure(response, error: Exception) -> bool:
+        """서킷 브레이커 기준 실패 (응답 없음 / 429 / 5xx)"""
+        return error is not None or response.status_code == 429 or response.status_code >= 500
+
+    def backoff(self, attempt: int, response=None) -> float:
+        """attempt번째 재시도 전 대기(초): Retry-After 우선, 없으면 full jitter 지수 백오프"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass  # HTTP 날짜 형식은 무시하고 백오프 사용
+        return self.random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _next_delay(self, key: Tuple[str, str], method: str, attempt: int, response, error) -> Optional[float]:
+        """시도 결과를 기록하고 재시도할 대기 시간(초) 반환 (재시도하지 않으면 None)"""
+        self.stats.count(key, "attempts")
+        reason = self.retry_reason(method, response, error)
+        if reason is not None and attempt < self.max_retries:
+            if self.budget.withdraw():
+                self.stats.count(key, "retries", reason)
+                return self.backoff(attempt, response)
+            self.stats.count_budget_exhausted()
+        failed = self._is_failure(response, error)
+        if failed:
+            self.stats.count(key, "failed")
+        breaker = self._breaker(key)
+        if breaker is not None:
+            breaker.record(not failed)
+        return None
+
+    def call(self, method: str, endpoint: str, send: Callable):
+        """
+        send(timeout)으로 요청하고 재시도 정책 적용, 마지막 응답 반환
+        응답을 받지 못한 채 재시도가 끝나면 마지막 예외를, 서킷이 열려 있으면 CircuitOpenError를 던짐
+        """
+        key = self._begin(method, endpoint)
+        timeout = self.timeouts.for_request(method, endpoint)
+        attempt = 0
+        while True:
+            response, error = None, None
+            try:
+                response = send(timeout)
+            except Exception as e:
+                error = e
+            delay = self._next_delay(key, method, attempt, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, method: str, endpoint: str, send: Callable):
+        """call과 같음 (send(timeout)은 코루틴을 반환, 대기는 asyncio.sleep)"""
+        import asyncio
+
+        key = self._begin(method, endpoint)
+        timeout = self.timeouts.for_request(method, endpoint)
+        attempt = 0
+        while True:
+            response, error = None, None
+            try:
+                response = await send(timeout)
+            except Exception as e:
+                error = e
+            delay = self._next_delay(key, method, attempt, response, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def to_dict(self) -> Dict:
+        totals = self.stats.totals()
+        return {
+            "timeouts": self.timeouts.describe(),
+            "max_retries": self.max_retries,
+            "retry_budget": self.budget.ratio,
+            "breaker_failures": self.breaker_failures,
+            **totals,
+            "amplification": round(ResilienceStats.amplification(totals), 3),
+            "retry_reasons": dict(self.stats.retry_reasons),
+            "budget_exhausted": self.stats.budget_exhausted,
+            "breaker_opens": sum(breaker.opens for breaker in self.breakers.values()),
+        }
+
+    def format_report(self) -> str:
+        """엔드포인트별 원 요청 / 시도 / 재시도 / 차단 표"""
+        lines = [
+            f"{'METHOD':<7} {'ROUTE':<40} {'REQS':>7} {'ATTEMPTS':>9} {'RETRIES':>8} {'AMP':>6} {'FAILED':>7} "
+            f"{'BLOCKED':>8} {'BREAKER':>9}",
+            "-" * 109,
+        ]
+        for (method, route), stats in sorted(self.stats.routes.items()):
+            breaker = self.breakers.get((method, route))
+            state = f"{breaker.state}/{breaker.opens}" if breaker is not None else "-"
+            lines.append(
+                f"{method:<7} {route:<40} {stats['requests']:>7} {stats['attempts']:>9} {stats['retries']:>8} "
+                f"{ResilienceStats.amplification(stats):>6.2f} {stats['failed']:>7} {stats['short_circuited']:>8} "
+                f"{state:>9}"
+            )
+        summary = self.to_dict()
+        reasons = ", ".join(f"{reason} {count}" for reason, count in sorted(summary["retry_reasons"].items())) or "-"
+        lines.append("-" * 109)
+        lines.append(
+            f"{'TOTAL':<48} {summary['requests']:>7} {summary['attempts']:>9} {summary['retries']:>8} "
+            f"{summary['amplification']:>6.2f} {summary['failed']:>7} {summary['short_circuited']:>8} "
+            f"{summary['breaker_opens']:>9}"
+        )
+        lines.append(f"재시도 사유: {reasons} | 예산 소진으로 포기: {summary['budget_exhausted']} | 타임아웃: {summary['timeouts']}")
+        return "\n".join(lines)
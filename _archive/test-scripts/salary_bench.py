@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+EduCanvas 급여 계산 처리량 벤치마크
+월말 정산처럼 모든 강사의 급여를 한 번에 계산할 때 /api/salary/calculate의 강사 1명당 계산 지연과
+전체 정산 소요 시간이 강사 수에 따라 어떻게 늘어나는지 측정
+
+준비 단계:
+- policy_type 7종(고정 월급, 시급, 비율, 누진 비율, 학생수 기준, 혼합, 최저 보장) 정책을 1개씩 생성
+- 강사(테넌트 staff 멤버십)마다 클래스를 만들고 클래스마다 학생을 배정 / 수강등록해 이번 달 수업 이력 생성
+  (SalaryMetricsService는 created_at이 대상월인 클래스 중 학생이 있는 클래스만 집계)
+- 강사 x 대상월 조합에 정책을 번갈아 배정해 계산 요청 목록 구성
+
+수업 이력이 있는 대상월은 이번 달뿐이므로 기본은 이번 달만 측정.
+--months로 지난달을 더하거나 --persist(가상 대상월)로 실행하면 그 계산은 빈 메트릭 경로이며 리포트 EMPTY 열에 표시
+
+측정: 규모마다 순차 실행(한 명씩) / 동시 실행(--concurrency) 각각의 정산 소요 시간과 계산 1건 지연
+
+기본은 preview_mode(salary_calculations에 저장하지 않음)로 계산.
+--persist는 저장 경로까지 측정하며, 실제 급여 기록과 겹치지 않도록 대상월을 SYNTHETIC_YEAR의
+가상 월로 바꿈. 계산 결과를 지우는 API는 없으므로 정리 단계에서 DB에 직접 접속해
+(SYNTHETIC_YEAR 이후 대상월 + 이번 실행의 강사 + 실행 중 계산된 행)만 삭제 (--database-url, psycopg / psycopg2 필요)
+
+사용법:
+    python salary_bench.py --counts 5,10,25,50 --concurrency 8
+    python salary_bench.py --counts 10 --persist --database-url postgresql://...   # 계산 결과 저장 포함
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from buffered_log import LOGGER
+from load_metrics import LatencyHistogram
+from seed_data import BATCH_MOVE_LIMIT, SEED_STUDENT_TAG, SyntheticDataGenerator, extract_id, load_staff_ids
+
+# policy_type -> 정책 생성 필드 (/api/salary/policies의 타입별 필수 필드 충족)
+POLICY_TEMPLATES = {
+    "fixed_monthly": {"base_amount": 3000000},
+    "fixed_hourly": {"hourly_rate": 30000},
+    "commission": {"commission_rate": 40, "commission_basis": "revenue"},
+    "tiered_commission": {
+        "commission_basis": "revenue",
+        "tiers": [
+            {"id": "tier-1", "min_amount": 0, "max_amount": 5000000, "commission_rate": 30},
+            {"id": "tier-2", "min_amount": 5000000, "max_amount": 10000000, "commission_rate": 35},
+            {"id": "tier-3", "min_amount": 10000000, "max_amount": None, "commission_rate": 40},
+        ],
+    },
+    "student_based": {"student_rate": 50000, "min_students": 1, "max_students": 100},
+    "hybrid": {"base_amount": 1500000, "commission_rate": 20, "commission_basis": "revenue"},
+    "guaranteed_minimum": {"minimum_guaranteed": 2000000, "commission_rate": 45, "commission_basis": "revenue"},
+}
+MODES = ["sequential", "concurrent"]
+
+DEFAULT_COUNTS = "5,10,25"
+DEFAULT_MONTHS = 1
+DEFAULT_CONCURRENCY = 8
+DEFAULT_CLASSES_PER_INSTRUCTOR = 2
+DEFAULT_STUDENTS_PER_CLASS = 5
+# --persist 대상월 연도: 실제 정산 기록과 겹치지 않는 먼 미래
+SYNTHETIC_YEAR = 2099
+# 정리 SQL의 calculated_at 하한 여유 (테스터와 서버 시계 차이)
+CLOCK_SKEW = timedelta(minutes=10)
+
+# 벤치마크가 저장한 계산 결과만 삭제: 가상 대상월 + 이번 실행의 강사 + 실행 시작 이후 계산 + 미승인
+DELETE_CALCULATIONS_SQL = """
+    DELETE FROM salary_calculations
+    WHERE tenant_id = %s
+      AND membership_id = ANY(%s::uuid[])
+      AND calculation_month::text >= %s
+      AND calculated_at >= %s
+      AND status = 'calculated'
+"""
+
+
+def recent_months(count: int, today: Optional[date] = None) -> List[str]:
+    """이번 달부터 거슬러 올라간 count개의 YYYY-MM"""
+    today = today or date.today()
+    months = []
+    year, month = today.year, today.month
+    for _ in range(count):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return months
+
+
+def synthetic_months(count: int, year: int = SYNTHETIC_YEAR) -> List[str]:
+    """--persist용 가상 대상월: year년 1월부터 count개의 YYYY-MM (12개월 초과 시 다음 해로)"""
+    return [f"{year + index // 12:04d}-{index % 12 + 1:02d}" for index in range(count)]
+
+
+def _postgres_driver():
+    """psycopg(3) 또는 psycopg2 모듈, 둘 다 없으면 ImportError"""
+    try:
+        import psycopg
+        return psycopg
+    except ImportError:
+        import psycopg2
+        return psycopg2
+
+
+def delete_calculations(database_url: str, tenant_id: str, instructor_ids: List[str], since: datetime) -> int:
+    """--persist 정리: DELETE_CALCULATIONS_SQL을 직접 실행하고 삭제한 행 수 반환"""
+    connection = _postgres_driver().connect(database_url)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(DELETE_CALCULATIONS_SQL,
+                           (tenant_id, instructor_ids, str(SYNTHETIC_YEAR), since - CLOCK_SKEW))
+            deleted = cursor.rowcount
+        connection.commit()
+        return deleted
+    finally:
+        connection.close()
+
+
+def build_jobs(instructor_ids: List[str], months: List[str], policies: List[Tuple[str, str]],
+               count: int) -> List[Dict]:
+    """
+    계산 요청 count개: 강사를 먼저 돌고 대상월을 늘려 (강사, 월) 조합이 겹치지 않게 구성
+    policies: (policy_type, policy_id) 목록을 번갈아 배정
+    """
+    jobs = []
+    for month in months:
+        for instructor_id in instructor_ids:
+            if len(jobs) == count:
+                return jobs
+            policy_type, policy_id = policies[len(jobs) % len(policies)]
+            jobs.append({"instructor_id": instructor_id, "month": month,
+                         "policy_type": policy_type, "policy_id": policy_id})
+    return jobs
+
+
+class SalaryBenchmark:
+    def __init__(self, tester, tester_factory: Callable, concurrency: int = DEFAULT_CONCURRENCY,
+                 preview: bool = True, workers: int = 16):
+        """
+        tester: 로그인된 테스터 (준비 / 정리 요청), tester_factory: 동시 실행용 테스터 생성 함수
+        preview: False면 계산 결과를 salary_calculations에 저장 (teardown(database_url)에서 삭제)
+        """
+        self.tester = tester
+        self.tester_factory = tester_factory
+        self.concurrency = concurrency
+        self.preview = preview
+        self.workers = workers
+        self.instructor_ids: List[str] = []
+        self.policies: List[Tuple[str, str]] = []
+        self.class_ids: List[str] = []
+        self.student_ids: List[str] = []
+        self.enrollment_ids: List[str] = []
+        self.history_months: set = set()  # 수업 이력(학생이 있는 클래스)이 있는 대상월
+        # 저장한 계산 결과의 (강사, 대상월) - teardown()에서 삭제
+        self.calculated: set = set()
+        self._calculated_lock = threading.Lock()
+        self.started_at = datetime.now(timezone.utc)
+        self.results: List[Dict] = []
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def load_instructors(self) -> List[str]:
+        """테넌트의 강사 멤버십 ID 전체 (/api/staff 페이지 순회)"""
+        self.instructor_ids = load_staff_ids(self.tester)
+        return self.instructor_ids
+
+    def _create_all(self, endpoint: str, key: str, payloads: List[Dict]) -> List[str]:
+        def send(payload):
+            return extract_id(self.tester.test_api_endpoint("POST", endpoint, payload), key)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return [record_id for record_id in executor.map(send, payloads) if record_id]
+
+    def _assign_students(self, assignments: Dict[str, str]) -> int:
+        """/api/students/batch move_class로 학생을 클래스에 배정하고 성공한 요청 수 반환"""
+        by_class: Dict[str, List[str]] = {}
+        for student_id, class_id in assignments.items():
+            by_class.setdefault(class_id, []).append(student_id)
+        payloads = [
+            {"action": "move_class", "student_ids": student_ids[offset:offset + BATCH_MOVE_LIMIT],
+             "data": {"class_id": class_id, "reason": "salary_bench"}}
+            for class_id, student_ids in by_class.items()
+            for offset in range(0, len(student_ids), BATCH_MOVE_LIMIT)
+        ]
+
+        def send(payload):
+            return "error" not in self.tester.test_api_endpoint("POST", "/api/students/batch", payload)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return sum(executor.map(send, payloads))
+
+    def prepare(self, tag: str, classes_per_instructor: int = DEFAULT_CLASSES_PER_INSTRUCTOR, seed: int = 42,
+                students_per_class: int = DEFAULT_STUDENTS_PER_CLASS):
+        """정책 7종과 강사별 클래스 생성, 클래스마다 학생 배정 / 수강등록 (이번 달 수업 이력)"""
+        for policy_type, fields in POLICY_TEMPLATES.items():
+            # /api/salary/policies는 type 필드로 policy_type을 덮어쓰므로 두 필드를 모두 보냄
+            payload = {"name": f"급여벤치_{policy_type}_{tag}", "type": policy_type, "policy_type": policy_type,
+                       "is_active": True, **fields}
+            policy_id = extract_id(self.tester.test_api_endpoint("POST", "/api/salary/policies", payload), "policy")
+            if policy_id:
+                self.policies.append((policy_type, policy_id))
+            else:
+                self.log(f"급여 정책 생성 실패: {policy_type}", "WARN")
+
+        if self.instructor_ids and classes_per_instructor > 0:
+            generator = SyntheticDataGenerator(self.tester.tenant_id, seed=seed, tag=tag)
+            payloads = generator.classes(len(self.instructor_ids) * classes_per_instructor, self.instructor_ids)
+            self.class_ids = self._create_all("/api/classes", "class", payloads)
+            if self.class_ids and students_per_class > 0:
+                self.student_ids = self._create_all(
+                    "/api/students", "student", generator.students(len(self.class_ids) * students_per_class))
+                # 클래스마다 students_per_class명씩 고르게 배정
+                assignments = {student_id: self.class_ids[index % len(self.class_ids)]
+                               for index, student_id in enumerate(self.student_ids)}
+                if assignments and self._assign_students(assignments):
+                    self.history_months.add(recent_months(1)[0])
+                self.enrollment_ids = self._create_all(
+                    "/api/enrollments", "enrollment", generator.enrollments(assignments, [], self.class_ids, 1))
+        if not self.history_months:
+            self.log("학생이 배정된 클래스가 없어 모든 계산이 빈 메트릭 경로입니다", "WARN")
+        self.log(f"준비 완료: 정책 {len(self.policies)}/{len(POLICY_TEMPLATES)}종, "
+                 f"강사 {len(self.instructor_ids)}명, 클래스 {len(self.class_ids)}개, "
+                 f"학생 {len(self.student_ids)}명, 수강등록 {len(self.enrollment_ids)}건")
+        return bool(self.policies)
+
+    def delete_calculations(self, database_url: str) -> Optional[int]:
+        """저장한 계산 결과를 DB에서 직접 삭제, 실패하면 None (남은 행을 찾는 조건을 로그로 남김)"""
+        instructor_ids = sorted({instructor_id for instructor_id, _ in self.calculated})
+        try:
+            return delete_calculations(database_url, self.tester.tenant_id, instructor_ids, self.started_at)
+        except Exception as e:
+            self.log(f"계산 결과 삭제 실패: {e} - tenant_id={self.tester.tenant_id}, "
+                     f"calculation_month {SYNTHETIC_YEAR}년 이후, calculated_at >= {self.started_at.isoformat()} "
+                     f"행이 남아 있음", "WARN")
+            return None
+
+    def teardown(self, database_url: Optional[str] = None):
+        """저장한 계산 결과(database_url이 있을 때), prepare()로 만든 수강등록 / 학생 / 클래스 / 정책 삭제"""
+        tenant_id = self.tester.tenant_id
+        deleted = None
+        if self.calculated and database_url:
+            deleted = self.delete_calculations(database_url)
+        elif self.calculated:
+            self.log(f"--database-url이 없어 계산 결과 {len(self.calculated)}건을 삭제하지 않음 "
+                     f"({SYNTHETIC_YEAR}년 이후 대상월)", "WARN")
+
+        def delete(endpoint, params=f"tenantId={tenant_id}"):
+            return lambda record_id: self.tester.test_api_endpoint("DELETE", f"{endpoint}/{record_id}?{params}")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(delete("/api/enrollments", f"tenantId={tenant_id}&forceDelete=true"), self.enrollment_ids))
+            # 학생 API는 소프트 삭제(status=inactive)만 지원
+            list(executor.map(delete("/api/students"), self.student_ids))
+            list(executor.map(delete("/api/classes", f"tenantId={tenant_id}&forceDelete=true"), self.class_ids))
+        # 정책 사용 여부는 계산 결과의 applied_policy로도 확인하므로 정책은 계산 결과 다음에 삭제
+        for _, policy_id in self.policies:
+            self.tester.test_api_endpoint("DELETE", f"/api/salary/policies/{policy_id}")
+        calculations = f"계산 결과 {deleted}건, " if deleted is not None else ""
+        self.log(f"정리 완료: {calculations}수강등록 {len(self.enrollment_ids)}건, 클래스 {len(self.class_ids)}개, "
+                 f"정책 {len(self.policies)}개 삭제")
+        if self.student_ids:
+            self.log(f"학생 {len(self.student_ids)}명은 status=inactive로 남음 (tags에 '{SEED_STUDENT_TAG}' 포함)", "WARN")
+
+    def _clone(self):
+        worker = self.tester_factory()
+        worker.verbose = False
+        worker.set_access_token(self.tester.access_token)
+        worker.tenant_id = self.tester.tenant_id
+        return worker
+
+    def _calculate(self, local: threading.local, job: Dict) -> Tuple[Optional[float], Optional[int]]:
+        """계산 1건: (지연 초, 상태코드)"""
+        if not hasattr(local, "tester"):
+            local.tester = self._clone()
+        tester = local.tester
+        payload = {"instructor_id": job["instructor_id"], "month": job["month"], "policy_id": job["policy_id"],
+                   "include_adjustments": True, "preview_mode": self.preview}
+        started = time.perf_counter()
+        tester.test_api_endpoint("POST", "/api/salary/calculate", payload)
+        status = tester.last_call["status"]
+        if not self.preview and status == 200:
+            with self._calculated_lock:
+                self.calculated.add((job["instructor_id"], job["month"]))
+        return (time.perf_counter() - started if status is not None else None), status
+
+    def run(self, jobs: List[Dict], mode: str) -> Dict:
+        """정산 1회: sequential은 한 명씩, concurrent는 concurrency개씩 동시에 계산"""
+        local = threading.local()
+        workers = 1 if mode == "sequential" else self.concurrency
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(lambda job: self._calculate(local, job), jobs))
+        wall = time.perf_counter() - started
+
+        latency = LatencyHistogram()
+        by_type: Dict[str, LatencyHistogram] = {}
+        errors = timeouts = 0
+        for job, (elapsed, status) in zip(jobs, outcomes):
+            if status is None:
+                timeouts += 1
+                continue
+            if status != 200:
+                errors += 1
+                continue
+            latency.record_seconds(elapsed)
+            by_type.setdefault(job["policy_type"], LatencyHistogram()).record_seconds(elapsed)
+
+        result = {
+            "mode": mode,
+            "workers": workers,
+            "calculations": len(jobs),
+            "instructors": len({job["instructor_id"] for job in jobs}),
+            "months": len({job["month"] for job in jobs}),
+            # 수업 이력이 없는 대상월의 계산 수 (빈 메트릭 경로)
+            "empty_metrics": sum(1 for job in jobs if job["month"] not in self.history_months),
+            "wall_s": wall,
+            "per_second": len(jobs) / wall if wall > 0 else 0.0,
+            "errors": errors,
+            "timeouts": timeouts,
+            "p50_ms": latency.percentile(50) / 1000,
+            "p95_ms": latency.percentile(95) / 1000,
+            "p99_ms": latency.percentile(99) / 1000,
+            "max_ms": (latency.max or 0) / 1000,
+            "p50_by_policy_ms": {name: histogram.percentile(50) / 1000 for name, histogram in sorted(by_type.items())},
+        }
+        self.results.append(result)
+        self.log(f"{mode}: 계산 {len(jobs)}건, 정산 {wall:.1f}초, p95 {result['p95_ms']:.1f}ms, "
+                 f"에러 {errors}, 타임아웃 {timeouts}")
+        return result
+
+    def format_report(self) -> str:
+        """규모 / 모드별 정산 소요 시간과 계산 1건 지연 표"""
+        lines = [
+            f"{'CALCS':>6} {'INSTR':>6} {'MONTHS':>6} {'EMPTY':>6} {'MODE':<11} {'WORKERS':>7} {'WALL_S':>8} "
+            f"{'CALC/S':>7} {'P50':>8} {'P95':>8} {'P99':>8} {'MAX':>8} {'ERR':>5} {'TIMEOUT':>7}",
+            "-" * 113,
+        ]
+        for r in self.results:
+            lines.append(
+                f"{r['calculations']:>6} {r['instructors']:>6} {r['months']:>6} {r['empty_metrics']:>6} "
+                f"{r['mode']:<11} {r['workers']:>7} {r['wall_s']:>8.1f} {r['per_second']:>7.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+                f"{r['p99_ms']:>8.1f} {r['max_ms']:>8.1f} {r['errors']:>5} {r['timeouts']:>7}"
+            )
+        if any(r["empty_metrics"] for r in self.results):
+            lines.append("EMPTY: 수업 이력이 없는 대상월의 계산 수 - 빈 메트릭으로 계산되어 실제 정산보다 가벼운 경로")
+        return "\n".join(lines)
+
+    def format_policy_report(self) -> str:
+        """policy_type별 계산 1건 p50 (ms, 가장 큰 규모의 순차 실행 기준 - 동시 실행 경합 제외)"""
+        if not self.results:
+            return ""
+        largest = max(self.results, key=lambda r: (r["calculations"], r["mode"] == "sequential"))
+        lines = [f"{'POLICY_TYPE':<20} {'P50_MS':>8}", "-" * 29]
+        for name, p50 in largest["p50_by_policy_ms"].items():
+            lines.append(f"{name:<20} {p50:>8.1f}")
+        return "\n".join(lines)
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EduCanvas 급여 계산 처리량 벤치마크")
+    parser.add_argument("--counts", default=DEFAULT_COUNTS, help="정산 규모: 계산할 (강사, 월) 수 (쉼표 구분)")
+    parser.add_argument("--months", type=int, default=DEFAULT_MONTHS,
+                        help=f"대상월 수 (이번 달부터 거슬러 올라감, 이번 달 외에는 빈 메트릭 / "
+                             f"--persist면 {SYNTHETIC_YEAR}년 1월부터)")
+    parser.add_argument("--modes", default=",".join(MODES), help="실행 방식 (sequential, concurrent)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="concurrent 모드 동시 계산 수")
+    parser.add_argument("--classes-per-instructor", type=int, default=DEFAULT_CLASSES_PER_INSTRUCTOR,
+                        help="강사별로 만들 클래스 수 (수업 이력)")
+    parser.add_argument("--students-per-class", type=int, default=DEFAULT_STUDENTS_PER_CLASS,
+                        help="클래스마다 배정 / 수강등록할 학생 수")
+    parser.add_argument("--persist", action="store_true",
+                        help=f"계산 결과를 저장 (가상 대상월 {SYNTHETIC_YEAR}년, 정리 시 DB에서 삭제 / 기본은 preview_mode)")
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"),
+                        help="--persist 정리용 PostgreSQL 접속 URL (기본: 환경 변수 DATABASE_URL)")
+    parser.add_argument("--tag", default="SALARY", help="생성 데이터 식별 접두사")
+    parser.add_argument("--seed", type=int, default=42, help="클래스 데이터 난수 시드")
+    parser.add_argument("--keep", action="store_true", help="끝난 뒤 생성한 정책 / 클래스 / 계산 결과를 삭제하지 않음")
+    parser.add_argument("--results", default=None, help="결과 저장 경로 (.json)")
+    return parser.parse_args()
+
+
+def main() -> bool:
+    import functools
+    import json
+
+    from test_authenticated_crud import AuthenticatedCRUDTester
+
+    args = parse_args()
+    counts = sorted({int(count) for count in args.counts.split(",") if count.strip()})
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    if [mode for mode in modes if mode not in MODES] or not counts or min(counts) <= 0:
+        print(f"ERROR: --counts는 양수 목록, --modes는 {', '.join(MODES)} 중에서 지정해야 합니다")
+        exit(2)
+    if args.persist and not args.keep:
+        # 저장한 계산 결과를 지울 수 없으면 시작하지 않음
+        if not args.database_url:
+            print("ERROR: --persist는 계산 결과 정리를 위해 --database-url (또는 DATABASE_URL)이 필요합니다")
+            exit(2)
+        try:
+            _postgres_driver()
+        except ImportError:
+            print("ERROR: --persist 정리에는 psycopg 또는 psycopg2가 필요합니다 (pip install psycopg)")
+            exit(2)
+
+    tester = AuthenticatedCRUDTester(verbose=False)
+    if not tester.login():
+        return False
+    benchmark = SalaryBenchmark(tester, functools.partial(AuthenticatedCRUDTester, verbose=False),
+                                concurrency=args.concurrency, preview=not args.persist)
+    if not benchmark.load_instructors():
+        benchmark.log("테넌트에 강사가 없어 급여를 계산할 수 없습니다", "ERROR")
+        return False
+
+    months = synthetic_months(args.months) if args.persist else recent_months(args.months)
+    capacity = len(benchmark.instructor_ids) * len(months)
+    if max(counts) > capacity:
+        benchmark.log(f"강사 {len(benchmark.instructor_ids)}명 x {len(months)}개월 = 최대 {capacity}건, "
+                      f"그보다 큰 규모는 {capacity}건으로 줄여 실행 (--months로 늘리면 추가 월은 빈 메트릭)", "WARN")
+        counts = sorted({min(count, capacity) for count in counts})
+
+    try:
+        if not benchmark.prepare(f"{args.tag}{args.seed}", args.classes_per_instructor, args.seed,
+                                 args.students_per_class):
+            return False
+        empty_months = [month for month in months if month not in benchmark.history_months]
+        if empty_months:
+            benchmark.log(f"수업 이력이 없는 대상월 {', '.join(empty_months)}의 계산은 빈 메트릭 경로 "
+                          f"(리포트 EMPTY 열)", "WARN")
+        for count in counts:
+            jobs = build_jobs(benchmark.instructor_ids, months, benchmark.policies, count)
+            benchmark.log(f"=== 정산 규모 {count}건 ===")
+            for mode in modes:
+                benchmark.run(jobs, mode)
+    except KeyboardInterrupt:
+        benchmark.log("중단 요청 - 지금까지의 결과를 출력합니다", "WARN")
+    finally:
+        if not args.keep:
+            benchmark.teardown(args.database_url)
+
+    LOGGER.write(benchmark.format_report())
+    LOGGER.write("")
+    LOGGER.write(benchmark.format_policy_report())
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(benchmark.results, f, ensure_ascii=False, indent=2)
+    return all(result["errors"] == 0 and result["timeouts"] == 0 for result in benchmark.results)
+
+
+if __name__ == "__main__":
+    exit(0 if main() else 1)
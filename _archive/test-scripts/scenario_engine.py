@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 선언형 시나리오 엔진
+YAML / JSON 파일에 정의한 가중치별 요청 시퀀스를 실행
+- 단계마다 응답에서 값을 추출(extract)해 이후 단계의 경로 / 본문에 {{변수}}로 전달
+- 단계별 think-time(고정 초 또는 [최소, 최대] 범위)
+- 시나리오 weight로 실제 트래픽 비율 표현 (예: 학생 검색 70, 출결 체크인 20, 수강 수정 10)
+
+시나리오 파일 예 (scenarios/traffic_mix.yaml 참고):
+    scenarios:
+      - name: 학생 수정
+        weight: 10
+        steps:
+          - method: POST
+            path: /api/students
+            body: {tenantId: "{{tenant_id}}", name: "부하_{{timestamp}}"}
+            extract: {student_id: student.id}
+          - method: PUT
+            path: /api/students/{{student_id}}
+            body: {tenantId: "{{tenant_id}}", grade_level: 중2}
+            think: [0.5, 2.0]
+"""
+
+import json
+import random
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# {{변수}} 치환 패턴
+_TEMPLATE_VARIABLE = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+
+class ScenarioError(ValueError):
+    """시나리오 파일 형식 오류"""
+
+
+class Step:
+    def __init__(self, method: str, path: str, body: Any = None, expect=200,
+                 extract: Dict[str, str] = None, think=0.0, name: str = None):
+        self.method = method.upper()
+        self.path = path
+        self.body = body
+        self.expect = [expect] if isinstance(expect, int) else list(expect)
+        self.extract = extract or {}
+        self.think = think
+        self.name = name or f"{self.method} {path}"
+
+
+class Scenario:
+    def __init__(self, name: str, steps: List[Step], weight: float = 1.0):
+        self.name = name
+        self.steps = steps
+        self.weight = weight
+
+
+def _parse_think(value, where: str):
+    if isinstance(value, (int, float)) and value >= 0:
+        return float(value)
+    if isinstance(value, list) and len(value) == 2 and all(isinstance(v, (int, float)) for v in value) \
+            and 0 <= value[0] <= value[1]:
+        return (float(value[0]), float(value[1]))
+    raise ScenarioError(f"{where}: think는 0 이상의 초 또는 [최소, 최대] 범위여야 합니다: {value}")
+
+
+def parse_scenarios(document: Dict) -> List[Scenario]:
+    """시나리오 문서(dict)를 검증하고 Scenario 목록으로 변환"""
+    if not isinstance(document, dict) or not isinstance(document.get("scenarios"), list):
+        raise ScenarioError("최상위에 scenarios 목록이 필요합니다")
+    default_think = document.get("think", 0.0)
+    scenarios = []
+    for index, raw in enumerate(document["scenarios"]):
+        name = raw.get("name") or f"scenario-{index + 1}"
+        weight = raw.get("weight", 1)
+        if not isinstance(weight, (int, float)) or weight < 0:
+            raise ScenarioError(f"{name}: weight는 0 이상의 숫자여야 합니다")
+        if not raw.get("steps"):
+            raise ScenarioError(f"{name}: steps가 비어 있습니다")
+        scenario_think = raw.get("think", default_think)
+        steps = []
+        for step_index, step in enumerate(raw["steps"]):
+            where = f"{name} 단계 {step_index + 1}"
+            if not step.get("method") or not step.get("path"):
+                raise ScenarioError(f"{where}: method와 path가 필요합니다")
+            expect = step.get("expect", 200)
+            if not (isinstance(expect, int) or (isinstance(expect, list) and all(isinstance(e, int) for e in expect))):
+                raise ScenarioError(f"{where}: expect는 상태코드 또는 상태코드 목록이어야 합니다")
+            steps.append(Step(step["method"], step["path"], step.get("body"), expect, step.get("extract"),
+                              _parse_think(step.get("think", scenario_think), where), step.get("name")))
+        scenarios.append(Scenario(name, steps, float(weight)))
+    if not scenarios or sum(scenario.weight for scenario in scenarios) <= 0:
+        raise ScenarioError("가중치가 0보다 큰 시나리오가 하나 이상 필요합니다")
+    return scenarios
+
+
+def load_scenarios(path: str) -> List[Scenario]:
+    """시나리오 파일(.yaml / .yml / .json) 읽기 (YAML은 PyYAML 필요)"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ScenarioError("YAML 시나리오에는 PyYAML이 필요합니다 (pip install pyyaml, 또는 JSON 사용)")
+            document = yaml.safe_load(f)
+        else:
+            document = json.load(f)
+    return parse_scenarios(document)
+
+
+def extract_value(data: Any, path: str) -> Any:
+    """점 경로로 응답 값 추출 (예: student.id, data.items.0.id), 없으면 KeyError"""
+    value = data
+    for part in path.split("."):
+        if isinstance(value, list) and part.lstrip("-").isdigit():
+            value = value[int(part)]
+        elif isinstance(value, dict) and part in value:
+            value = value[part]
+        else:
+            raise KeyError(path)
+    return value
+
+
+def render(template: Any, variables: Dict[str, Any]) -> Any:
+    """
+    문자열 / dict / list 안의 {{변수}} 치환
+    문자열 전체가 "{{변수}}" 하나면 값의 타입(숫자, dict 등)을 그대로 유지
+    """
+    if isinstance(template, str):
+        whole = _TEMPLATE_VARIABLE.fullmatch(template.strip())
+        if whole:
+            return variables[whole.group(1)]
+        return _TEMPLATE_VARIABLE.sub(lambda match: str(variables[match.group(1)]), template)
+    if isinstance(template, dict):
+        return {key: render(value, variables) for key, value in template.items()}
+    if isinstance(template, list):
+        return [render(value, variables) for value in template]
+    return template
+
+
+class ScenarioRunner:
+    def __init__(self, tester, scenarios: List[Scenario], seed: Optional[int] = None):
+        """tester: test_api_endpoint / last_call / tenant_id를 가진 테스터 (AuthenticatedCRUDTester)"""
+        self.tester = tester
+        self.scenarios = scenarios
+        self.random = random.Random(seed)
+        self.iteration = 0
+
+    def _variables(self) -> Dict[str, Any]:
+        profile = self.tester.user_profile or {}
+        return {
+            "tenant_id": self.tester.tenant_id,
+            "user_id": profile.get("id"),
+            "timestamp": int(time.time()),
+            "iteration": self.iteration,
+            "random": self.random.randint(0, 999999),
+        }
+
+    def _think(self, think):
+        if isinstance(think, tuple):
+            think = self.random.uniform(*think)
+        if think > 0:
+            time.sleep(think)
+
+    def run(self, scenario: Scenario) -> bool:
+        """시나리오 1회 실행, 모든 단계가 기대 상태코드로 끝나면 True (실패한 단계 이후는 건너뜀)"""
+        self.iteration += 1
+        variables = self._variables()
+        for step in scenario.steps:
+            try:
+                path = render(step.path, variables)
+                body = render(step.body, variables)
+            except KeyError as e:
+                self.tester.log(f"[{scenario.name}] {step.name}: 정의되지 않은 변수 {e}", "ERROR")
+                return False
+
+            response = self.tester.test_api_endpoint(step.method, path, body, step.expect[0])
+            status = self.tester.last_call["status"]
+            if status not in step.expect:
+                self.tester.log(f"[{scenario.name}] {step.name}: 상태코드 {status} (기대 {step.expect})", "WARN")
+                return False
+            for name, source in step.extract.items():
+                try:
+                    variables[name] = extract_value(response, source)
+                except (KeyError, IndexError):
+                    self.tester.log(f"[{scenario.name}] {step.name}: 응답에 {source} 값이 없습니다", "WARN")
+                    return False
+            self._think(step.think)
+        return True
+
+    def pick(self) -> Scenario:
+        """가중치에 따라 시나리오 1개 선택"""
+        return self.random.choices(self.scenarios, weights=[scenario.weight for scenario in self.scenarios])[0]
+
+    def weighted_flows(self) -> List[Tuple[str, Callable]]:
+        """부하 테스트 반복 1회분: 가중치로 고른 시나리오 1개 (반복할수록 비율이 weight에 수렴)"""
+        scenario = self.pick()
+        return [(scenario.name, lambda: self.run(scenario))]
+
+    def all_flows(self) -> List[Tuple[str, Callable]]:
+        """단일 실행용: 모든 시나리오를 한 번씩"""
+        return [(scenario.name, lambda scenario=scenario: self.run(scenario)) for scenario in self.scenarios]
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+EduCanvas 검색 / 자동완성 지연 벤치마크
+입력창에 한 글자씩 타이핑할 때 나가는 요청을 재현해 키 입력당 응답 시간과 결과 수 분포를 측정
+- 한글 이름은 두벌식 IME 조합 과정(ㄱ → 기 → 김 → 김ㅁ → 김미 → 김민)을 그대로 재현
+- 전화번호 조각, 학번, 클래스 이름 쿼리 포함
+- undebounced: 키 입력마다 요청, debounced: 입력이 debounce 시간 이상 멈췄을 때만 요청
+- 이전 키 입력의 응답이 더 늦게 도착한 경우(stale, 화면 깜빡임 원인)도 집계
+
+seed_data.py manifest를 주면 시드 테넌트의 실제 학생 이름 / 학번 / 전화번호로 쿼리를 만듦
+
+사용법:
+    python search_bench.py --manifest seed_manifest.json
+    python search_bench.py --routes autocomplete,students-search --modes undebounced --typists 16
+"""
+
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from buffered_log import LOGGER
+from load_metrics import LatencyHistogram
+
+# 이름 -> (메서드, 경로 템플릿, 쿼리 종류, 최소 쿼리 길이)
+SEARCH_ROUTES = {
+    "students-search": ("GET", "/api/students/search?search={q}&limit=20&tenantId={tenant}", "student", 1),
+    "autocomplete": ("GET", "/api/students/autocomplete?query={q}&limit=10", "student", 1),
+    "smart-search": ("GET", "/api/students/smart-search?query={q}&limit=20&tenantId={tenant}", "student", 1),
+    "classes-search": ("GET", "/api/classes/search?search={q}&limit=20&tenantId={tenant}", "class", 1),
+    "global": ("POST", "/api/search", "any", 2),
+}
+MODES = ["undebounced", "debounced"]
+
+DEFAULT_TYPISTS = 8
+DEFAULT_SEQUENCES = 10
+DEFAULT_KEY_INTERVAL = 0.12
+DEFAULT_DEBOUNCE = 0.3
+# 타이핑 도중 잠깐 멈추는 확률과 멈춤 시간 범위(초)
+PAUSE_PROBABILITY = 0.15
+PAUSE_RANGE = (0.4, 0.9)
+# 학생 쿼리 종류 비율 (이름 / 전화번호 / 학번)
+STUDENT_QUERY_MIX = {"name": 0.6, "phone": 0.2, "student_number": 0.2}
+# 결과 수 집계 시 목록을 찾는 최대 깊이
+RESULT_SEARCH_DEPTH = 3
+
+# 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 겹모음 / 겹받침 -> 먼저 입력되는 부분 (ㅘ는 ㅗ 다음 ㅏ로 입력)
+_COMPOUND_VOWEL_FIRST = {9: 8, 10: 8, 11: 8, 14: 13, 15: 13, 16: 13, 19: 18}
+_COMPOUND_FINAL_FIRST = {3: 1, 5: 4, 6: 4, 9: 8, 10: 8, 11: 8, 12: 8, 13: 8, 14: 8, 15: 8, 18: 17}
+
+
+def _compose(lead: int, vowel: int, final: int = 0) -> str:
+    return chr(_HANGUL_BASE + (lead * 21 + vowel) * 28 + final)
+
+
+def hangul_typing_prefixes(text: str) -> List[str]:
+    """
+    두벌식 IME로 text를 입력할 때 입력창에 차례로 보이는 문자열 목록
+    받침 없는 음절 다음 자음은 일단 받침으로 붙었다가 모음이 오면 다음 음절로 넘어감 (이 + ㅁ -> 임 -> 이미)
+    """
+    prefixes = []
+    done = ""
+    previous: Optional[Tuple[int, int, int]] = None
+    for char in text:
+        code = ord(char)
+        if not _HANGUL_BASE <= code <= _HANGUL_LAST:
+            done += char
+            prefixes.append(done)
+            previous = None
+            continue
+        offset = code - _HANGUL_BASE
+        lead, vowel, final = offset // (21 * 28), (offset // 28) % 21, offset % 28
+
+        lead_as_final = _JONGSEONG.index(_CHOSEONG[lead]) if _CHOSEONG[lead] in _JONGSEONG else -1
+        if previous is not None and previous[2] == 0 and lead_as_final > 0:
+            prefixes.append(done[:-1] + _compose(previous[0], previous[1], lead_as_final))
+        else:
+            prefixes.append(done + _CHOSEONG[lead])
+        if vowel in _COMPOUND_VOWEL_FIRST:
+            prefixes.append(done + _compose(lead, _COMPOUND_VOWEL_FIRST[vowel]))
+        prefixes.append(done + _compose(lead, vowel))
+        if final:
+            if final in _COMPOUND_FINAL_FIRST:
+                prefixes.append(done + _compose(lead, vowel, _COMPOUND_FINAL_FIRST[final]))
+            prefixes.append(done + char)
+        done += char
+        previous = (lead, vowel, final)
+    return prefixes
+
+
+def typing_prefixes(text: str) -> List[str]:
+    """키 입력마다 입력창에 보이는 문자열 (한글은 IME 조합 단계 포함)"""
+    return hangul_typing_prefixes(text)
+
+
+def result_count(response, depth: int = RESULT_SEARCH_DEPTH) -> int:
+    """응답에서 처음 찾은 목록의 길이 (students / data.students / results / data.items 등 형태 무관)"""
+    if isinstance(response, list):
+        return len(response)
+    if not isinstance(response, dict) or depth == 0:
+        return 0
+    for value in response.values():
+        if isinstance(value, list):
+            return len(value)
+    for value in response.values():
+        if isinstance(value, dict):
+            count = result_count(value, depth - 1)
+            if count:
+                return count
+    return 0
+
+
+def seeded_records(manifest: Dict) -> Tuple[List[Dict], List[Dict]]:
+    """seed_data.py manifest의 seed / tag / profile로 생성 순서를 재현해 (학생, 클래스) 데이터 복원"""
+    from seed_data import SyntheticDataGenerator
+
+    profile = manifest["profile"]
+    generator = SyntheticDataGenerator(manifest.get("tenant_id"), seed=manifest["seed"], tag=manifest["tag"])
+    # 난수 소비 순서를 seed()와 맞추기 위해 앞 단계도 생성 (ID는 결과에 영향 없음)
+    classes = generator.classes(profile["classes"], [])
+    generator.course_packages(profile["course_packages"], [])
+    return generator.students(profile["students"]), classes
+
+
+class QueryCorpus:
+    """타이핑할 검색어 모음"""
+
+    def __init__(self, students: List[Dict], classes: List[Dict]):
+        self.students = students
+        self.classes = classes
+
+    @classmethod
+    def synthetic(cls, count: int = 500, seed: int = 42) -> "QueryCorpus":
+        """manifest가 없을 때: seed_data와 같은 규칙으로 만든 데이터"""
+        from seed_data import SyntheticDataGenerator
+
+        generator = SyntheticDataGenerator(None, seed=seed)
+        return cls(generator.students(count), generator.classes(max(count // 30, 1), []))
+
+    def query(self, kind: str, rng: random.Random) -> str:
+        if kind == "class" or (kind == "any" and rng.random() < 0.3):
+            # "중1 수학 001반_SEED42" -> 앞부분 "중1 수학"
+            return " ".join(rng.choice(self.classes)["name"].split(" ")[:2])
+        student = rng.choice(self.students)
+        query_kind = rng.choices(list(STUDENT_QUERY_MIX), weights=list(STUDENT_QUERY_MIX.values()))[0]
+        if kind == "any":
+            query_kind = "name"
+        if query_kind == "phone":
+            # 뒷자리 4자리 또는 가운데부터 입력
+            digits = student["phone"].split("-")
+            return digits[2] if rng.random() < 0.5 else f"{digits[1]}{digits[2]}"
+        if query_kind == "student_number":
+            return student["student_number"]
+        return student["name"]
+
+
+class SearchBenchmark:
+    def __init__(self, tester, tester_factory: Callable, corpus: QueryCorpus, typists: int = DEFAULT_TYPISTS,
+                 key_interval: float = DEFAULT_KEY_INTERVAL, debounce: float = DEFAULT_DEBOUNCE, seed: int = 42):
+        """
+        tester: 로그인된 테스터 (타이피스트 테스터들이 토큰을 공유)
+        key_interval: 평균 키 입력 간격(초), debounce: debounced 모드의 대기 시간(초)
+        """
+        self.tester = tester
+        self.tester_factory = tester_factory
+        self.corpus = corpus
+        self.typists = typists
+        self.key_interval = key_interval
+        self.debounce = debounce
+        self.seed = seed
+        self.results: List[Dict] = []
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def _clone(self):
+        worker = self.tester_factory()
+        worker.verbose = False
+        worker.set_access_token(self.tester.access_token)
+        worker.tenant_id = self.tester.tenant_id
+        return worker
+
+    def schedule(self, prefixes: List[str], mode: str, min_length: int, rng: random.Random) -> List[Tuple[float, str]]:
+        """키 입력 시각을 만들고 (요청 시각, 쿼리) 목록 반환, debounced는 입력이 멈춘 시점에만 요청"""
+        key_times = []
+        now = 0.0
+        for _ in prefixes:
+            key_times.append(now)
+            delay = rng.lognormvariate(math.log(self.key_interval), 0.35)
+            if rng.random() < PAUSE_PROBABILITY:
+                delay += rng.uniform(*PAUSE_RANGE)
+            now += delay
+        fires = []
+        for index, (key_time, prefix) in enumerate(zip(key_times, prefixes)):
+            if len(prefix) < min_length:
+                continue
+            if mode == "undebounced":
+                fires.append((key_time, prefix))
+                continue
+            next_key = key_times[index + 1] if index + 1 < len(key_times) else math.inf
+            if next_key - key_time >= self.debounce:
+                fires.append((key_time + self.debounce, prefix))
+        return fires
+
+    def _request(self, local: threading.local, route: str, query: str) -> Tuple[float, bool, int, float]:
+        # 풀 스레드마다 테스터를 따로 두어 last_call이 섞이지 않게 함
+        if not hasattr(local, "tester"):
+            local.tester = self._clone()
+        tester = local.tester
+        method, template, _, _ = SEARCH_ROUTES[route]
+        if method == "POST":
+            endpoint, body = template, {"query": query, "context": "dashboard", "limit": 20}
+        else:
+            endpoint, body = template.format(q=quote(query), tenant=self.tester.tenant_id or ""), None
+        started = time.perf_counter()
+        response = tester.test_api_endpoint(method, endpoint, body)
+        finished = time.perf_counter()
+        return finished - started, tester.last_call["status"] == 200, result_count(response), finished
+
+    def _typist(self, index: int, route: str, mode: str, sequences: int, stats: Dict, lock: threading.Lock):
+        _, _, kind, min_length = SEARCH_ROUTES[route]
+        rng = random.Random(f"{self.seed}-{route}-{index}")
+        local = threading.local()
+        # 응답을 기다리지 않고 다음 키 입력이 나가도록 타이피스트마다 작은 풀 사용
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(sequences):
+                prefixes = typing_prefixes(self.corpus.query(kind, rng))
+                fires = self.schedule(prefixes, mode, min_length, rng)
+                started = time.perf_counter()
+                futures = []
+                for fire_at, query in fires:
+                    delay = started + fire_at - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    futures.append((query, executor.submit(self._request, local, route, query)))
+                outcomes = [(query, future.result()) for query, future in futures]
+                # stale: 뒤 키 입력의 응답보다 늦게 도착한 응답
+                stale = sum(
+                    1 for i, (_, outcome) in enumerate(outcomes)
+                    if any(later[1][3] < outcome[3] for later in outcomes[i + 1:])
+                )
+                with lock:
+                    stats["sequences"] += 1
+                    stats["keystrokes"] += len(prefixes)
+                    stats["stale"] += stale
+                    for query, (latency, ok, count, _) in outcomes:
+                        stats["requests"] += 1
+                        if not ok:
+                            stats["errors"] += 1
+                            continue
+                        stats["latency"].record_seconds(latency)
+                        bucket = min(len(query), 4)
+                        stats["by_length"].setdefault(bucket, LatencyHistogram()).record_seconds(latency)
+                        stats["result_sizes"].record(count)  # 히스토그램을 결과 수(건) 분포에 재사용
+
+    def run(self, route: str, mode: str, sequences: int = DEFAULT_SEQUENCES) -> Dict:
+        """타이피스트 typists명이 각자 sequences개의 검색어를 입력"""
+        stats = {"sequences": 0, "keystrokes": 0, "requests": 0, "errors": 0, "stale": 0,
+                 "latency": LatencyHistogram(), "by_length": {}, "result_sizes": LatencyHistogram()}
+        lock = threading.Lock()
+        self.log(f"=== {route} / {mode}: 타이피스트 {self.typists}명 x 검색어 {sequences}개 ===")
+        threads = [
+            threading.Thread(target=self._typist, args=(i, route, mode, sequences, stats, lock),
+                             name=f"typist-{i}", daemon=True)
+            for i in range(self.typists)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        latency = stats["latency"]
+        sizes = stats["result_sizes"]
+        result = {
+            "route": route,
+            "mode": mode,
+            "sequences": stats["sequences"],
+            "keystrokes": stats["keystrokes"],
+            "requests": stats["requests"],
+            "requests_per_sequence": stats["requests"] / stats["sequences"] if stats["sequences"] else 0.0,
+            "errors": stats["errors"],
+            "stale": stats["stale"],
+            "p50_ms": latency.percentile(50) / 1000,
+            "p95_ms": latency.percentile(95) / 1000,
+            "p99_ms": latency.percentile(99) / 1000,
+            "p95_by_length_ms": {
+                ("4+" if length == 4 else str(length)): histogram.percentile(95) / 1000
+                for length, histogram in sorted(stats["by_length"].items())
+            },
+            "results_p50": sizes.percentile(50),
+            "results_p95": sizes.percentile(95),
+            "results_max": sizes.max or 0,
+        }
+        self.results.append(result)
+        return result
+
+    def format_report(self) -> str:
+        """라우트 / 모드별 결과 표 (LEN1~4+: 쿼리 길이별 p95 ms, RES: 결과 수)"""
+        lines = [
+            f"{'ROUTE':<16} {'MODE':<12} {'REQS':>6} {'REQ/SEQ':>7} {'ERR':>5} {'P50':>7} {'P95':>7} {'P99':>7} "
+            f"{'LEN1':>7} {'LEN2':>7} {'LEN3':>7} {'LEN4+':>7} {'RES50':>6} {'RES95':>6} {'RESMAX':>6} {'STALE':>6}",
+            "-" * 132,
+        ]
+        for r in self.results:
+            by_length = " ".join(
+                f"{r['p95_by_length_ms'][key]:>7.1f}" if key in r["p95_by_length_ms"] else f"{'-':>7}"
+                for key in ("1", "2", "3", "4+")
+            )
+            lines.append(
+                f"{r['route']:<16} {r['mode']:<12} {r['requests']:>6} {r['requests_per_sequence']:>7.1f} "
+                f"{r['errors']:>5} {r['p50_ms']:>7.1f} {r['p95_ms']:>7.1f} {r['p99_ms']:>7.1f} {by_length} "
+                f"{r['results_p50']:>6} {r['results_p95']:>6} {r['results_max']:>6} {r['stale']:>6}"
+            )
+        return "\n".join(lines)
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EduCanvas 검색 / 자동완성 지연 벤치마크")
+    parser.add_argument("--manifest", default=None, help="seed_data.py manifest (시드 테넌트 데이터로 검색어 생성)")
+    parser.add_argument("--routes", default=",".join(SEARCH_ROUTES),
+                        help=f"측정할 라우트 (쉼표 구분: {', '.join(SEARCH_ROUTES)})")
+    parser.add_argument("--modes", default=",".join(MODES), help="요청 모드 (undebounced, debounced)")
+    parser.add_argument("--typists", type=int, default=DEFAULT_TYPISTS, help="동시에 타이핑하는 사용자 수")
+    parser.add_argument("--sequences", type=int, default=DEFAULT_SEQUENCES, help="타이피스트당 검색어 수")
+    parser.add_argument("--key-interval-ms", type=float, default=DEFAULT_KEY_INTERVAL * 1000, help="평균 키 입력 간격(ms)")
+    parser.add_argument("--debounce-ms", type=float, default=DEFAULT_DEBOUNCE * 1000, help="debounced 모드 대기 시간(ms)")
+    parser.add_argument("--seed", type=int, default=42, help="검색어 / 타이핑 간격 난수 시드")
+    parser.add_argument("--results", default=None, help="결과 저장 경로 (.json)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    import functools
+    import json
+
+    from test_authenticated_crud import AuthenticatedCRUDTester
+
+    args = parse_args()
+    routes = [route.strip() for route in args.routes.split(",") if route.strip()]
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = [name for name in routes if name not in SEARCH_ROUTES] + [mode for mode in modes if mode not in MODES]
+    if unknown:
+        print(f"ERROR: 알 수 없는 라우트 / 모드: {', '.join(unknown)}")
+        exit(2)
+
+    if args.manifest:
+        with open(args.manifest, encoding="utf-8") as f:
+            corpus = QueryCorpus(*seeded_records(json.load(f)))
+    else:
+        corpus = QueryCorpus.synthetic(seed=args.seed)
+
+    tester = AuthenticatedCRUDTester(verbose=False)
+    if not tester.login():
+        exit(1)
+    benchmark = SearchBenchmark(tester, functools.partial(AuthenticatedCRUDTester, verbose=False), corpus,
+                                typists=args.typists, key_interval=args.key_interval_ms / 1000,
+                                debounce=args.debounce_ms / 1000, seed=args.seed)
+    for route in routes:
+        for mode in modes:
+            benchmark.run(route, mode, args.sequences)
+    LOGGER.write(benchmark.format_report())
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(benchmark.results, f, ensure_ascii=False, indent=2)
+    exit(0 if all(result["errors"] == 0 for result in benchmark.results) else 1)
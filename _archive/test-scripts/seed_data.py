@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+EduCanvas 대규모 테넌트 시드 데이터 생성 / 정리
+시드 고정 합성 데이터(학생, 클래스, 코스패키지, 수강등록)를 배치 단위로 동시에 생성하고 삽입 처리량을 리포트
+강사는 로그인 계정(user_id)이 있어야 /api/staff에 등록되므로 만들지 않고, 테넌트의 기존 강사를 클래스 담당으로 배정
+
+정리(--teardown)는 클래스 / 코스패키지 / 수강등록을 forceDelete=true로 완전 삭제.
+학생 API는 소프트 삭제(status=inactive)만 지원하므로 학생은 비활성 상태로 남으며,
+생성 시 tags에 SEED_STUDENT_TAG와 실행별 태그("bench-seed:SEED42")를 붙여 나중에 제외 / SQL로 일괄 삭제할 수 있게 함
+
+사용법:
+    python seed_data.py --profile large --seed 42 --manifest seed_manifest.json
+    python seed_data.py --teardown seed_manifest.json
+"""
+
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from buffered_log import LOGGER
+from test_authenticated_crud import AuthenticatedCRUDTester
+
+# 리소스별 (엔드포인트, 응답 키, 생성 성공 상태코드)
+RESOURCES = {
+    "classes": ("/api/classes", "class", 201),
+    "course_packages": ("/api/course-packages", "course_package", 200),
+    "students": ("/api/students", "student", 201),
+    "enrollments": ("/api/enrollments", "enrollment", 200),
+}
+
+# 생성 순서 (정리는 역순)
+SEED_ORDER = ["classes", "course_packages", "students", "enrollments"]
+# DELETE ?forceDelete=true로 완전 삭제되는 리소스 (학생은 소프트 삭제만 지원)
+HARD_DELETE_RESOURCES = {"classes", "course_packages", "enrollments"}
+# 시드 학생 공통 태그 (실행별 태그는 "bench-seed:<tag><seed>")
+SEED_STUDENT_TAG = "bench-seed"
+
+# 데이터셋 규모 프로필 (instructors: 클래스 담당으로 배정할 기존 강사 최대 수)
+SEED_PROFILES = {
+    "small": {"students": 500, "classes": 20, "instructors": 10, "course_packages": 10, "enrollments_per_student": 1},
+    "medium": {"students": 2000, "classes": 80, "instructors": 25, "course_packages": 20, "enrollments_per_student": 1},
+    "large": {"students": 10000, "classes": 300, "instructors": 60, "course_packages": 40, "enrollments_per_student": 2},
+}
+
+# /api/students/batch move_class 액션 1회 최대 학생 수
+BATCH_MOVE_LIMIT = 50
+# /api/staff 목록 1페이지 최대 크기
+STAFF_PAGE_LIMIT = 100
+
+SURNAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권", "황"]
+GIVEN_SYLLABLES = ["민", "서", "지", "현", "우", "준", "하", "윤", "도", "예", "수", "연", "은", "채", "시", "유", "진", "원"]
+GRADE_LEVELS = ["초4", "초5", "초6", "중1", "중2", "중3", "고1", "고2", "고3"]
+SUBJECTS = ["수학", "영어", "국어", "과학", "사회"]
+BILLING_TYPES = ["monthly", "sessions", "hours", "package"]
+
+
+def extract_id(response: Dict, key: str) -> Optional[str]:
+    """생성 응답에서 ID 추출 ({key: {...}}, {data: {key: {...}}}, {data: {...}} 형태 모두 지원)"""
+    if "error" in response:
+        return None
+    data = response.get("data") if isinstance(response.get("data"), dict) else {}
+    for candidate in (response.get(key), data.get(key), data, response):
+        if isinstance(candidate, dict) and candidate.get("id"):
+            return candidate["id"]
+    return None
+
+
+def load_staff_ids(tester, limit: Optional[int] = None) -> List[str]:
+    """테넌트의 강사 멤버십 ID (/api/staff 페이지 순회, limit개에서 멈춤)"""
+    ids: List[str] = []
+    page = 1
+    while limit is None or len(ids) < limit:
+        response = tester.test_api_endpoint("GET", f"/api/staff?limit={STAFF_PAGE_LIMIT}&page={page}")
+        instructors = response.get("instructors") or []
+        ids.extend(instructor["id"] for instructor in instructors if instructor.get("id"))
+        total_pages = (response.get("pagination") or {}).get("totalPages") or 1
+        if not instructors or page >= total_pages:
+            break
+        page += 1
+    return ids if limit is None else ids[:limit]
+
+
+class SyntheticDataGenerator:
+    """시드 고정 합성 데이터 생성기 (같은 seed와 tag면 항상 같은 데이터)"""
+
+    def __init__(self, tenant_id: str, seed: int = 42, tag: str = "SEED"):
+        self.tenant_id = tenant_id
+        self.seed = seed
+        self.tag = f"{tag}{seed}"
+        self.random = random.Random(seed)
+
+    def korean_name(self) -> str:
+        return self.random.choice(SURNAMES) + "".join(self.random.choices(GIVEN_SYLLABLES, k=2))
+
+    def phone(self) -> str:
+        return f"010-{self.random.randint(1000, 9999)}-{self.random.randint(1000, 9999)}"
+
+    def classes(self, count: int, instructor_ids: List[str]) -> List[Dict]:
+        payloads = []
+        for i in range(count):
+            subject = self.random.choice(SUBJECTS)
+            grade = self.random.choice(GRADE_LEVELS)
+            payload = {
+                "tenantId": self.tenant_id,
+                "name": f"{grade} {subject} {i + 1:03d}반_{self.tag}",
+                "grade": grade,
+                "course": subject,
+                "max_students": self.random.choice([15, 20, 25, 30, 40]),
+                "status": "active"
+            }
+            if instructor_ids:
+                payload["instructor_id"] = instructor_ids[i % len(instructor_ids)]
+            payloads.append(payload)
+        return payloads
+
+    def course_packages(self, count: int, class_ids: List[str]) -> List[Dict]:
+        payloads = []
+        for i in range(count):
+            billing_type = BILLING_TYPES[i % len(BILLING_TYPES)]
+            payload = {
+                "tenantId": self.tenant_id,
+                "name": f"{self.random.choice(SUBJECTS)} 패키지 {i + 1:03d}_{self.tag}",
+                "price": self.random.randrange(100000, 500001, 10000),
+                "billing_type": billing_type,
+                "currency": "KRW",
+                "hours": self.random.choice([20, 40, 60]),
+                "sessions": self.random.choice([8, 12, 16]),
+                "is_active": True
+            }
+            if class_ids:
+                payload["class_id"] = class_ids[i % len(class_ids)]
+            payloads.append(payload)
+        return payloads
+
+    def students(self, count: int) -> List[Dict]:
+        return [{
+            "tenantId": self.tenant_id,
+            "name": self.korean_name(),
+            "student_number": f"{self.tag}-{i:05d}",
+            "phone": self.phone(),
+            "email": f"{self.tag.lower()}.student{i:05d}@example.com",
+            "grade_level": self.random.choice(GRADE_LEVELS),
+            "status": "active",
+            "tags": [SEED_STUDENT_TAG, f"{SEED_STUDENT_TAG}:{self.tag}"]
+        } for i in range(count)]
+
+    def class_assignments(self, student_ids: List[str], class_ids: List[str]) -> Dict[str, str]:
+        """학생 ID -> 배정 클래스 ID"""
+        if not class_ids:
+            return {}
+        return {student_id: self.random.choice(class_ids) for student_id in student_ids}
+
+    def enrollments(self, assignments: Dict[str, str], package_ids: List[str], class_ids: List[str],
+                    per_student: int) -> List[Dict]:
+        payloads = []
+        for student_id, home_class_id in assignments.items():
+            enrolled_classes = [home_class_id]
+            extra_classes = [class_id for class_id in class_ids if class_id != home_class_id]
+            enrolled_classes += self.random.sample(extra_classes, min(per_student - 1, len(extra_classes)))
+            for class_id in enrolled_classes:
+                price = self.random.randrange(100000, 500001, 10000)
+                payload = {
+                    "tenantId": self.tenant_id,
+                    "studentId": student_id,
+                    "classId": class_id,
+                    "original_price": price,
+                    "final_price": price,
+                    "status": "active"
+                }
+                if package_ids:
+                    payload["packageId"] = self.random.choice(package_ids)
+                payloads.append(payload)
+        return payloads
+
+
+class TenantSeeder:
+    def __init__(self, tester: AuthenticatedCRUDTester, workers: int = 16, batch_size: int = 200):
+        self.tester = tester
+        self.workers = workers
+        self.batch_size = batch_size
+        self.throughput: Dict[str, Dict] = {}
+        self.assignments: Dict[str, str] = {}  # 학생 ID -> 소속 클래스 ID (출결 벤치마크 명단용)
+        self.instructor_ids: Optional[List[str]] = None  # 클래스 담당으로 배정하는 기존 강사 (처음 seed()에서 조회)
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def _run_batches(self, kind: str, payloads: List, send) -> List:
+        """payloads를 batch_size 단위로 나눠 workers개 스레드로 전송하고 결과를 순서대로 반환"""
+        results = []
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for offset in range(0, len(payloads), self.batch_size):
+                batch = payloads[offset:offset + self.batch_size]
+                results.extend(executor.map(send, batch))
+                self.log(f"   {kind}: {offset + len(batch)}/{len(payloads)}")
+        elapsed = time.monotonic() - started
+        succeeded = sum(1 for result in results if result)
+        self.throughput[kind] = {
+            "requested": len(payloads),
+            "succeeded": succeeded,
+            "failed": len(payloads) - succeeded,
+            "elapsed_s": elapsed,
+            "rows_per_s": succeeded / elapsed if elapsed > 0 else 0.0,
+        }
+        return results
+
+    def _create(self, kind: str, payloads: List[Dict]) -> List[str]:
+        endpoint, key, expected_status = RESOURCES[kind]
+
+        def send(payload):
+            return extract_id(self.tester.test_api_endpoint("POST", endpoint, payload, expected_status=expected_status), key)
+
+        return [record_id for record_id in self._run_batches(kind, payloads, send) if record_id]
+
+    def _assign_classes(self, assignments: Dict[str, str]):
+        """/api/students/batch move_class 액션으로 학생을 클래스에 일괄 배정"""
+        by_class: Dict[str, List[str]] = {}
+        for student_id, class_id in assignments.items():
+            by_class.setdefault(class_id, []).append(student_id)
+        batch_payloads = []
+        for class_id, student_ids in by_class.items():
+            for offset in range(0, len(student_ids), BATCH_MOVE_LIMIT):
+                batch_payloads.append({
+                    "action": "move_class",
+                    "student_ids": student_ids[offset:offset + BATCH_MOVE_LIMIT],
+                    "data": {"class_id": class_id, "reason": "seed"}
+                })
+
+        def send(payload):
+            response = self.tester.test_api_endpoint("POST", "/api/students/batch", payload)
+            return "error" not in response
+
+        self._run_batches("class_assignments", batch_payloads, send)
+
+    def seed(self, generator: SyntheticDataGenerator, profile: Dict) -> Dict[str, List[str]]:
+        """프로필 규모만큼 데이터를 생성하고 생성된 ID 목록(manifest)을 반환"""
+        created: Dict[str, List[str]] = {}
+        if self.instructor_ids is None:
+            self.instructor_ids = load_staff_ids(self.tester, profile["instructors"])
+            if self.instructor_ids:
+                self.log(f"기존 강사 {len(self.instructor_ids)}명을 클래스 담당으로 배정")
+            else:
+                self.log("테넌트에 강사가 없어 클래스를 담당 강사 없이 생성합니다", "WARN")
+        created["classes"] = self._create("classes", generator.classes(profile["classes"], self.instructor_ids))
+        created["course_packages"] = self._create(
+            "course_packages", generator.course_packages(profile["course_packages"], created["classes"])
+        )
+        created["students"] = self._create("students", generator.students(profile["students"]))
+
+        assignments = generator.class_assignments(created["students"], created["classes"])
+        if assignments:
+            self._assign_classes(assignments)
+        self.assignments = assignments
+        created["enrollments"] = self._create("enrollments", generator.enrollments(
+            assignments, created["course_packages"], created["classes"], profile["enrollments_per_student"]
+        ))
+        return created
+
+    def teardown(self, created: Dict[str, List[str]]) -> Dict[str, int]:
+        """
+        seed()로 생성한 데이터를 역순으로 삭제하고 테넌트에 남은 행 수를 반환
+        학생은 소프트 삭제(status=inactive)라 삭제에 성공해도 남은 행으로 셈
+        """
+        tenant_id = self.tester.tenant_id
+        leftover: Dict[str, int] = {}
+        for kind in reversed(SEED_ORDER):
+            endpoint = RESOURCES[kind][0]
+            params = f"tenantId={tenant_id}&forceDelete=true" if kind in HARD_DELETE_RESOURCES else f"tenantId={tenant_id}"
+
+            def send(record_id, endpoint=endpoint, params=params):
+                response = self.tester.test_api_endpoint("DELETE", f"{endpoint}/{record_id}?{params}")
+                return "error" not in response
+
+            results = self._run_batches(f"delete_{kind}", created.get(kind, []), send)
+            remaining = len(results) if kind not in HARD_DELETE_RESOURCES else results.count(False)
+            if remaining:
+                leftover[kind] = remaining
+
+        students = leftover.get("students", 0)
+        if students:
+            self.log(f"학생 {students}명은 API에 완전 삭제가 없어 status=inactive로 남음 "
+                     f"(tags에 '{SEED_STUDENT_TAG}' 포함) - 일괄 삭제: DELETE FROM students "
+                     f"WHERE tenant_id = '{tenant_id}' AND '{SEED_STUDENT_TAG}' = ANY(tags)", "WARN")
+        failed = {kind: count for kind, count in leftover.items() if kind != "students"}
+        if failed:
+            self.log(f"삭제 실패로 남은 행: {failed}", "WARN")
+        self.log(f"정리 완료: 남은 행 {leftover or '없음'}")
+        return leftover
+
+    def format_throughput(self) -> str:
+        """단계별 삽입 / 삭제 처리량 표"""
+        lines = [
+            f"{'STEP':<24} {'REQUESTED':>10} {'OK':>8} {'FAILED':>8} {'SECONDS':>9} {'ROWS/S':>9}",
+            "-" * 73,
+        ]
+        for kind, result in self.throughput.items():
+            lines.append(
+                f"{kind:<24} {result['requested']:>10} {result['succeeded']:>8} {result['failed']:>8} "
+                f"{result['elapsed_s']:>9.1f} {result['rows_per_s']:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EduCanvas 대규모 테넌트 시드 데이터 생성 / 정리")
+    parser.add_argument("--profile", choices=sorted(SEED_PROFILES), default="small", help="데이터셋 규모")
+    parser.add_argument("--students", type=int, default=None, help="프로필의 학생 수 대신 사용할 값")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같은 값이면 같은 데이터)")
+    parser.add_argument("--tag", default="SEED", help="생성 데이터 식별 접두사")
+    parser.add_argument("--workers", type=int, default=16, help="동시 요청 스레드 수")
+    parser.add_argument("--batch-size", type=int, default=200, help="배치당 요청 수")
+    parser.add_argument("--manifest", default="seed_manifest.json", help="생성된 ID 목록 저장 경로")
+    parser.add_argument("--teardown", metavar="MANIFEST", default=None, help="manifest에 기록된 데이터 삭제")
+    return parser.parse_args()
+
+
+def main() -> bool:
+    args = parse_args()
+    tester = AuthenticatedCRUDTester(verbose=False, pool_size=args.workers)
+    if not tester.login():
+        return False
+    seeder = TenantSeeder(tester, workers=args.workers, batch_size=args.batch_size)
+
+    if args.teardown:
+        with open(args.teardown, encoding="utf-8") as f:
+            manifest = json.load(f)
+        seeder.log(f"시드 데이터 정리 시작: {args.teardown}")
+        seeder.teardown(manifest["created"])
+    else:
+        profile = dict(SEED_PROFILES[args.profile])
+        if args.students is not None:
+            profile["students"] = args.students
+        generator = SyntheticDataGenerator(tester.tenant_id, seed=args.seed, tag=args.tag)
+        seeder.log(f"시드 데이터 생성 시작: {args.profile} {profile} (seed={args.seed})")
+        created = seeder.seed(generator, profile)
+        with open(args.manifest, "w", encoding="utf-8") as f:
+            json.dump({"seed": args.seed, "tag": args.tag, "tenant_id": tester.tenant_id,
+                       "profile": profile, "created": created, "assignments": seeder.assignments},
+                      f, ensure_ascii=False)
+        seeder.log(f"생성된 ID 목록 저장: {args.manifest}")
+
+    LOGGER.write(seeder.format_throughput())
+    return all(result["failed"] == 0 for result in seeder.throughput.values())
+
+
+if __name__ == "__main__":
+    exit(0 if main() else 1)
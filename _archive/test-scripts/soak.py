@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API soak 테스트 모니터
+가상 사용자 부하(LoadRunner)를 몇 시간씩 유지하면서 구간(window)마다 지연 / 데이터셋 크기 / 메모리를 기록하고
+p95가 시간이 지날수록 느려지는지(drift) 통계적으로 판정
+
+구간마다 기록하는 값:
+- 라우트별 요청 / 에러 수, p50 / p95 / p99, 최근 N구간 합산 p95 (rolling)
+  LoadMetrics.take_window()로 구간 히스토그램만 받으므로 요청별 표본은 저장하지 않음
+- 데이터셋 크기: 목록 API의 전체 건수 (학생 삭제는 status=inactive 소프트 삭제라 비활성 학생 수를 따로 조회)
+  + 테스터가 만든 레코드 - 지운 레코드 누적 수
+- 메모리: --server-pid 프로세스와 테스터 자신의 RSS (/proc, 없으면 psutil)
+
+추세 판정 (라우트별 구간 p95, 서버 RSS):
+- Mann-Kendall 추세 검정 p < alpha 이고 마지막 1/4 구간 중앙값이 처음 1/4 구간보다 min_drift 이상 높으면 drift
+- 기울기는 Theil-Sen 추정 (ms/시간, MB/시간)
+- 인접 구간의 p95는 서로 독립이 아니라 검정만으로는 작은 변화도 유의하게 나오므로 상대 변화 기준을 함께 적용
+
+구간 요약은 메모리에 MAX_WINDOWS개까지만 두고, 넘으면 인접 구간을 합쳐 해상도를 절반으로 줄임
+(전체 해상도는 --soak-output JSONL에 구간마다 한 줄씩 기록)
+
+사용법:
+    python test_authenticated_crud.py --users 20 --duration 14400 --soak --server-pid 12345
+    python api_tester.py soak --users 20 --soak-window 60 --soak-output soak.jsonl
+    python api_tester.py soak --mock --users 5 --duration 120 --soak-window 5
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from buffered_log import LOGGER
+from load_metrics import LatencyHistogram
+
+DEFAULT_SOAK_DURATION = 4 * 3600
+DEFAULT_SOAK_WINDOW = 60.0
+DEFAULT_ROLLING_WINDOWS = 5
+DEFAULT_DRIFT_ALPHA = 0.01
+DEFAULT_MIN_DRIFT = 0.2
+# 추세 판정에 필요한 최소 구간 수 / 구간 p95를 추세에 쓰는 최소 요청 수
+MIN_TREND_WINDOWS = 8
+MIN_WINDOW_REQUESTS = 20
+# 추세 검정에 쓰는 최대 점 수 (넘으면 인접 점 평균으로 줄임, 검정 비용이 점 수의 제곱)
+MAX_TREND_POINTS = 200
+MAX_WINDOWS = 2880
+MB = 1024 * 1024
+
+# 이름 -> (목록 경로, 목록 키), 전체 건수만 필요하므로 limit=1
+DATASET_PROBES = {
+    "students": ("/api/students?limit=1", "students"),
+    "students(inactive)": ("/api/students?limit=1&status=inactive", "students"),
+    "classes": ("/api/classes?limit=1", "classes"),
+    # 강사 목록은 /api/staff ({instructors, pagination: {total}}), --mock 서버에는 없어 건너뜀
+    "staff": ("/api/staff?limit=1", "instructors"),
+    "course_packages": ("/api/course-packages?limit=1", "course_packages"),
+    "enrollments": ("/api/enrollments?limit=1", "enrollments"),
+}
+
+
+def read_rss(pid: int) -> Optional[int]:
+    """프로세스 RSS(바이트), 읽을 수 없으면 None (/proc이 없으면 psutil이 설치된 경우에만)"""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii", errors="replace") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        return psutil.Process(pid).memory_info().rss
+    except psutil.Error:
+        return None
+
+
+def dataset_total(response: Dict, list_key: str) -> Optional[int]:
+    """목록 응답의 전체 건수 ({success, data: {items, pagination}} / {list_key, pagination} 모두 지원)"""
+    data = response.get("data")
+    candidates = [response.get("pagination")]
+    if isinstance(data, dict):
+        candidates.append(data.get("pagination"))
+    for pagination in candidates:
+        if not isinstance(pagination, dict):
+            continue
+        for key in ("total_count", "total", "totalCount"):
+            if isinstance(pagination.get(key), int):
+                return pagination[key]
+    return None
+
+
+def mann_kendall(values: List[float]) -> Tuple[float, float]:
+    """Mann-Kendall 추세 검정 (동점 보정, 정규 근사), 반환: (z, 양측 p-value)"""
+    n = len(values)
+    if n < 3:
+        return 0.0, 1.0
+    s = 0
+    for i in range(n - 1):
+        current = values[i]
+        for later in values[i + 1:]:
+            if later > current:
+                s += 1
+            elif later < current:
+                s -= 1
+    ties: Dict[float, int] = {}
+    for value in values:
+        ties[value] = ties.get(value, 0) + 1
+    variance = (n * (n - 1) * (2 * n + 5)
+                - sum(t * (t - 1) * (2 * t + 5) for t in ties.values() if t > 1)) / 18.0
+    if variance <= 0:
+        return 0.0, 1.0
+    if s > 0:
+        z = (s - 1) / math.sqrt(variance)
+    elif s < 0:
+        z = (s + 1) / math.sqrt(variance)
+    else:
+        z = 0.0
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+def theil_sen_slope(xs: List[float], ys: List[float]) -> float:
+    """Theil-Sen 기울기 (모든 점 쌍 기울기의 중앙값)"""
+    slopes = sorted(
+        (ys[j] - ys[i]) / (xs[j] - xs[i])
+        for i in range(len(xs) - 1) for j in range(i + 1, len(xs)) if xs[j] != xs[i]
+    )
+    if not slopes:
+        return 0.0
+    middle = len(slopes) // 2
+    return slopes[middle] if len(slopes) % 2 else (slopes[middle - 1] + slopes[middle]) / 2
+
+
+def _median(values: List[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    return ordered[middle] if len(ordered) % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def _downsample(points: List[Tuple[float, float]], max_points: int = MAX_TREND_POINTS) -> List[Tuple[float, float]]:
+    """점이 max_points개를 넘으면 인접 점들을 평균내 줄임"""
+    if len(points) <= max_points:
+        return points
+    size = len(points) / max_points
+    reduced = []
+    for index in range(max_points):
+        chunk = points[int(index * size):int((index + 1) * size)]
+        reduced.append((sum(x for x, _ in chunk) / len(chunk), sum(y for _, y in chunk) / len(chunk)))
+    return reduced
+
+
+def trend(points: List[Tuple[float, float]], alpha: float = DEFAULT_DRIFT_ALPHA,
+          min_drift: float = DEFAULT_MIN_DRIFT) -> Optional[Dict]:
+    """
+    (경과 시간(시), 값) 시계열의 추세, 점이 MIN_TREND_WINDOWS개 미만이면 None
+    first / last: 처음 / 마지막 1/4 구간 중앙값, change: 상대 변화, drift: 유의하게 증가했는지
+    """
+    if len(points) < MIN_TREND_WINDOWS:
+        return None
+    points = _downsample(points)
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    quarter = max(len(ys) // 4, 1)
+    first, last = _median(ys[:quarter]), _median(ys[-quarter:])
+    change = (last - first) / first if first > 0 else 0.0
+    z, p_value = mann_kendall(ys)
+    return {
+        "points": len(points),
+        "first": first,
+        "last": last,
+        "change": change,
+        "slope_per_hour": theil_sen_slope(xs, ys),
+        "z": z,
+        "p_value": p_value,
+        "drift": z > 0 and p_value < alpha and change >= min_drift,
+    }
+
+
+def _weighted(a: Optional[float], wa: int, b: Optional[float], wb: int) -> Optional[float]:
+    if a is None or b is None:
+        return b if a is None else a
+    return (a * wa + b * wb) / (wa + wb) if wa + wb else (a + b) / 2
+
+
+def _merge_summaries(a: Dict, b: Dict) -> Dict:
+    """
+    인접 구간 요약 2개를 합침 (메모리 상한 유지용)
+    백분위는 요청 수 가중 평균으로 근사하고, 데이터셋 크기는 뒤 구간 값, RSS는 큰 값을 사용
+    """
+    merged = dict(b)
+    merged.update(index=a["index"], start=a["start"], requests=a["requests"] + b["requests"],
+                  errors=a["errors"] + b["errors"])
+    merged["rps"] = merged["requests"] / max(b["end"] - a["start"], 1e-9)
+    for field in ("p50_ms", "p95_ms", "p99_ms"):
+        merged[field] = _weighted(a[field], a["requests"], b[field], b["requests"])
+    routes = {}
+    for route in set(a["routes"]) | set(b["routes"]):
+        ra, rb = a["routes"].get(route), b["routes"].get(route)
+        if ra is None or rb is None:
+            routes[route] = dict(ra or rb)
+            continue
+        combined = dict(rb)
+        combined.update(requests=ra["requests"] + rb["requests"], errors=ra["errors"] + rb["errors"])
+        for field in ("p50_ms", "p95_ms", "p99_ms"):
+            combined[field] = _weighted(ra[field], ra["requests"], rb[field], rb["requests"])
+        routes[route] = combined
+    merged["routes"] = routes
+    for field in ("server_rss_mb", "client_rss_mb"):
+        values = [value for value in (a[field], b[field]) if value is not None]
+        merged[field] = max(values) if values else None
+    return merged
+
+
+class SoakMonitor:
+    def __init__(self, metrics, window: float = DEFAULT_SOAK_WINDOW, probe=None, server_pid: Optional[int] = None,
+                 rolling_windows: int = DEFAULT_ROLLING_WINDOWS, alpha: float = DEFAULT_DRIFT_ALPHA,
+                 min_drift: float = DEFAULT_MIN_DRIFT, output: Optional[str] = None, max_windows: int = MAX_WINDOWS):
+        """
+        metrics: 부하 테스트의 LoadMetrics (구간 집계를 켜고 구간마다 take_window() 호출)
+        probe: 데이터셋 크기 조회용 로그인된 테스터 (부하 지표와 섞이지 않도록 별도 LoadMetrics 사용, None이면 생략)
+        server_pid: 메모리를 추적할 서버 프로세스 ID (None이면 생략)
+        rolling_windows: rolling p95에 합치는 최근 구간 수
+        alpha / min_drift: 추세 검정 유의수준 / drift로 판정할 최소 상대 증가율
+        output: 구간 요약을 한 줄씩 기록할 JSONL 경로
+        """
+        if window <= 0:
+            raise ValueError("구간 길이는 0보다 커야 합니다")
+        self.metrics = metrics
+        self.window = window
+        self.probe = probe
+        self.server_pid = server_pid
+        self.alpha = alpha
+        self.min_drift = min_drift
+        self.output = output
+        self.max_windows = max(max_windows, MIN_TREND_WINDOWS * 2)
+        self.windows: List[Dict] = []
+        self.window_count = 0
+        self.net_created: Dict[str, int] = {}
+        self._recent: deque = deque(maxlen=max(rolling_windows, 1))  # 최근 구간의 라우트별 히스토그램
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._file = None
+        self._started_at = 0.0
+        self._window_started = 0.0
+        self._drifting = False
+
+    def log(self, message: str, level: str = "INFO"):
+        """로그 출력 (테스터 로그와 같은 버퍼 로거로 순서 유지)"""
+        LOGGER.log(message, level)
+
+    def start(self):
+        """구간 집계를 켜고 샘플링 스레드 시작 (LoadRunner.run() 직전에 호출)"""
+        if self.server_pid is not None and read_rss(self.server_pid) is None:
+            self.log(f"서버 프로세스 {self.server_pid}의 메모리를 읽을 수 없습니다 (/proc 또는 psutil 필요) - 서버 메모리 추적 생략", "WARN")
+            self.server_pid = None
+        if self.output:
+            self._file = open(self.output, "w", encoding="utf-8")
+        self.metrics.take_window()
+        self._started_at = self._window_started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="soak-monitor", daemon=True)
+        self._thread.start()
+        self.log(f"soak 모니터 시작: 구간 {self.window:g}초, rolling {self._recent.maxlen}구간, "
+                 f"drift 기준 p < {self.alpha:g} & +{self.min_drift * 100:g}%")
+
+    def stop(self):
+        """샘플링 중지, 마지막 (부분) 구간까지 기록"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self.sample()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _run(self):
+        while not self._stop.wait(max(self._window_started + self.window - time.monotonic(), 0)):
+            self.sample()
+
+    def _dataset_sizes(self) -> Dict[str, int]:
+        sizes = {}
+        tenant_id = getattr(self.probe, "tenant_id", None)
+        for name, (path, list_key) in DATASET_PROBES.items():
+            endpoint = f"{path}&tenantId={tenant_id}" if tenant_id else path
+            try:
+                response = self.probe.test_api_endpoint("GET", endpoint)
+            except Exception:
+                continue
+            total = dataset_total(response, list_key) if isinstance(response, dict) else None
+            if total is not None:
+                sizes[name] = total
+        return sizes
+
+    def sample(self) -> Optional[Dict]:
+        """직전 구간을 요약해 기록 (요청이 없는 구간은 건너뜀)"""
+        window = self.metrics.take_window()
+        now = time.monotonic()
+        start, self._window_started = self._window_started, now
+        duration = max(now - start, 1e-9)
+        if not window:
+            return None
+
+        total = LatencyHistogram()
+        routes = {}
+        histograms = {}
+        requests = errors = 0
+        for (method, route), stats in window.items():
+            label = f"{method} {route}"
+            histograms[label] = stats.latency
+            total.merge(stats.latency)
+            requests += stats.requests
+            errors += stats.errors
+            routes[label] = {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "p50_ms": stats.latency.percentile(50) / 1000,
+                "p95_ms": stats.latency.percentile(95) / 1000,
+                "p99_ms": stats.latency.percentile(99) / 1000,
+            }
+            # 생성 / 삭제 성공 수로 테스터가 남긴 레코드 수 누적 (/api/<resource>, /api/<resource>/{id})
+            parts = route.strip("/").split("/")
+            succeeded = stats.requests - stats.errors
+            if len(parts) == 2 and method == "POST":
+                self.net_created[parts[1]] = self.net_created.get(parts[1], 0) + succeeded
+            elif len(parts) == 3 and parts[2] == "{id}" and method == "DELETE":
+                self.net_created[parts[1]] = self.net_created.get(parts[1], 0) - succeeded
+
+        self._recent.append(histograms)
+        rolling: Dict[str, LatencyHistogram] = {}
+        for recent in self._recent:
+            for label, histogram in recent.items():
+                rolling.setdefault(label, LatencyHistogram()).merge(histogram)
+        rolling_total = LatencyHistogram()
+        for label, histogram in rolling.items():
+            rolling_total.merge(histogram)
+            if label in routes:
+                routes[label]["rolling_p95_ms"] = histogram.percentile(95) / 1000
+
+        server_rss = read_rss(self.server_pid) if self.server_pid is not None else None
+        client_rss = read_rss(os.getpid())
+        self.window_count += 1
+        summary = {
+            "index": self.window_count,
+            "start": round(start - self._started_at, 3),
+            "end": round(now - self._started_at, 3),
+            "requests": requests,
+            "errors": errors,
+            "rps": requests / duration,
+            "p50_ms": total.percentile(50) / 1000,
+            "p95_ms": total.percentile(95) / 1000,
+            "p99_ms": total.percentile(99) / 1000,
+            "rolling_p95_ms": rolling_total.percentile(95) / 1000,
+            "routes": routes,
+            "dataset": self._dataset_sizes() if self.probe is not None else {},
+            "net_created": dict(self.net_created),
+            "server_rss_mb": server_rss / MB if server_rss is not None else None,
+            "client_rss_mb": client_rss / MB if client_rss is not None else None,
+        }
+        self.windows.append(summary)
+        if len(self.windows) > self.max_windows:
+            pairs = zip(self.windows[0::2], self.windows[1::2])
+            tail = [self.windows[-1]] if len(self.windows) % 2 else []
+            self.windows = [_merge_summaries(a, b) for a, b in pairs] + tail
+        if self._file is not None:
+            self._file.write(json.dumps(summary, ensure_ascii=False) + "\n")
+            self._file.flush()
+        self.log(self._format_window(summary))
+        self._check_overall()
+        return summary
+
+    def _format_window(self, summary: Dict) -> str:
+        parts = [
+            f"[구간 {summary['index']}] 요청 {summary['requests']:,} ({summary['rps']:.1f}/s) 에러 {summary['errors']}",
+            f"p95 {summary['p95_ms']:.1f}ms (최근 {len(self._recent)}구간 {summary['rolling_p95_ms']:.1f}ms)",
+        ]
+        if "students" in summary["dataset"]:
+            parts.append(f"학생 {summary['dataset']['students']:,}")
+        if summary["server_rss_mb"] is not None:
+            parts.append(f"서버 RSS {summary['server_rss_mb']:.0f}MB")
+        if summary["client_rss_mb"] is not None:
+            parts.append(f"테스터 RSS {summary['client_rss_mb']:.0f}MB")
+        return " | ".join(parts)
+
+    def _check_overall(self):
+        """전체 p95 추세를 구간마다 확인해 drift가 시작 / 해소될 때 경고"""
+        result = trend(self._points(lambda summary: summary["p95_ms"]), self.alpha, self.min_drift)
+        drifting = bool(result and result["drift"])
+        if drifting and not self._drifting:
+            self.log(f"전체 p95 상승 추세: {result['first']:.1f}ms -> {result['last']:.1f}ms "
+                     f"({result['change'] * 100:+.0f}%, {result['slope_per_hour']:+.1f}ms/시간, "
+                     f"p={result['p_value']:.2g})", "WARN")
+        elif self._drifting and not drifting:
+            self.log("전체 p95 상승 추세 해소")
+        self._drifting = drifting
+
+    def _points(self, value, min_requests: int = MIN_WINDOW_REQUESTS) -> List[Tuple[float, float]]:
+        """구간 요약에서 (구간 중앙 경과 시간(시), 값) 시계열 추출, value가 None을 돌려주는 구간은 제외"""
+        points = []
+        for summary in self.windows:
+            if summary["requests"] < min_requests:
+                continue
+            y = value(summary)
+            if y is not None:
+                points.append(((summary["start"] + summary["end"]) / 2 / 3600, y))
+        return points
+
+    def trends(self) -> Dict[str, Dict]:
+        """라우트별 p95 / 전체 p95 / 메모리 / 데이터셋 크기 추세 (점이 부족한 항목은 제외)"""
+        results = {}
+        series = {"p95 (전체)": self._points(lambda summary: summary["p95_ms"])}
+        labels = sorted({label for summary in self.windows for label in summary["routes"]})
+        for label in labels:
+            series[f"p95 {label}"] = self._points(
+                lambda summary, label=label: summary["routes"][label]["p95_ms"]
+                if summary["routes"].get(label, {}).get("requests", 0) >= MIN_WINDOW_REQUESTS else None
+            )
+        series["서버 RSS (MB)"] = self._points(lambda summary: summary["server_rss_mb"], min_requests=0)
+        series["테스터 RSS (MB)"] = self._points(lambda summary: summary["client_rss_mb"], min_requests=0)
+        for name in DATASET_PROBES:
+            series[f"데이터셋 {name}"] = self._points(lambda summary, name=name: summary["dataset"].get(name),
+                                                   min_requests=0)
+        for name, points in series.items():
+            result = trend(points, self.alpha, self.min_drift)
+            if result is not None:
+                results[name] = result
+        return results
+
+    def drifting(self, trends: Dict[str, Dict] = None) -> List[str]:
+        """drift로 판정한 p95 / 서버 메모리 항목 (데이터셋 크기와 테스터 메모리는 참고용이라 제외)"""
+        trends = self.trends() if trends is None else trends
+        return [name for name, result in trends.items()
+                if result["drift"] and (name.startswith("p95") or name.startswith("서버"))]
+
+    def format_report(self, trends: Dict[str, Dict] = None) -> str:
+        """항목별 처음 / 마지막 1/4 구간 중앙값, 변화율, 시간당 기울기, p-value 표와 레코드 누적 수"""
+        trends = self.trends() if trends is None else trends
+        drifting = self.drifting(trends)
+        lines = [
+            f"{'SERIES':<46} {'POINTS':>6} {'FIRST':>10} {'LAST':>10} {'CHANGE':>8} {'SLOPE/H':>10} {'P-VALUE':>8}",
+            "-" * 104,
+        ]
+        for name, result in trends.items():
+            flag = "  ⚠️" if name in drifting else ""
+            lines.append(
+                f"{name[:46]:<46} {result['points']:>6} {result['first']:>10.1f} {result['last']:>10.1f} "
+                f"{result['change'] * 100:>+7.1f}% {result['slope_per_hour']:>+10.1f} {result['p_value']:>8.2g}{flag}"
+            )
+        lines.append("")
+        if self.net_created:
+            created = ", ".join(f"{resource} {count:+,}" for resource, count in sorted(self.net_created.items()))
+            lines.append(f"테스터가 남긴 레코드 (생성 - 삭제): {created}")
+        lines.append(f"FIRST / LAST = 처음 / 마지막 1/4 구간 중앙값 (p95: ms), SLOPE/H = Theil-Sen 시간당 기울기, "
+                     f"⚠️ = p < {self.alpha:g} & +{self.min_drift * 100:g}% 이상")
+        return "\n".join(lines)
+
+    def to_dict(self, trends: Dict[str, Dict] = None) -> Dict:
+        return {
+            "window": self.window,
+            "alpha": self.alpha,
+            "min_drift": self.min_drift,
+            "windows_recorded": self.window_count,
+            "net_created": dict(self.net_created),
+            "trends": self.trends() if trends is None else trends,
+            "windows": self.windows,
+        }
+
+
+def add_soak_arguments(parser):
+    """test_authenticated_crud / api_tester soak 공용 soak 옵션"""
+    parser.add_argument("--soak", action="store_true",
+                        help="soak 모드: 구간별 p95 / 데이터셋 크기 / 메모리를 기록하고 p95 상승 추세 판정")
+    parser.add_argument("--soak-window", type=float, default=DEFAULT_SOAK_WINDOW, help="soak 구간 길이(초)")
+    parser.add_argument("--soak-rolling", type=int, default=DEFAULT_ROLLING_WINDOWS,
+                        help="rolling p95에 합치는 최근 구간 수")
+    parser.add_argument("--soak-output", default=None, help="구간 요약을 한 줄씩 기록할 경로 (.jsonl)")
+    parser.add_argument("--server-pid", type=int, default=None, help="메모리(RSS)를 추적할 서버 프로세스 ID")
+    parser.add_argument("--drift-alpha", type=float, default=DEFAULT_DRIFT_ALPHA, help="추세 검정 유의수준")
+    parser.add_argument("--drift-threshold", type=float, default=DEFAULT_MIN_DRIFT,
+                        help="drift로 판정할 최소 p95 / 메모리 상대 증가율 (0.2 = 20%%)")
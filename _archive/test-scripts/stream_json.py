@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+EduCanvas API 테스터용 스트리밍 JSON 파서
+목록 응답 전체를 메모리에 올리지 않고 배열 원소를 하나씩 파싱하며,
+전송(압축) 바이트와 압축 해제 후 바이트를 함께 집계
+"""
+
+import codecs
+import json
+import re
+import zlib
+from typing import Any, Iterable, Iterator, Sequence
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+# BodyReader가 풀 수 있는 압축만 요청 (requests 기본값은 brotli 설치 시 br 포함)
+ACCEPT_ENCODING = "gzip, deflate"
+
+_WHITESPACE_AND_COMMAS = " \t\r\n,"
+_VALUE_END = " \t\r\n,]"
+
+
+class BodyReader:
+    """
+    urllib3 원본 스트림을 직접 읽어 압축 해제하면서 바이트 수를 집계
+    wire_bytes: 네트워크로 받은(압축된) 바이트, body_bytes: 압축 해제 후 바이트
+    """
+
+    def __init__(self, raw, content_encoding: str = "", chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.raw = raw
+        self.chunk_size = chunk_size
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        encoding = (content_encoding or "identity").strip().lower()
+        if encoding == "gzip":
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self._decompressor = zlib.decompressobj()
+        elif encoding == "identity":
+            self._decompressor = None
+        else:
+            raise ValueError(f"지원하지 않는 Content-Encoding: {content_encoding}")
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.raw.stream(self.chunk_size, decode_content=False):
+            self.wire_bytes += len(chunk)
+            if self._decompressor is not None:
+                chunk = self._decompressor.decompress(chunk)
+            if chunk:
+                self.body_bytes += len(chunk)
+                yield chunk
+        if self._decompressor is not None:
+            tail = self._decompressor.flush()
+            if tail:
+                self.body_bytes += len(tail)
+                yield tail
+
+
+def iter_array_items(chunks: Iterable[bytes], keys: Sequence[str]) -> Iterator[Any]:
+    """
+    JSON 문서에서 keys 중 처음 나타나는 키의 배열 원소를 하나씩 yield
+    배열을 찾기 전에는 키 탐색에 필요한 끝부분만, 배열 안에서는 파싱 중인 원소만 버퍼에 유지
+    배열이 끝난 뒤 남은 청크도 끝까지 소비해 바이트 집계가 완료되도록 함
+    문서 끝까지 keys 배열이 없으면 ValueError (항목 0건과 구분)
+    """
+    pattern = re.compile(r'"(?:%s)"\s*:\s*\[' % "|".join(re.escape(key) for key in keys))
+    keep_tail = max(len(key) for key in keys) + 16
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    json_decoder = json.JSONDecoder()
+    buffer = ""
+    in_array = False
+    finished = False
+
+    for chunk in chunks:
+        if finished:
+            continue
+        buffer += decoder.decode(chunk)
+        if not in_array:
+            match = pattern.search(buffer)
+            if match is None:
+                buffer = buffer[-keep_tail:]
+                continue
+            buffer = buffer[match.end():]
+            in_array = True
+
+        while True:
+            buffer = buffer.lstrip(_WHITESPACE_AND_COMMAS)
+            if not buffer:
+                break
+            if buffer[0] == "]":
+                finished = True
+                buffer = ""
+                break
+            try:
+                item, end = json_decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                break  # 원소가 아직 다 도착하지 않음
+            if not isinstance(item, (dict, list, str)) and (end == len(buffer) or buffer[end] not in _VALUE_END):
+                break  # 숫자 / 리터럴은 다음 청크에서 이어질 수 있음 (예: "2" 다음에 ".5")
+            buffer = buffer[end:]
+            yield item
+
+    if not in_array:
+        raise ValueError(f"응답에 {' / '.join(keys)} 배열이 없습니다")
+    if not finished:
+        buffer = (buffer + decoder.decode(b"", final=True)).strip(_WHITESPACE_AND_COMMAS)
+        if buffer and buffer != "]":
+            raise ValueError("JSON 배열이 완결되지 않았습니다")
@@ -9,6 +9,17 @@ import json
 import time
 from typing import Dict, Any, Optional
 
+from buffered_log import DEFAULT_INFO_RATE, LEVELS, LOGGER
+from load_metrics import LoadMetrics
+from scenario_engine import ScenarioRunner
+from stream_json import ACCEPT_ENCODING, BodyReader, iter_array_items
+from credential_pool import DEFAULT_LOGIN_WORKERS, DEFAULT_TOKEN_CACHE, token_expiry
+from client_profiler import CAPTURE_MODES, DEFAULT_OVERHEAD_THRESHOLD
+from resilience import DEFAULT_BREAKER_COOLDOWN, DEFAULT_RETRY_BUDGET, CircuitOpenError
+from http_engine import (
+    DEFAULT_MAX_RETRIES, DEFAULT_POOL_SIZE, RequestConnectionError, RequestTimeout, create_session, transfer_stats
+)
+
 # 테스트 설정
 BASE_URL = "http://localhost:3001"
 TIMEOUT = 10
@@ -17,75 +28,219 @@ TIMEOUT = 10
 LOGIN_EMAIL = "sjlee87@kakao.com"
 LOGIN_PASSWORD = "test123456@"
 
+# run_all_tests 성공 판정 기준 (통과한 테스트 비율)
+MIN_PASS_RATE = 0.8
+
 class AuthenticatedCRUDTester:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'EduCanvas-API-Tester/1.0'
-        })
+    def __init__(self, verbose: bool = True, metrics=None, engine=None,
+                 pool_size: int = DEFAULT_POOL_SIZE, max_retries: int = DEFAULT_MAX_RETRIES,
+                 stream_lists: bool = False, scenarios=None, resilience=None):
+        self.verbose = verbose
+        self.stream_lists = stream_lists  # 목록 조회를 스트리밍 파싱 (stream_list)
+        self.metrics = metrics if metrics is not None else LoadMetrics()  # 부하 테스트 시 공유
+        self.engine = engine  # http_engine.AsyncHttpEngine (None이면 동기 requests 경로)
+        self.session = create_session(pool_size=pool_size, max_retries=max_retries)
         self.access_token = None
         self.user_profile = None
         self.tenant_id = None
-        
-    def log(self, message: str, level: str = "INFO"):
-        """로그 출력"""
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
+        self.token_expires_at = None  # 토큰 만료 시각 (epoch 초)
+        self.credential = None  # credential_pool.Credential (자격 증명 풀에서 배정된 경우)
+        self.scenario_runner = ScenarioRunner(self, scenarios) if scenarios else None  # 시나리오 파일 모드
+        self.profiler = None  # client_profiler.ClientProfiler (지정하면 요청마다 클라이언트 CPU 시간 기록)
+        self.resilience = resilience  # resilience.Resilience (라우트별 타임아웃 / 백오프 재시도 / 서킷 브레이커, 가상 사용자 간 공유)
+        self.last_call = None  # 마지막 요청의 상태코드 / 응답 시간(초) / 응답 크기 / 응답 헤더 (동기 호출 직후에만 유효)
+        
+    def log(self, message: str, level: str = "INFO", sampled: bool = False):
+        """로그 출력 (버퍼 로거 큐에 넣고 반환, sampled: 요청 단위 줄 - 초당 줄 수 제한 대상)"""
+        if not self.verbose and level == "INFO":
+            return
+        LOGGER.log(message, level, sampled)
+        
+    def set_access_token(self, access_token: Optional[str]):
+        """인증 토큰을 세션 기본 헤더에 설정 (이후 모든 요청에 자동 포함)"""
+        self.access_token = access_token
+        if access_token:
+            self.session.headers['Authorization'] = f'Bearer {access_token}'
+        else:
+            self.session.headers.pop('Authorization', None)
+    
+    def _request_headers(self, headers: Dict = None) -> Dict:
+        """async 엔진용 헤더: 세션 기본 헤더(인증 포함) + 호출별 헤더"""
+        request_headers = dict(self.session.headers)
+        if headers:
+            request_headers.update(headers)
+        return request_headers
         
     def test_api_endpoint(self, method: str, endpoint: str, data: Dict = None, expected_status: int = 200, headers: Dict = None) -> Dict:
         """API 엔드포인트 테스트"""
         url = f"{BASE_URL}{endpoint}"
         
-        # 인증 헤더 추가
-        request_headers = self.session.headers.copy()
-        if self.access_token:
-            request_headers['Authorization'] = f'Bearer {self.access_token}'
-        if headers:
-            request_headers.update(headers)
-        
+        started = time.perf_counter()
+        cpu_started = time.thread_time()
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=request_headers, timeout=TIMEOUT)
-            elif method.upper() == "POST":
-                response = requests.post(url, json=data, headers=request_headers, timeout=TIMEOUT)
-            elif method.upper() == "PUT":
-                response = requests.put(url, json=data, headers=request_headers, timeout=TIMEOUT)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=request_headers, timeout=TIMEOUT)
+            if self.resilience is not None:
+                # 응답 시간은 재시도 대기를 포함한 호출자 체감 시간
+                response = self.resilience.call(method, endpoint, lambda timeout: self._send(method, url, data, headers, timeout))
             else:
-                raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
-                
-            self.log(f"{method} {endpoint} -> {response.status_code}")
+                response = self._send(method, url, data, headers, TIMEOUT)
+        except Exception as e:
+            return self._handle_request_error(method, endpoint, url, e)
+        
+        result = self._handle_response(method, endpoint, response, expected_status, time.perf_counter() - started)
+        if self.profiler is not None:
+            # 스레드 CPU 시간은 소켓 대기를 포함하지 않으므로 요청 구성 / 응답 파싱 / 로그 등 클라이언트 작업량
+            self.profiler.record_call(time.thread_time() - cpu_started, time.perf_counter() - started)
+        return result
+    
+    def _send(self, method: str, url: str, data: Dict, headers: Dict, timeout: float, stream: bool = False):
+        """요청 1회 전송 (인증 헤더는 세션 기본 헤더에 있으므로 호출별 헤더만 전달, stream은 동기 GET만)"""
+        if self.engine is not None:
+            return self.engine.request(method, url, json=data, headers=self._request_headers(headers), timeout=timeout)
+        if method.upper() == "GET":
+            return self.session.get(url, headers=headers, timeout=timeout, stream=stream)
+        if method.upper() == "POST":
+            return self.session.post(url, json=data, headers=headers, timeout=timeout)
+        if method.upper() == "PUT":
+            return self.session.put(url, json=data, headers=headers, timeout=timeout)
+        if method.upper() == "DELETE":
+            return self.session.delete(url, headers=headers, timeout=timeout)
+        raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
+    
+    async def test_api_endpoint_async(self, method: str, endpoint: str, data: Dict = None, expected_status: int = 200, headers: Dict = None) -> Dict:
+        """API 엔드포인트 테스트 (이벤트 루프용, 엔진이 없으면 동기 경로를 스레드에서 실행)"""
+        if self.engine is None:
+            import asyncio
             
-            # 응답 내용 확인
-            try:
-                response_data = response.json()
-                if response.status_code != expected_status:
-                    error_msg = response_data.get('error', response_data.get('message', 'Unknown error'))
-                    self.log(f"예상 상태코드({expected_status})와 다름: {error_msg}", "WARN")
-                return response_data
-            except:
-                self.log(f"JSON 응답 파싱 실패: {response.text[:100]}", "ERROR")
-                return {"error": "Invalid JSON response", "raw": response.text[:200]}
-                
-        except requests.exceptions.Timeout:
+            return await asyncio.to_thread(self.test_api_endpoint, method, endpoint, data, expected_status, headers)
+        
+        url = f"{BASE_URL}{endpoint}"
+        
+        started = time.perf_counter()
+        request_headers = self._request_headers(headers)
+        try:
+            if self.resilience is not None:
+                response = await self.resilience.call_async(
+                    method, endpoint,
+                    lambda timeout: self.engine.request_async(method, url, json=data, headers=request_headers, timeout=timeout)
+                )
+            else:
+                response = await self.engine.request_async(method, url, json=data, headers=request_headers, timeout=TIMEOUT)
+        except Exception as e:
+            return self._handle_request_error(method, endpoint, url, e)
+        
+        return self._handle_response(method, endpoint, response, expected_status, time.perf_counter() - started)
+    
+    def _handle_response(self, method: str, endpoint: str, response, expected_status: int, elapsed: float) -> Dict:
+        """응답 상태 기록 및 JSON 파싱"""
+        self.log(f"{method} {endpoint} -> {response.status_code} ({elapsed * 1000:.1f}ms)", sampled=True)
+        payload_bytes = len(response.content)
+        wire_bytes, ttfb = transfer_stats(response)
+        self.last_call = {"status": response.status_code, "elapsed": elapsed, "bytes": payload_bytes,
+                          "headers": response.headers}
+        self.metrics.record(method, endpoint, response.status_code, elapsed, payload_bytes, wire_bytes, ttfb)
+        
+        # 응답 내용 확인
+        try:
+            response_data = response.json()
+            if response.status_code != expected_status:
+                error_msg = response_data.get('error', response_data.get('message', 'Unknown error'))
+                self.log(f"예상 상태코드({expected_status})와 다름: {error_msg}", "WARN")
+            return response_data
+        except:
+            preview = response.content[:200].decode("utf-8", errors="replace")
+            self.log(f"JSON 응답 파싱 실패: {preview[:100]}", "ERROR")
+            return {"error": "Invalid JSON response", "raw": preview}
+    
+    def _handle_request_error(self, method: str, endpoint: str, url: str, e: Exception) -> Dict:
+        """응답을 받지 못한 요청 처리"""
+        self._record_failure(method, endpoint)
+        if isinstance(e, CircuitOpenError):
+            self.log(f"{e} - 요청 생략", sampled=True)
+            return {"error": "Circuit open"}
+        if isinstance(e, (requests.exceptions.Timeout, RequestTimeout)):
             self.log(f"요청 타임아웃: {url}", "ERROR")
             return {"error": "Request timeout"}
-        except requests.exceptions.ConnectionError:
+        if isinstance(e, (requests.exceptions.ConnectionError, RequestConnectionError)):
             self.log(f"연결 실패: {url}", "ERROR")
             return {"error": "Connection failed"}
+        self.log(f"요청 실패: {str(e)}", "ERROR")
+        return {"error": str(e)}
+    
+    def _record_failure(self, method: str, endpoint: str):
+        """응답을 받지 못한 요청을 지표에 기록"""
+        self.last_call = {"status": None, "elapsed": None, "bytes": 0, "headers": {}}
+        self.metrics.record(method, endpoint, None)
+    
+    def stream_list(self, endpoint: str, list_key: str, on_item=None, expected_status: int = 200) -> Dict:
+        """
+        목록 응답을 스트리밍으로 받아 배열 원소를 하나씩 파싱 (전체 본문을 메모리에 올리지 않음)
+        on_item: 원소마다 호출할 함수, 반환: 항목 수 / 전송·압축 해제 바이트 / TTFB / 응답 시간
+        """
+        url = f"{BASE_URL}{endpoint}"
+        headers = {"Accept-Encoding": ACCEPT_ENCODING}
+
+        def send(timeout):
+            response = self._send("GET", url, None, headers, timeout, stream=True)
+            if response.status_code != expected_status:
+                # 에러 응답은 작으므로 바로 읽어 연결 반환 (재시도로 버려져도 풀에 남지 않게)
+                response.content
+            return response
+
+        started = time.perf_counter()
+        try:
+            if self.resilience is not None:
+                # 일반 요청과 같은 라우트별 타임아웃 / 재시도 예산 / 서킷 브레이커 적용
+                response = self.resilience.call("GET", endpoint, send)
+            else:
+                response = send(TIMEOUT)
         except Exception as e:
-            self.log(f"요청 실패: {str(e)}", "ERROR")
-            return {"error": str(e)}
+            return self._handle_request_error("GET", endpoint, url, e)
+        
+        ttfb = time.perf_counter() - started
+        with response:
+            if response.status_code != expected_status:
+                # 에러 응답은 작으므로 일반 경로로 처리
+                return self._handle_response("GET", endpoint, response, expected_status, time.perf_counter() - started)
+            try:
+                reader = BodyReader(response.raw, response.headers.get("Content-Encoding", ""))
+                count = 0
+                for item in iter_array_items(reader, (list_key, "items")):
+                    count += 1
+                    if on_item is not None:
+                        on_item(item)
+            except Exception as e:
+                return self._handle_request_error("GET", endpoint, url, e)
+        
+        elapsed = time.perf_counter() - started
+        self.log(f"GET {endpoint} -> {response.status_code} ({elapsed * 1000:.1f}ms, 스트리밍 {count}건)", sampled=True)
+        self.last_call = {"status": response.status_code, "elapsed": elapsed, "bytes": reader.body_bytes,
+                          "headers": response.headers}
+        self.metrics.record("GET", endpoint, response.status_code, elapsed, reader.body_bytes, reader.wire_bytes, ttfb)
+        return {
+            "count": count,
+            "wire_bytes": reader.wire_bytes,
+            "body_bytes": reader.body_bytes,
+            "ttfb": ttfb,
+            "elapsed": elapsed,
+        }
+    
+    def list_count(self, endpoint: str, list_key: str) -> Optional[int]:
+        """목록 조회 후 항목 수 반환 (실패 시 None), stream_lists가 켜져 있으면 스트리밍 파싱"""
+        if self.stream_lists and self.engine is None:
+            response = self.stream_list(endpoint, list_key)
+            return None if "error" in response else response["count"]
+        response = self.test_api_endpoint("GET", endpoint)
+        if "error" in response:
+            return None
+        return len(response.get(list_key, []))
     
-    def login(self) -> bool:
+    def login(self, email: str = LOGIN_EMAIL, password: str = LOGIN_PASSWORD) -> bool:
         """로그인 시도"""
         self.log("=== 로그인 시도 ===")
         
         login_data = {
-            "email": LOGIN_EMAIL,
-            "password": LOGIN_PASSWORD
+            "email": email,
+            "password": password
         }
         
         response = self.test_api_endpoint("POST", "/api/auth/login", login_data, expected_status=200)
@@ -96,7 +251,8 @@ class AuthenticatedCRUDTester:
         
         # 토큰 추출
         if "access_token" in response:
-            self.access_token = response["access_token"]
+            self.set_access_token(response["access_token"])
+            self.token_expires_at = token_expiry(response["access_token"], response)
             self.user_profile = response.get("user", {})
             self.tenant_id = self.user_profile.get("tenant_id")
             
@@ -118,10 +274,9 @@ class AuthenticatedCRUDTester:
         if self.tenant_id:
             params += f"&tenantId={self.tenant_id}"
         
-        response = self.test_api_endpoint("GET", f"/api/students{params}")
+        students_count = self.list_count(f"/api/students{params}", "students")
         
-        if "error" not in response:
-            students_count = len(response.get("students", []))
+        if students_count is not None:
             self.log(f"   조회된 학생 수: {students_count}")
             
             # 2. 학생 생성 테스트
@@ -183,10 +338,9 @@ class AuthenticatedCRUDTester:
             return False
         
         # 1. 클래스 목록 조회
-        response = self.test_api_endpoint("GET", f"/api/classes?tenantId={self.tenant_id}&limit=5")
+        classes_count = self.list_count(f"/api/classes?tenantId={self.tenant_id}&limit=5", "classes")
         
-        if "error" not in response:
-            classes_count = len(response.get("classes", []))
+        if classes_count is not None:
             self.log(f"   조회된 클래스 수: {classes_count}")
             
             # 2. 클래스 생성
@@ -223,10 +377,9 @@ class AuthenticatedCRUDTester:
             return False
         
         # 1. 강사 목록 조회
-        response = self.test_api_endpoint("GET", f"/api/instructors?tenantId={self.tenant_id}&limit=5")
+        instructors_count = self.list_count(f"/api/instructors?tenantId={self.tenant_id}&limit=5", "instructors")
         
-        if "error" not in response:
-            instructors_count = len(response.get("instructors", []))
+        if instructors_count is not None:
             self.log(f"   조회된 강사 수: {instructors_count}")
             
             # 2. 강사 생성
@@ -255,10 +408,9 @@ class AuthenticatedCRUDTester:
             return False
         
         # 1. 코스패키지 목록 조회
-        response = self.test_api_endpoint("GET", f"/api/course-packages?tenantId={self.tenant_id}&limit=5")
+        packages_count = self.list_count(f"/api/course-packages?tenantId={self.tenant_id}&limit=5", "course_packages")
         
-        if "error" not in response:
-            packages_count = len(response.get("course_packages", []))
+        if packages_count is not None:
             self.log(f"   조회된 패키지 수: {packages_count}")
             
             # 2. 코스패키지 생성
@@ -289,10 +441,9 @@ class AuthenticatedCRUDTester:
             return False
         
         # 1. 수강등록 목록 조회
-        response = self.test_api_endpoint("GET", f"/api/enrollments?tenantId={self.tenant_id}&limit=5")
+        enrollments_count = self.list_count(f"/api/enrollments?tenantId={self.tenant_id}&limit=5", "enrollments")
         
-        if "error" not in response:
-            enrollments_count = len(response.get("enrollments", []))
+        if enrollments_count is not None:
             self.log(f"   조회된 수강등록 수: {enrollments_count}")
             return True
         
@@ -306,10 +457,9 @@ class AuthenticatedCRUDTester:
             return False
         
         # 1. 급여정책 목록 조회
-        response = self.test_api_endpoint("GET", f"/api/salary-policies?tenantId={self.tenant_id}&limit=5")
+        policies_count = self.list_count(f"/api/salary-policies?tenantId={self.tenant_id}&limit=5", "salary_policies")
         
-        if "error" not in response:
-            policies_count = len(response.get("salary_policies", []))
+        if policies_count is not None:
             self.log(f"   조회된 급여정책 수: {policies_count}")
             
             # 2. 급여정책 생성
@@ -329,18 +479,11 @@ class AuthenticatedCRUDTester:
         
         return False
     
-    def run_all_tests(self):
-        """모든 테스트 실행"""
-        self.log("EduCanvas 인증된 CRUD API 테스트 시작")
-        self.log("=" * 60)
-        
-        # 로그인
-        if not self.login():
-            self.log("로그인 실패로 테스트를 중단합니다.", "ERROR")
-            return False
-        
-        # 각 CRUD 테스트 실행
-        tests = [
+    def crud_tests(self):
+        """실행할 CRUD 테스트 목록 (부하 테스트 반복 1회분, 시나리오 모드에서는 가중치로 고른 시나리오 1개)"""
+        if self.scenario_runner is not None:
+            return self.scenario_runner.weighted_flows()
+        return [
             ("학생 CRUD", self.test_students_crud),
             ("클래스 CRUD", self.test_classes_crud),
             ("강사 CRUD", self.test_instructors_crud),
@@ -348,6 +491,19 @@ class AuthenticatedCRUDTester:
             ("수강등록 CRUD", self.test_enrollments_crud),
             ("급여정책 CRUD", self.test_salary_policies_crud)
         ]
+    
+    def run_all_tests(self, min_pass_rate: float = MIN_PASS_RATE):
+        """모든 테스트 실행"""
+        self.log("EduCanvas 인증된 CRUD API 테스트 시작")
+        self.log("=" * 60)
+        
+        # 로그인 (자격 증명 풀에서 이미 토큰을 배정받았으면 생략)
+        if self.access_token is None and not self.login():
+            self.log("로그인 실패로 테스트를 중단합니다.", "ERROR")
+            return False
+        
+        # 각 CRUD 테스트 실행 (시나리오 모드에서는 모든 시나리오를 한 번씩)
+        tests = self.scenario_runner.all_flows() if self.scenario_runner is not None else self.crud_tests()
         
         passed = 0
         total = len(tests)
@@ -365,15 +521,284 @@ class AuthenticatedCRUDTester:
         
         self.log("=" * 60)
         self.log(f"테스트 완료: {passed}/{total} 통과")
+        self.log("엔드포인트별 응답 시간 (ms)")
+        LOGGER.write(self.metrics.format_latency_report())
+        self.log("엔드포인트별 응답 크기")
+        LOGGER.write(self.metrics.format_payload_report())
         
         if passed == total:
             self.log("🎉 모든 CRUD API가 정상적으로 작동합니다!")
         else:
             self.log("⚠️ 일부 API에 문제가 있습니다.", "WARN")
         
-        return passed >= (total * 0.8)  # 80% 이상 통과하면 성공으로 간주
+        return passed >= (total * min_pass_rate)  # 기본 80% 이상 통과하면 성공으로 간주
+
+def parse_args(argv=None, prog: str = None):
+    import argparse
+    from mock_server import add_mock_arguments
+    from soak import add_soak_arguments
+    
+    parser = argparse.ArgumentParser(prog=prog, description="EduCanvas 인증된 CRUD API 테스트")
+    parser.add_argument("--users", type=int, default=0,
+                        help="부하 테스트 가상 사용자 수 (0이면 단일 실행)")
+    parser.add_argument("--duration", type=float, default=None,
+                        help="부하 테스트 실행 시간(초)")
+    parser.add_argument("--iterations", type=int, default=None,
+                        help="가상 사용자당 CRUD 플로우 반복 횟수")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="부하 테스트 워커 프로세스 수 (0이면 CPU 코어 수, 2 이상이면 가상 사용자를 프로세스별로 분배)")
+    parser.add_argument("--accounts", default=None,
+                        help="다중 계정 파일 (.json / .csv), 지정하면 가상 사용자에게 계정을 테넌트별로 번갈아 배정")
+    parser.add_argument("--token-cache", default=DEFAULT_TOKEN_CACHE,
+                        help="토큰 캐시 파일 (--accounts 사용 시, 빈 문자열이면 캐시하지 않음)")
+    parser.add_argument("--login-workers", type=int, default=DEFAULT_LOGIN_WORKERS,
+                        help="시작 시 병렬 로그인 수")
+    parser.add_argument("--engine", choices=["sync", "async"], default="sync",
+                        help="HTTP 엔진 (async는 aiohttp 필요, 없으면 sync로 폴백)")
+    parser.add_argument("--max-concurrency", type=int, default=200,
+                        help="async 엔진 동시 요청 상한")
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE,
+                        help="동기 세션 커넥션 풀 크기")
+    parser.add_argument("--retries", type=int, default=DEFAULT_MAX_RETRIES,
+                        help="연결 실패 / 502·503·504 재시도 횟수 (멱등 메서드만, --backoff면 백오프 재시도 횟수)")
+    parser.add_argument("--timeouts", default=None,
+                        help='라우트별 타임아웃(초), 예: "default=10,POST /api/salary/calculate=30,/api/students=3"')
+    parser.add_argument("--backoff", action="store_true",
+                        help="세션 자동 재시도 대신 지터 지수 백오프 + 재시도 예산으로 재시도 (--retries 횟수, 429 포함)")
+    parser.add_argument("--retry-budget", type=float, default=DEFAULT_RETRY_BUDGET,
+                        help="원 요청 대비 재시도 비율 상한 (--backoff, 0이면 제한 없음)")
+    parser.add_argument("--breaker", type=int, default=0,
+                        help="엔드포인트별 서킷 브레이커를 여는 연속 실패 횟수 (0이면 사용 안 함)")
+    parser.add_argument("--breaker-cooldown", type=float, default=DEFAULT_BREAKER_COOLDOWN,
+                        help="서킷이 열린 뒤 다시 확인 요청을 보내기까지의 시간(초)")
+    parser.add_argument("--stream-lists", action="store_true",
+                        help="목록 응답을 스트리밍 파싱하고 전송 / 압축 해제 바이트를 집계 (sync 엔진)")
+    parser.add_argument("--scenarios", default=None,
+                        help="기본 CRUD 플로우 대신 실행할 가중치 시나리오 파일 (.yaml / .json)")
+    parser.add_argument("--results", default=None,
+                        help="요청별 결과 / 라우트별 요약 저장 경로 (.json 또는 .jsonl)")
+    parser.add_argument("--client-profile", action="store_true",
+                        help="테스터 자체 오버헤드 계측 (요청당 CPU 시간, GIL / 이벤트 루프 지연, GC 일시 정지)")
+    parser.add_argument("--profile", choices=CAPTURE_MODES, default=None,
+                        help="실행 전체 프로파일 캡처 (cprofile 또는 sample, --client-profile 포함)")
+    parser.add_argument("--profile-output", default=None,
+                        help="프로파일 캡처 저장 경로 (기본: client_profile.prof / client_profile.txt)")
+    parser.add_argument("--overhead-threshold", type=float, default=DEFAULT_OVERHEAD_THRESHOLD,
+                        help="클라이언트 CPU가 측정 지연의 이 비율을 넘으면 경고")
+    parser.add_argument("--log-level", choices=list(LEVELS), default="INFO",
+                        help="출력할 최소 로그 레벨")
+    parser.add_argument("--log-rate", type=float, default=DEFAULT_INFO_RATE,
+                        help="요청 단위 INFO 로그 초당 최대 줄 수 (0이면 제한 없음)")
+    parser.add_argument("--no-live", action="store_true",
+                        help="부하 테스트 중 RPS / 에러 / p95 상태 줄을 표시하지 않음")
+    parser.add_argument("--min-pass-rate", type=float, default=MIN_PASS_RATE,
+                        help="단일 실행 성공 판정 통과 비율 (1.0이면 전부 통과해야 성공)")
+    parser.add_argument("--mock", action="store_true",
+                        help="실제 서버 대신 프로세스 안에서 대역 서버를 띄워 테스트 (오프라인 테스터 처리량 측정)")
+    add_mock_arguments(parser)
+    add_soak_arguments(parser)
+    return parser.parse_args(argv)
+
+def create_soak_monitor(args, metrics, credential_pool=None):
+    """soak 모니터 생성, 데이터셋 크기 조회용 테스터는 부하 지표와 섞이지 않도록 따로 로그인"""
+    from soak import SoakMonitor
+    
+    probe = AuthenticatedCRUDTester(verbose=False, pool_size=1)
+    logged_in = credential_pool.assign(probe) if credential_pool is not None else probe.login()
+    if not logged_in:
+        LOGGER.log("데이터셋 크기 조회용 로그인 실패 - 데이터셋 크기 추적 생략", "WARN")
+        probe = None
+    try:
+        return SoakMonitor(metrics, window=args.soak_window, probe=probe, server_pid=args.server_pid,
+                           rolling_windows=args.soak_rolling, alpha=args.drift_alpha,
+                           min_drift=args.drift_threshold, output=args.soak_output)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        exit(2)
+
+def main(args) -> bool:
+    """단일 실행 / 부하 테스트 (api_tester.py auth-crud / load에서도 호출)"""
+    global BASE_URL
+    import functools
+    import os
+    from http_engine import create_engine
+    from credential_pool import CredentialPool, load_accounts
+    from scenario_engine import load_scenarios
+    
+    LOGGER.configure(level=args.log_level, info_rate=args.log_rate)
+    mock_server = None
+    if args.mock:
+        from mock_server import MockApiServer
+        
+        try:
+            mock_server = MockApiServer.from_args(args)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: 대역 서버를 시작할 수 없습니다: {e}")
+            exit(2)
+        BASE_URL = mock_server.start()
+        LOGGER.log(f"대역 서버 사용: {BASE_URL}")
+    scenarios = None
+    if args.scenarios:
+        try:
+            scenarios = load_scenarios(args.scenarios)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: 시나리오 파일을 읽을 수 없습니다: {e}")
+            exit(2)
+        if mock_server is not None:
+            from mock_server import serves
+            
+            unserved = sorted({step.path.split("?", 1)[0] for scenario in scenarios for step in scenario.steps
+                               if not serves(step.path)})
+            if unserved:
+                LOGGER.log(f"대역 서버가 처리하지 않는 경로는 404로 실패합니다: {', '.join(unserved)} "
+                           f"(대역 서버용 믹스: scenarios/mock_mix.yaml)", "WARN")
+    processes = args.processes or os.cpu_count() or 1
+    multiprocess = args.users > 0 and processes > 1
+    # 멀티프로세스 모드에서는 워커마다 엔진을 새로 만듦
+    engine = None if multiprocess else create_engine(args.engine, max_concurrency=args.max_concurrency)
+    credential_pool = None
+    if args.accounts:
+        try:
+            credentials = load_accounts(args.accounts)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: 계정 파일을 읽을 수 없습니다: {e}")
+            exit(2)
+        credential_pool = CredentialPool(
+            credentials,
+            functools.partial(AuthenticatedCRUDTester, verbose=False, pool_size=args.pool_size, max_retries=args.retries),
+            cache_path=args.token_cache or None, namespace=BASE_URL, login_workers=args.login_workers,
+        )
+        if not credential_pool.login_all():
+            print("ERROR: 로그인 가능한 계정이 없습니다")
+            exit(1)
+    profiler = None
+    if args.client_profile or args.profile:
+        if multiprocess:
+            print("WARN: 멀티프로세스 모드에서는 클라이언트 프로파일링을 지원하지 않습니다 (--processes 1로 실행)")
+        else:
+            from client_profiler import ClientProfiler
+            
+            profiler = ClientProfiler(overhead_threshold=args.overhead_threshold, capture=args.profile,
+                                      capture_path=args.profile_output, loop=getattr(engine, "loop", None))
+    resilience = None
+    if args.timeouts or args.backoff or args.breaker:
+        if multiprocess:
+            print("WARN: 멀티프로세스 모드에서는 --timeouts / --backoff / --breaker를 지원하지 않습니다 (--processes 1로 실행)")
+        else:
+            from resilience import Resilience, RouteTimeouts
+            
+            try:
+                timeouts = RouteTimeouts.parse(args.timeouts, default=TIMEOUT) if args.timeouts else RouteTimeouts(TIMEOUT)
+            except ValueError as e:
+                print(f"ERROR: {e}")
+                exit(2)
+            resilience = Resilience(timeouts, max_retries=args.retries if args.backoff else 0,
+                                    retry_budget=args.retry_budget or None, breaker_failures=args.breaker,
+                                    breaker_cooldown=args.breaker_cooldown)
+    if args.soak:
+        if args.users <= 0:
+            print("ERROR: --soak은 부하 테스트에서만 사용할 수 있습니다 (--users 지정 또는 api_tester.py soak)")
+            exit(2)
+        if multiprocess:
+            print("WARN: 멀티프로세스 모드에서는 --soak을 지원하지 않습니다 (--processes 1로 실행)")
+        elif args.results and not args.results.endswith(".jsonl"):
+            print("WARN: --results가 .json이면 요청별 기록을 종료 시까지 메모리에 모읍니다 (soak에는 .jsonl 권장)")
+    # 백오프 재시도를 쓰면 세션(urllib3) 자동 재시도는 꺼서 재시도가 겹치지 않도록 함
+    session_retries = 0 if resilience is not None and args.backoff else args.retries
+    soak_monitor = None
+    soak_trends = None
+    results_writer = None
+    if args.results:
+        from bench_results import ResultsWriter
+        
+        results_writer = ResultsWriter(args.results, meta={"tool": "test_authenticated_crud", "base_url": BASE_URL,
+                                                           "mock": args.mock})
+    try:
+        if args.users > 0:
+            from load_runner import LoadRunner
+            
+            iterations = args.iterations
+            duration = args.duration
+            if duration is None and iterations is None:
+                if args.soak:
+                    from soak import DEFAULT_SOAK_DURATION
+                    
+                    duration = DEFAULT_SOAK_DURATION
+                else:
+                    iterations = 1
+            if multiprocess:
+                from process_launcher import ProcessLauncher
+                
+                # 워커 프로세스로 전달되므로 pickle 가능한 partial 사용
+                tester_factory = functools.partial(AuthenticatedCRUDTester, pool_size=args.pool_size,
+                                                   max_retries=args.retries, stream_lists=args.stream_lists,
+                                                   scenarios=scenarios)
+                runner = ProcessLauncher(tester_factory, users=args.users, duration=duration,
+                                         iterations=iterations, processes=processes,
+                                         engine_kind=args.engine, max_concurrency=args.max_concurrency,
+                                         credential_pool=credential_pool)
+            else:
+                def tester_factory():
+                    return AuthenticatedCRUDTester(engine=engine, pool_size=args.pool_size, max_retries=session_retries,
+                                                   stream_lists=args.stream_lists, scenarios=scenarios,
+                                                   resilience=resilience)
+                
+                runner = LoadRunner(tester_factory, users=args.users, duration=duration, iterations=iterations,
+                                    credential_pool=credential_pool, profiler=profiler, live=not args.no_live)
+            metrics = runner.metrics
+            metrics.results_writer = results_writer
+            if args.soak and not multiprocess:
+                soak_monitor = create_soak_monitor(args, metrics, credential_pool)
+                soak_monitor.start()
+            success = runner.run(report=soak_monitor is None)
+            if soak_monitor is not None:
+                soak_monitor.stop()
+                runner.print_report()
+                soak_trends = soak_monitor.trends()
+                LOGGER.log("soak 추세 (구간 p95 / 메모리 / 데이터셋 크기)")
+                LOGGER.write(soak_monitor.format_report(soak_trends))
+                drifting = soak_monitor.drifting(soak_trends)
+                for name in drifting:
+                    LOGGER.log(f"{name}: 실행 시간에 따라 유의하게 증가했습니다", "WARN")
+                success = success and not drifting
+        else:
+            tester = AuthenticatedCRUDTester(engine=engine, pool_size=args.pool_size, max_retries=session_retries,
+                                             stream_lists=args.stream_lists, scenarios=scenarios,
+                                             resilience=resilience)
+            if credential_pool is not None:
+                credential_pool.assign(tester)
+            tester.profiler = profiler
+            metrics = tester.metrics
+            metrics.results_writer = results_writer
+            metrics.start()
+            if profiler is not None:
+                profiler.start()
+            success = tester.run_all_tests(min_pass_rate=args.min_pass_rate)
+            metrics.stop()
+            if profiler is not None:
+                profiler.stop()
+                tester.log("클라이언트 오버헤드", "INFO")
+                LOGGER.write(profiler.format_report())
+                for warning in profiler.warnings():
+                    tester.log(warning, "WARN")
+        if resilience is not None:
+            LOGGER.log("타임아웃 / 재시도 / 서킷 브레이커")
+            LOGGER.write(resilience.format_report())
+        if results_writer is not None:
+            extra = {"success": success}
+            if profiler is not None:
+                extra["client_profile"] = profiler.to_dict()
+            if resilience is not None:
+                extra["resilience"] = resilience.to_dict()
+            if soak_monitor is not None:
+                extra["soak"] = soak_monitor.to_dict(soak_trends)
+            results_writer.close(metrics, extra=extra)
+    finally:
+        if engine is not None:
+            engine.close()
+        if mock_server is not None:
+            mock_server.stop()
+    return success
 
 if __name__ == "__main__":
-    tester = AuthenticatedCRUDTester()
-    success = tester.run_all_tests()
-    exit(0 if success else 1)
\ No newline at end of file
+    exit(0 if main(parse_args()) else 1)
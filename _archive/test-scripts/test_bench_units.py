@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+테스터 / 벤치마크 스크립트의 순수 함수 단위 테스트 (서버 없이 실행)
+
+사용법:
+    python -m pytest -q test_bench_units.py
+"""
+
+from typing import List
+
+import pytest
+
+from bench_results import TOTAL_ROUTE, compare_summaries, format_comparison
+from load_metrics import LatencyHistogram, route_template
+from mock_server import serves
+from open_loop import parse_ramp
+from pagination_bench import PaginationBenchmark, extract_page, total_pages
+from search_bench import typing_prefixes
+from soak import DATASET_PROBES, dataset_total, mann_kendall, theil_sen_slope, trend
+from stream_json import iter_array_items
+
+
+# --- load_metrics ---
+
+def test_percentile_exact_below_linear_range():
+    """선형 버킷 범위(2^sub_bucket_bits 미만)에서는 백분위가 정확함"""
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value)
+    assert histogram.percentile(50) == 50
+    assert histogram.percentile(95) == 95
+    assert histogram.percentile(100) == 100
+    assert histogram.percentile(0) == 1
+
+
+def test_percentile_relative_error_bounded():
+    histogram = LatencyHistogram()
+    values = [1_000 + 37 * i for i in range(10_000)]
+    for value in values:
+        histogram.record(value)
+    for percent in (50, 90, 95, 99):
+        exact = values[int(len(values) * percent / 100) - 1]
+        assert abs(histogram.percentile(percent) - exact) / exact < 1 / 64
+
+
+def test_percentile_never_exceeds_max_and_empty_is_zero():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(95) == 0
+    histogram.record(123_456)
+    assert histogram.percentile(99) == 123_456
+
+
+def test_merge_matches_single_histogram():
+    combined, left, right = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(0, 50_000, 7):
+        combined.record(value)
+        (left if value % 2 else right).record(value)
+    left.merge(right)
+    assert left.count == combined.count
+    assert (left.min, left.max) == (combined.min, combined.max)
+    for percent in (50, 95, 99):
+        assert left.percentile(percent) == combined.percentile(percent)
+
+
+def test_merge_rejects_different_precision():
+    with pytest.raises(ValueError):
+        LatencyHistogram(7).merge(LatencyHistogram(5))
+
+
+def test_dict_round_trip():
+    histogram = LatencyHistogram()
+    for value in (10, 2_000, 300_000):
+        histogram.record(value)
+    restored = LatencyHistogram.from_dict(histogram.to_dict())
+    assert restored.percentile(50) == histogram.percentile(50)
+    assert restored.count == 3
+
+
+@pytest.mark.parametrize("endpoint, expected", [
+    ("/api/students?tenantId=abc&limit=5", "/api/students"),
+    ("/api/students/6f1c2d3e-4a5b-4c6d-8e9f-0a1b2c3d4e5f", "/api/students/{id}"),
+    ("/api/classes/123/students", "/api/classes/{id}/students"),
+    ("/api/students/search?q=김", "/api/students/search"),
+    ("", "/"),
+])
+def test_route_template(endpoint, expected):
+    assert route_template(endpoint) == expected
+
+
+# --- bench_results ---
+
+def test_compare_flags_regression_over_threshold():
+    baseline = {"GET /api/students": {"count": 100, "p95_ms": 100.0}}
+    current = {"GET /api/students": {"count": 100, "p95_ms": 125.0}}
+    rows, regressions = compare_summaries(baseline, current, threshold_percent=20)
+    assert regressions == ["GET /api/students"]
+    assert rows[0]["change_percent"] == pytest.approx(25.0)
+    _, regressions = compare_summaries(baseline, current, threshold_percent=30)
+    assert regressions == []
+
+
+def test_compare_rps_lower_is_regression_and_adds_total():
+    baseline = {"GET /a": {"count": 10, "rps": 100.0}, "GET /b": {"count": 10, "rps": 100.0}}
+    current = {"GET /a": {"count": 10, "rps": 70.0}, "GET /b": {"count": 10, "rps": 130.0}}
+    rows, regressions = compare_summaries(baseline, current, threshold_percent=20, metric="rps")
+    assert regressions == ["GET /a"]
+    assert TOTAL_ROUTE in {row["route"] for row in rows}
+
+
+def test_compare_new_and_missing_routes_without_metric():
+    """새 / 사라진 라우트에 비교 지표가 없어도 KeyError 없이 보고, 사라진 라우트는 실패"""
+    baseline = {"GET /old": {"count": 5}, "GET /kept": {"count": 5, "p95_ms": 10.0}}
+    current = {"GET /new": {"count": 5}, "GET /kept": {"count": 5, "p95_ms": 10.0}}
+    rows, regressions = compare_summaries(baseline, current)
+    statuses = {row["route"]: row["status"] for row in rows}
+    assert statuses == {"GET /kept": "ok", "GET /new": "new", "GET /old": "MISSING"}
+    assert regressions == ["GET /old"]
+    assert "GET /new" in format_comparison(rows, "p95_ms")
+
+
+def test_compare_missing_route_below_min_count_is_skipped():
+    baseline = {"GET /rare": {"count": 2, "p95_ms": 10.0}}
+    rows, regressions = compare_summaries(baseline, {}, min_count=10)
+    assert rows[0]["status"] == "skipped" and regressions == []
+
+
+def test_compare_zero_baseline():
+    """기준선 0: 지연이 생기면 회귀, rps가 생기면 개선, 둘 다 0이면 변화 없음"""
+    rows, regressions = compare_summaries({"GET /a": {"count": 5, "p95_ms": 0.0}},
+                                          {"GET /a": {"count": 5, "p95_ms": 3.0}})
+    assert regressions == ["GET /a"] and rows[0]["change_percent"] == float("inf")
+    assert "+inf%" in format_comparison(rows, "p95_ms")
+    _, regressions = compare_summaries({"GET /a": {"count": 5, "rps": 0.0}},
+                                       {"GET /a": {"count": 5, "rps": 4.0}}, metric="rps")
+    assert regressions == []
+    rows, regressions = compare_summaries({"GET /a": {"count": 5, "p95_ms": 0.0}},
+                                          {"GET /a": {"count": 5, "p95_ms": 0.0}})
+    assert rows[0]["change_percent"] == 0.0 and regressions == []
+
+
+def test_compare_skips_low_count_routes():
+    baseline = {"GET /a": {"count": 100, "p95_ms": 10.0}}
+    current = {"GET /a": {"count": 2, "p95_ms": 50.0}}
+    rows, regressions = compare_summaries(baseline, current, min_count=10)
+    assert rows[0]["status"] == "skipped" and regressions == []
+
+
+# --- pagination_bench ---
+
+@pytest.mark.parametrize("response, expected", [
+    ({"data": {"items": [1, 2], "pagination": {"cursor": "c2", "has_more": True}}}, ([1, 2], "c2", True)),
+    ({"enrollments": [1], "pagination": {"hasMore": False}}, ([1], None, False)),
+    ({"enrollments": [1], "pagination": {"has_more": False, "hasMore": True}}, ([1], None, False)),
+    ({"enrollments": [], "next_cursor": "n", "has_more": True}, ([], "n", True)),
+    ({"enrollments": [1]}, ([1], None, None)),
+])
+def test_extract_page_reads_snake_and_camel_has_more(response, expected):
+    assert extract_page(response, "enrollments") == expected
+
+
+class _StaffPages:
+    """/api/staff 흉내: offset을 무시하고 page / limit으로만 페이지를 나눔"""
+    tenant_id = None
+    last_call = {"elapsed": 0.01, "bytes": 100}
+
+    def __init__(self, total: int):
+        self.total = total
+        self.requested: List[str] = []
+
+    def test_api_endpoint(self, method, endpoint):
+        from urllib.parse import parse_qsl
+
+        self.requested.append(endpoint)
+        query = dict(parse_qsl(endpoint.split("?", 1)[1]))
+        page, limit = int(query.get("page", 1)), int(query["limit"])
+        count = max(0, min(limit, self.total - (page - 1) * limit))
+        return {"instructors": [{}] * count,
+                "pagination": {"total": self.total, "page": page, "limit": limit,
+                               "totalPages": -(-self.total // limit)}}
+
+
+@pytest.mark.parametrize("total, limit, pages", [(250, 100, 3), (200, 100, 2), (0, 100, 1)])
+def test_walk_page_mode_stops_at_total_pages(total, limit, pages):
+    tester = _StaffPages(total)
+    result = PaginationBenchmark(tester).walk("staff", limit)
+    assert (result["pages"], result["items"], result["mode"]) == (pages, total, "page")
+    assert all("offset=" not in endpoint for endpoint in tester.requested)
+
+
+def test_total_pages():
+    assert total_pages({"pagination": {"totalPages": 4}}) == 4
+    assert total_pages({"data": {"pagination": {"total_pages": 2}}}) == 2
+    assert total_pages({"pagination": {"total": 10}}) is None
+
+
+# --- stream_json ---
+
+def test_iter_array_items_across_chunk_boundaries():
+    """원소 / 숫자 / 멀티바이트 문자가 청크 경계에서 잘려도 같은 결과"""
+    body = '{"data": {"students": [{"id": 1, "name": "김민"}, 2.5, "학생", [1, 2], null]}, "students_total": 5}'
+    expected = [{"id": 1, "name": "김민"}, 2.5, "학생", [1, 2], None]
+    encoded = body.encode("utf-8")
+    for size in (1, 2, 3, 7, len(encoded)):
+        chunks = [encoded[i:i + size] for i in range(0, len(encoded), size)]
+        assert list(iter_array_items(chunks, ["students"])) == expected
+
+
+def test_iter_array_items_uses_first_matching_key():
+    body = b'{"meta": {"x": [9]}, "classes": [1], "students": [2]}'
+    assert list(iter_array_items([body], ["students", "classes"])) == [1]
+    assert list(iter_array_items([b'{"students": []}'], ["students"])) == []
+
+
+def test_iter_array_items_rejects_missing_key():
+    """목록 키가 없는 응답(에러 본문 등)을 항목 0건으로 보고하지 않음"""
+    with pytest.raises(ValueError):
+        list(iter_array_items([b'{"error": "Unauthorized"}'], ["students", "items"]))
+
+
+def test_iter_array_items_consumes_remaining_chunks():
+    """배열이 끝난 뒤 청크도 끝까지 소비 (바이트 집계 완료)"""
+    consumed = []
+
+    def chunks():
+        for chunk in (b'{"students": [1]', b', "pagination": {"total": 1}', b"}"):
+            consumed.append(chunk)
+            yield chunk
+
+    assert list(iter_array_items(chunks(), ["students"])) == [1]
+    assert len(consumed) == 3
+
+
+def test_iter_array_items_rejects_truncated_array():
+    with pytest.raises(ValueError):
+        list(iter_array_items([b'{"students": [1, 2'], ["students"]))
+
+
+# --- open_loop ---
+
+@pytest.mark.parametrize("spec, expected", [
+    ("10:50:10", [10.0, 20.0, 30.0, 40.0, 50.0]),
+    ("0.5:2:0.5", [0.5, 1.0, 1.5, 2.0]),
+    ("0.1:0.3:0.1", [0.1, 0.2, 0.3]),
+    ("5:5:1", [5.0]),
+    ("10:25:10", [10.0, 20.0]),
+])
+def test_parse_ramp_includes_stop(spec, expected):
+    assert parse_ramp(spec) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("spec", ["10:50", "a:b:c", "0:10:1", "10:5:1", "1:10:0", "1:10:-1"])
+def test_parse_ramp_rejects_invalid(spec):
+    with pytest.raises(ValueError):
+        parse_ramp(spec)
+
+
+# --- mock_server ---
+
+@pytest.mark.parametrize("path, expected", [
+    ("/api/auth/login", True),
+    ("/api/students?tenantId=x&limit=20", True),
+    ("/api/students/{{student_id}}?tenantId={{tenant_id}}", True),
+    ("/api/enrollments/6f1c2d3e-4a5b-4c6d-8e9f-0a1b2c3d4e5f", True),
+    ("/api/students/search?search=김", False),
+    ("/api/attendance/check-in", False),
+    ("/api/staff", False),
+])
+def test_mock_serves(path, expected):
+    assert serves(path) is expected
+
+
+def test_shipped_mock_mix_is_served_by_mock():
+    """scenarios/mock_mix.yaml은 --mock으로 끝까지 실행 가능해야 함"""
+    import os
+
+    pytest.importorskip("yaml")
+    from scenario_engine import load_scenarios
+
+    scenarios = load_scenarios(os.path.join(os.path.dirname(__file__), "scenarios", "mock_mix.yaml"))
+    assert all(serves(step.path) for scenario in scenarios for step in scenario.steps)
+
+
+# --- search_bench ---
+
+@pytest.mark.parametrize("text, expected", [
+    ("이미", ["ㅇ", "이", "임", "이미"]),
+    ("김민", ["ㄱ", "기", "김", "김ㅁ", "김미", "김민"]),
+    ("과", ["ㄱ", "고", "과"]),
+    ("닭", ["ㄷ", "다", "달", "닭"]),
+    ("값이", ["ㄱ", "가", "갑", "값", "값ㅇ", "값이"]),
+    ("A1", ["A", "A1"]),
+    ("", []),
+])
+def test_typing_prefixes_follow_ime_composition(text, expected):
+    """두벌식 조합 단계: 받침으로 붙었다 넘어가는 자음, 겹모음 / 겹받침의 중간 단계"""
+    assert typing_prefixes(text) == expected
+
+
+def test_typing_prefixes_end_with_full_text():
+    for text in ("홍길동", "010-1234", "수학A반"):
+        assert typing_prefixes(text)[-1] == text
+
+
+# --- soak ---
+
+def test_mann_kendall_detects_monotonic_trend():
+    z, p_value = mann_kendall([float(i) for i in range(20)])
+    assert z > 0 and p_value < 0.001
+    z, p_value = mann_kendall([float(-i) for i in range(20)])
+    assert z < 0 and p_value < 0.001
+
+
+def test_mann_kendall_no_trend_and_ties():
+    assert mann_kendall([5.0] * 10) == (0.0, 1.0)
+    assert mann_kendall([1.0, 2.0]) == (0.0, 1.0)
+    z, p_value = mann_kendall([1.0, 3.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 1.0])
+    assert p_value > 0.5
+
+
+def test_theil_sen_slope_ignores_outlier():
+    xs = [float(i) for i in range(11)]
+    ys = [2.0 * x + 1 for x in xs]
+    ys[5] = 1000.0
+    assert theil_sen_slope(xs, ys) == pytest.approx(2.0)
+    assert theil_sen_slope([1.0, 1.0], [0.0, 5.0]) == 0.0
+
+
+def test_trend_requires_significance_and_relative_change():
+    rising = [(hour / 10, 100.0 + hour * 5) for hour in range(40)]
+    result = trend(rising)
+    assert result["drift"] and result["slope_per_hour"] == pytest.approx(50.0)
+    # 유의하지만 상대 변화가 min_drift 미만이면 drift 아님
+    slight = [(hour / 10, 1000.0 + hour * 0.1) for hour in range(40)]
+    assert trend(slight)["p_value"] < 0.01 and not trend(slight)["drift"]
+    assert trend(rising[:5]) is None
+
+
+def test_dataset_probes_read_staff_total():
+    path, list_key = DATASET_PROBES["staff"]
+    assert path.startswith("/api/staff?")
+    response = {"success": True, "data": {"instructors": [{}], "pagination": {"total": 42, "page": 1}}}
+    assert dataset_total(response, list_key) == 42
+    assert all(not path.startswith("/api/instructors") for path, _ in DATASET_PROBES.values())
+
+
+# --- salary_bench ---
+
+def test_delete_calculations_only_targets_bench_rows(monkeypatch):
+    """--persist 정리 SQL은 가상 대상월 / 이번 실행 강사 / 실행 시작 이후 / 미승인 행으로 한정"""
+    from datetime import datetime, timezone
+
+    import salary_bench
+
+    executed = []
+
+    class Cursor:
+        rowcount = 3
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def execute(self, sql, params):
+            executed.append((sql, params))
+
+    class Connection:
+        committed = closed = False
+
+        def cursor(self):
+            return Cursor()
+
+        def commit(self):
+            Connection.committed = True
+
+        def close(self):
+            Connection.closed = True
+
+    class Driver:
+        @staticmethod
+        def connect(url):
+            return Connection()
+
+    monkeypatch.setattr(salary_bench, "_postgres_driver", lambda: Driver)
+    since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert salary_bench.delete_calculations("postgresql://bench", "tenant", ["i1", "i2"], since) == 3
+    sql, params = executed[0]
+    assert "status = 'calculated'" in sql and "calculation_month::text >= %s" in sql
+    assert params[:3] == ("tenant", ["i1", "i2"], str(salary_bench.SYNTHETIC_YEAR))
+    assert params[3] < since
+    assert Connection.committed and Connection.closed
+    assert all(month.startswith(str(salary_bench.SYNTHETIC_YEAR)) for month in salary_bench.synthetic_months(3))
@@ -9,30 +9,36 @@ import json
 import time
 from typing import Dict, Any
 
+from buffered_log import LOGGER
+from load_metrics import LoadMetrics
+from http_engine import (
+    DEFAULT_MAX_RETRIES, DEFAULT_POOL_SIZE, RequestConnectionError, RequestTimeout, create_session, transfer_stats
+)
+
 # 테스트 설정
 BASE_URL = "http://localhost:3001"
 TIMEOUT = 10
 
 class CRUDTester:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'EduCanvas-API-Tester/1.0'
-        })
+    def __init__(self, engine=None, pool_size: int = DEFAULT_POOL_SIZE, max_retries: int = DEFAULT_MAX_RETRIES):
+        self.engine = engine  # http_engine.AsyncHttpEngine (None이면 동기 requests 경로)
+        self.metrics = LoadMetrics()
+        self.session = create_session(pool_size=pool_size, max_retries=max_retries)
         self.test_data = {}
         
-    def log(self, message: str, level: str = "INFO"):
-        """로그 출력"""
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
+    def log(self, message: str, level: str = "INFO", sampled: bool = False):
+        """로그 출력 (버퍼 로거 큐에 넣고 반환, sampled: 요청 단위 줄 - 초당 줄 수 제한 대상)"""
+        LOGGER.log(message, level, sampled)
         
     def test_api_endpoint(self, method: str, endpoint: str, data: Dict = None, expected_status: int = 200) -> Dict:
         """API 엔드포인트 테스트"""
         url = f"{BASE_URL}{endpoint}"
         
+        started = time.perf_counter()
         try:
-            if method.upper() == "GET":
+            if self.engine is not None:
+                response = self.engine.request(method, url, json=data, headers=dict(self.session.headers), timeout=TIMEOUT)
+            elif method.upper() == "GET":
                 response = self.session.get(url, timeout=TIMEOUT)
             elif method.upper() == "POST":
                 response = self.session.post(url, json=data, timeout=TIMEOUT)
@@ -42,28 +48,56 @@ class CRUDTester:
                 response = self.session.delete(url, timeout=TIMEOUT)
             else:
                 raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
-                
-            self.log(f"{method} {endpoint} -> {response.status_code}")
+        except Exception as e:
+            return self._handle_request_error(method, endpoint, url, e)
+        
+        return self._handle_response(method, endpoint, response, expected_status, time.perf_counter() - started)
+    
+    async def test_api_endpoint_async(self, method: str, endpoint: str, data: Dict = None, expected_status: int = 200) -> Dict:
+        """API 엔드포인트 테스트 (이벤트 루프용, 엔진이 없으면 동기 경로를 스레드에서 실행)"""
+        if self.engine is None:
+            import asyncio
             
-            # 응답 내용 확인
-            try:
-                response_data = response.json()
-                if response.status_code != expected_status:
-                    self.log(f"예상 상태코드({expected_status})와 다름: {response_data.get('error', 'Unknown error')}", "WARN")
-                return response_data
-            except:
-                self.log(f"JSON 응답 파싱 실패: {response.text[:100]}", "ERROR")
-                return {"error": "Invalid JSON response"}
-                
-        except requests.exceptions.Timeout:
+            return await asyncio.to_thread(self.test_api_endpoint, method, endpoint, data, expected_status)
+        
+        url = f"{BASE_URL}{endpoint}"
+        
+        started = time.perf_counter()
+        try:
+            response = await self.engine.request_async(method, url, json=data, headers=dict(self.session.headers), timeout=TIMEOUT)
+        except Exception as e:
+            return self._handle_request_error(method, endpoint, url, e)
+        
+        return self._handle_response(method, endpoint, response, expected_status, time.perf_counter() - started)
+    
+    def _handle_response(self, method: str, endpoint: str, response, expected_status: int, elapsed: float) -> Dict:
+        """응답 상태 기록 및 JSON 파싱"""
+        self.log(f"{method} {endpoint} -> {response.status_code} ({elapsed * 1000:.1f}ms)", sampled=True)
+        wire_bytes, ttfb = transfer_stats(response)
+        self.metrics.record(method, endpoint, response.status_code, elapsed, len(response.content), wire_bytes, ttfb)
+        
+        # 응답 내용 확인
+        try:
+            response_data = response.json()
+            if response.status_code != expected_status:
+                self.log(f"예상 상태코드({expected_status})와 다름: {response_data.get('error', 'Unknown error')}", "WARN")
+            return response_data
+        except:
+            preview = response.content[:100].decode("utf-8", errors="replace")
+            self.log(f"JSON 응답 파싱 실패: {preview}", "ERROR")
+            return {"error": "Invalid JSON response"}
+    
+    def _handle_request_error(self, method: str, endpoint: str, url: str, e: Exception) -> Dict:
+        """응답을 받지 못한 요청 처리"""
+        self.metrics.record(method, endpoint, None)
+        if isinstance(e, (requests.exceptions.Timeout, RequestTimeout)):
             self.log(f"요청 타임아웃: {url}", "ERROR")
             return {"error": "Request timeout"}
-        except requests.exceptions.ConnectionError:
+        if isinstance(e, (requests.exceptions.ConnectionError, RequestConnectionError)):
             self.log(f"연결 실패: {url}", "ERROR")
             return {"error": "Connection failed"}
-        except Exception as e:
-            self.log(f"요청 실패: {str(e)}", "ERROR")
-            return {"error": str(e)}
+        self.log(f"요청 실패: {str(e)}", "ERROR")
+        return {"error": str(e)}
     
     def test_server_health(self):
         """서버 상태 확인"""
@@ -171,6 +205,8 @@ class CRUDTester:
         
         self.log("=" * 50)
         self.log(f"테스트 완료: {passed}/{total} 통과")
+        self.log("엔드포인트별 응답 시간 (ms)")
+        LOGGER.write(self.metrics.format_latency_report())
         
         if passed == total:
             self.log("🎉 모든 CRUD API가 정상적으로 구현되었습니다!")
@@ -179,7 +215,52 @@ class CRUDTester:
         
         return passed == total
 
+def parse_args(argv=None, prog: str = None):
+    import argparse
+    from mock_server import add_mock_arguments
+    
+    parser = argparse.ArgumentParser(prog=prog, description="EduCanvas CRUD API 테스트")
+    parser.add_argument("--engine", choices=["sync", "async"], default="sync",
+                        help="HTTP 엔진 (async는 aiohttp 필요, 없으면 sync로 폴백)")
+    parser.add_argument("--results", default=None,
+                        help="요청별 결과 / 라우트별 요약 저장 경로 (.json 또는 .jsonl)")
+    parser.add_argument("--mock", action="store_true",
+                        help="실제 서버 대신 프로세스 안에서 대역 서버를 띄워 테스트")
+    add_mock_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(args) -> bool:
+    """비인증 CRUD 점검 실행 (api_tester.py smoke에서도 호출)"""
+    global BASE_URL
+    from http_engine import create_engine
+    from mock_server import MockApiServer
+    
+    mock_server = None
+    if args.mock:
+        try:
+            mock_server = MockApiServer.from_args(args)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: 대역 서버를 시작할 수 없습니다: {e}")
+            exit(2)
+        BASE_URL = mock_server.start()
+    engine = create_engine(args.engine)
+    try:
+        tester = CRUDTester(engine=engine)
+        if args.results:
+            from bench_results import ResultsWriter
+            
+            tester.metrics.results_writer = ResultsWriter(args.results, meta={"tool": "test_crud_apis", "base_url": BASE_URL, "mock": args.mock})
+        tester.metrics.start()
+        success = tester.run_all_tests()
+        tester.metrics.stop()
+        if tester.metrics.results_writer is not None:
+            tester.metrics.results_writer.close(tester.metrics, extra={"success": success})
+    finally:
+        if engine is not None:
+            engine.close()
+        if mock_server is not None:
+            mock_server.stop()
+    return success
+
 if __name__ == "__main__":
-    tester = CRUDTester()
-    success = tester.run_all_tests()
-    exit(0 if success else 1)
\ No newline at end of file
+    exit(0 if main(parse_args()) else 1)